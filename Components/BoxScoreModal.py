@@ -0,0 +1,108 @@
+from textual.screen import ModalScreen
+from textual.app import ComposeResult
+from textual.widgets import Button, DataTable, Label
+from textual.containers import Container
+from textual.worker import get_current_worker
+from nba_api_functions.live_scoreboard import FINAL
+from nba_api_functions.rows import BoxScoreRow, GameRow
+from nba_api_functions.search_index import get_search_index
+
+BOX_SCORE_TABLE_COLUMNS = BoxScoreRow._fields[2:]
+
+# Row key of a team's totals, which opens no player
+TEAM_TOTALS_KEY = "team"
+
+
+class BoxScoreModal(ModalScreen):
+    """Modal screen for a game's traditional and advanced box score, one table per team."""
+
+    BINDINGS = [
+        ("r", "refresh", "Refresh"),
+        ("escape", "close", "Close"),
+    ]
+
+    def __init__(self, game: GameRow):
+        super().__init__()
+        self.game = game
+        self.final = game.GameStatusID == FINAL
+
+    def compose(self) -> ComposeResult:
+        title = f"{self.game.VisitorTeam} @ {self.game.HomeTeam}"
+        if self.game.HomeScore is not None:
+            title = (f"{self.game.VisitorTeam} {int(self.game.VisitorScore)} @ "
+                     f"{self.game.HomeTeam} {int(self.game.HomeScore)}")
+        with Container(id="dialog"):
+            yield Label(title, id="dialog-title")
+            yield Label("Loading box score...", id="stats-status")
+            yield Label(self.game.VisitorTeam, classes="game-team")
+            yield DataTable(id="visitor-table", classes="game-team-table", cursor_type="row")
+            yield Label(self.game.HomeTeam, classes="game-team")
+            yield DataTable(id="home-table", classes="game-team-table", cursor_type="row")
+            yield Button("Close", variant="primary", id="close-button")
+
+    def on_mount(self):
+        for table in self.query(".game-team-table").results(DataTable):
+            table.add_columns(*BOX_SCORE_TABLE_COLUMNS)
+        self.load_box_score()
+
+    def load_box_score(self):
+        self.run_worker(self._fetch_box_score, group="box-score", exclusive=True, thread=True)
+
+    def _fetch_box_score(self):
+        """Fetch both box scores in a worker thread."""
+        # Imported here so the endpoints load off the event loop
+        from nba_api_functions.box_score import get_box_score
+        from nba_api_functions.get_games import get_game_rows_for_date
+        worker = get_current_worker()
+        index = get_search_index()
+        home, visitor = index.find_team(self.game.HomeTeam), index.find_team(self.game.VisitorTeam)
+        if home is None or visitor is None:
+            self.app.call_from_thread(self.show_status, "Could not identify both teams.")
+            return
+        if not self.final:
+            # The game row may come from a scoreboard fetched before the game ended, so check
+            # again before a final box score is fetched as live and never cached
+            rows = get_game_rows_for_date(self.game.GameDate, use_cache=False)
+            current = next((row for row in rows if row.GameID == self.game.GameID), None)
+            self.final = current is not None and current.GameStatusID == FINAL
+        box_score = get_box_score(self.game.GameID, final=self.final)
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self.show_box_score, box_score.get(visitor['id'], []), box_score.get(home['id'], []))
+
+    def show_status(self, message: str):
+        if self.is_attached:
+            self.query_one("#stats-status", Label).update(message)
+
+    def show_box_score(self, visitor_rows: list[BoxScoreRow], home_rows: list[BoxScoreRow]):
+        """Fill each team's table, keyed by player ID."""
+        if not self.is_attached:
+            return
+        if not visitor_rows and not home_rows:
+            self.show_status("No box score available yet.")
+            return
+        self.show_status("Final." if self.final else "Live, press r to refresh.")
+        for table_id, rows in (("#visitor-table", visitor_rows), ("#home-table", home_rows)):
+            table = self.query_one(table_id, DataTable)
+            table.clear()
+            for row in rows:
+                key = TEAM_TOTALS_KEY if row.PLAYER_ID is None else str(row.PLAYER_ID)
+                table.add_row(*("" if value is None else value for value in row[2:]), key=key)
+
+    def action_refresh(self) -> None:
+        """Fetch a live box score again. A final one never changes."""
+        if not self.final:
+            self.show_status("Refreshing box score...")
+            self.load_box_score()
+
+    def on_data_table_row_selected(self, event: DataTable.RowSelected):
+        """Open the selected player's stats over the box score."""
+        if event.row_key.value != TEAM_TOTALS_KEY:
+            self.app.call_later(self.app.handle_player_click, event.row_key.value)
+
+    def action_close(self) -> None:
+        self.workers.cancel_all()
+        self.dismiss()
+
+    async def on_button_pressed(self, event: Button.Pressed):
+        if event.button.id == "close-button":
+            self.action_close()
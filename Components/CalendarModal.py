@@ -0,0 +1,158 @@
+import calendar
+from functools import partial
+from datetime import date, timedelta
+from rich.table import Table
+from rich.text import Text
+from textual.screen import ModalScreen
+from textual.app import ComposeResult
+from textual.widgets import Button, DataTable, Label, Static
+from textual.containers import Container, Horizontal
+from textual.worker import get_current_worker
+
+GAME_TABLE_COLUMNS = ("Visitor", "Home", "Score", "Status", "Arena")
+
+
+def add_months(day: date, months: int) -> date:
+    """Returns the same day of the month `months` later, clamped to the month's length."""
+    month_index = day.year * 12 + day.month - 1 + months
+    year, month = divmod(month_index, 12)
+    return date(year, month + 1, min(day.day, calendar.monthrange(year, month + 1)[1]))
+
+
+class CalendarModal(ModalScreen):
+    """Modal screen for browsing the games of any day.
+
+    The shown month is backfilled concurrently when it comes into view, after which
+    moving between its days is answered from memory.
+    """
+
+    BINDINGS = [
+        ("left", "move_days(-1)", "Previous day"),
+        ("right", "move_days(1)", "Next day"),
+        ("up", "move_days(-7)", "Previous week"),
+        ("down", "move_days(7)", "Next week"),
+        ("pageup", "move_months(-1)", "Previous month"),
+        ("pagedown", "move_months(1)", "Next month"),
+        ("t", "today", "Today"),
+        ("escape", "close", "Close"),
+    ]
+
+    def __init__(self, selected: date | None = None):
+        super().__init__()
+        self.selected = selected or date.today()
+        self.games_by_date = {}  # Games of every date loaded while the modal is open
+        self._backfilled_month = None
+
+    def compose(self) -> ComposeResult:
+        with Container(id="dialog"):
+            yield Label("", id="dialog-title")
+            with Horizontal(id="calendar-body"):
+                yield Static(id="calendar-month")
+                games_table = DataTable(id="calendar-games", cursor_type="row")
+                # Arrow keys move between days rather than rows
+                games_table.can_focus = False
+                yield games_table
+            yield Label("", id="calendar-status")
+            yield Button("Close", variant="primary", id="close-button")
+
+    def on_mount(self):
+        self.query_one("#calendar-games", DataTable).add_columns(*GAME_TABLE_COLUMNS)
+        self.show_selected()
+
+    def action_move_days(self, days: int) -> None:
+        self.selected += timedelta(days=days)
+        self.show_selected()
+
+    def action_move_months(self, months: int) -> None:
+        self.selected = add_months(self.selected, months)
+        self.show_selected()
+
+    def action_today(self) -> None:
+        self.selected = date.today()
+        self.show_selected()
+
+    def action_close(self) -> None:
+        self.workers.cancel_all()
+        self.dismiss()
+
+    def show_selected(self) -> None:
+        """Show the selected day, loading its month first if it has not been backfilled."""
+        first = self.selected.replace(day=1)
+        if first != self._backfilled_month:
+            self._backfilled_month = first
+            self.run_worker(
+                partial(self._backfill_month, self.selected), group="calendar-backfill", exclusive=True, thread=True
+            )
+        self.query_one("#dialog-title", Label).update(f"Games on {self.selected:%A, %B %d, %Y}")
+        self._render_month()
+        self._render_games()
+
+    def _backfill_month(self, selected: date):
+        """Fetch the selected day, then every other day of its month concurrently, showing each as it arrives."""
+        # Imported here so the endpoints load off the event loop
+        from nba_api_functions.get_games import get_game_rows_for_date, get_games
+        worker = get_current_worker()
+
+        def on_date_loaded(game_date, games):
+            if not worker.is_cancelled:
+                self.app.call_from_thread(self.date_loaded, game_date, games)
+
+        # The rate limiter spaces a month's requests over several seconds, so don't queue the day being looked at
+        on_date_loaded(selected, get_game_rows_for_date(selected))
+        first = selected.replace(day=1)
+        last = first.replace(day=calendar.monthrange(first.year, first.month)[1])
+        get_games(first, last, on_date_loaded=on_date_loaded, should_cancel=lambda: worker.is_cancelled,
+                  exclude={selected})
+
+    def date_loaded(self, game_date: date, games: list) -> None:
+        """Keep a fetched date and redraw whatever it changes."""
+        if not self.is_attached:
+            return
+        self.games_by_date[game_date] = games
+        self._render_month()
+        if game_date == self.selected:
+            self._render_games()
+
+    def _render_month(self) -> None:
+        """Draw the month grid with each loaded day's number of games."""
+        month_table = Table(title=f"{self.selected:%B %Y}", show_edge=False, pad_edge=False)
+        for weekday in calendar.day_abbr:
+            month_table.add_column(weekday[:2], justify="right")
+        for week in calendar.Calendar().monthdatescalendar(self.selected.year, self.selected.month):
+            cells = []
+            for day in week:
+                games = self.games_by_date.get(day)
+                label = f"{day.day}" if games is None else f"{day.day}·{len(games)}"
+                style = "dim" if day.month != self.selected.month or games is None else ""
+                if day == self.selected:
+                    style = "reverse bold"
+                elif day == date.today():
+                    style += " underline"
+                cells.append(Text(label, style=style.strip()))
+            month_table.add_row(*cells)
+        self.query_one("#calendar-month", Static).update(month_table)
+
+    def _render_games(self) -> None:
+        """Fill the games table for the selected day."""
+        games_table = self.query_one("#calendar-games", DataTable)
+        games_table.clear()
+        games = self.games_by_date.get(self.selected)
+        status = self.query_one("#calendar-status", Label)
+        if not games:
+            status.update("Loading games..." if games is None else "No games on this day.")
+            return
+        status.update("")
+        games_table.add_rows(
+            (
+                game.VisitorTeam,
+                game.HomeTeam,
+                "" if game.HomeScore is None else f"{game.VisitorScore}-{game.HomeScore}",
+                game.GameTime,
+                game.Arena,
+            )
+            for game in games
+        )
+
+    async def on_button_pressed(self, event: Button.Pressed):
+        if event.button.id == "close-button":
+            self.action_close()
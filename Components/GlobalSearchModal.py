@@ -0,0 +1,56 @@
+from textual.screen import ModalScreen
+from textual.app import ComposeResult
+from textual.widgets import Button, Input, Label, OptionList
+from textual.widgets.option_list import Option
+from textual.containers import Container
+from nba_api_functions.search_index import get_search_index, PLAYER
+
+MAX_RESULTS = 20
+
+
+class GlobalSearchModal(ModalScreen):
+    """Modal screen for searching every player and team.
+
+    Dismisses with a (kind, id) tuple for the chosen result, or None when closed.
+    """
+
+    def compose(self) -> ComposeResult:
+        with Container(id="dialog"):
+            yield Label("Search Players and Teams", id="dialog-title")
+            yield Input(placeholder="Type a player or team name...", id="global-search")
+            yield OptionList(id="search-results")
+            yield Button("Close", id="close-button")
+
+    def on_input_changed(self, event: Input.Changed):
+        results_list = self.query_one("#search-results", OptionList)
+        results_list.clear_options()
+        results = get_search_index().search(event.value, limit=MAX_RESULTS)
+        results_list.add_options([
+            Option(self._describe(result), id=f"{result.kind}_{result.id}")
+            for result in results
+        ])
+        if results:
+            results_list.highlighted = 0
+
+    def on_input_submitted(self, event: Input.Submitted):
+        results_list = self.query_one("#search-results", OptionList)
+        if results_list.highlighted is not None:
+            self._choose(results_list.get_option_at_index(results_list.highlighted))
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected):
+        self._choose(event.option)
+
+    def _choose(self, option: Option):
+        kind, entry_id = option.id.split("_")
+        self.dismiss((kind, int(entry_id)))
+
+    @staticmethod
+    def _describe(result) -> str:
+        if result.kind == PLAYER:
+            status = "" if result.entry.get("is_active") else ", inactive"
+            return f"{result.name} (Player{status})"
+        return f"{result.name} (Team, {result.entry['abbreviation']})"
+
+    async def on_button_pressed(self, event: Button.Pressed):
+        if event.button.id == "close-button":
+            self.dismiss(None)
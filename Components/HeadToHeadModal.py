@@ -0,0 +1,61 @@
+from textual.screen import ModalScreen
+from textual.app import ComposeResult
+from textual.widgets import Button, DataTable, Label
+from textual.containers import Container
+from textual.worker import get_current_worker
+
+# Seasons searched for head-to-head games, newest first
+HEAD_TO_HEAD_SEASONS = 3
+
+
+class HeadToHeadModal(ModalScreen):
+    """Modal screen for a player's recent games against one opponent."""
+
+    def __init__(self, player_id: int, player_name: str, team: dict):
+        super().__init__()
+        self.player_id = player_id
+        self.player_name = player_name
+        self.team = team
+
+    def compose(self) -> ComposeResult:
+        with Container(id="dialog"):
+            yield Label(f"{self.player_name} vs {self.team['full_name']}", id="dialog-title")
+            yield Label("Loading head-to-head games...", id="stats-status")
+            yield DataTable(id="stats-table")
+            yield Button("Close", variant="primary", id="close-button")
+
+    def on_mount(self):
+        self.run_worker(self._fetch_games, group="head-to-head", exclusive=True, thread=True)
+
+    def _fetch_games(self):
+        """Query the game log store in a worker thread, syncing missing seasons first."""
+        # Imported here so pandas and the endpoints load off the event loop
+        from nba_api_functions.head_to_head import get_head_to_head_rows, previous_seasons
+        from nba_api_functions.player_profile import get_current_season
+        worker = get_current_worker()
+        games = get_head_to_head_rows(
+            self.player_id,
+            self.team['id'],
+            seasons=previous_seasons(get_current_season(), HEAD_TO_HEAD_SEASONS),
+            n_games=None
+        )
+        if not worker.is_cancelled:
+            self.app.call_from_thread(self.show_games, games)
+
+    def show_games(self, games):
+        """Fill the table with the head-to-head games."""
+        if not self.is_attached:
+            return
+        status = self.query_one("#stats-status", Label)
+        if not games:
+            status.update(f"No games against {self.team['abbreviation']} in the last {HEAD_TO_HEAD_SEASONS} seasons.")
+            return
+        status.display = False
+        table = self.query_one("#stats-table", DataTable)
+        table.add_columns(*games[0]._fields)
+        table.add_rows(games)
+
+    async def on_button_pressed(self, event: Button.Pressed):
+        if event.button.id == "close-button":
+            self.workers.cancel_all()
+            self.dismiss()
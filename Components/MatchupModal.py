@@ -0,0 +1,94 @@
+from textual.screen import ModalScreen
+from textual.app import ComposeResult
+from textual.widgets import Button, DataTable, Label
+from textual.containers import Container, Horizontal
+from textual.worker import get_current_worker
+from Components.BoxScoreModal import BoxScoreModal
+from Components.GameURLModal import GameURLModal
+from nba_api_functions.live_scoreboard import SCHEDULED
+from nba_api_functions.rows import GameRow, MatchupRow
+from nba_api_functions.search_index import get_search_index
+
+MATCHUP_TABLE_COLUMNS = MatchupRow._fields[1:]
+
+
+class MatchupModal(ModalScreen):
+    """Modal screen for one game: both rosters with each player's recent games against the other team."""
+
+    BINDINGS = [("escape", "close", "Close")]
+
+    def __init__(self, game: GameRow, game_url: str | None = None):
+        super().__init__()
+        self.game = game
+        self.game_url = game_url
+
+    def compose(self) -> ComposeResult:
+        with Container(id="dialog"):
+            yield Label(f"{self.game.VisitorTeam} @ {self.game.HomeTeam}", id="dialog-title")
+            with Horizontal(id="stats-header"):
+                yield Label("Loading both rosters...", id="stats-status")
+                if self.game.GameStatusID != SCHEDULED:
+                    yield Button("Box score", id="box-score-button")
+                if self.game_url:
+                    yield Button("Watch", id="watch-button")
+            yield Label(self.game.VisitorTeam, classes="game-team")
+            yield DataTable(id="visitor-table", classes="game-team-table", cursor_type="row")
+            yield Label(self.game.HomeTeam, classes="game-team")
+            yield DataTable(id="home-table", classes="game-team-table", cursor_type="row")
+            yield Button("Close", variant="primary", id="close-button")
+
+    def on_mount(self):
+        for table in self.query(".game-team-table").results(DataTable):
+            table.add_columns(*MATCHUP_TABLE_COLUMNS)
+        self.run_worker(self._fetch_matchup, group="matchup", exclusive=True, thread=True)
+
+    def _fetch_matchup(self):
+        """Fetch both rosters and compute their matchup averages in a worker thread."""
+        # Imported here so numpy and the endpoints load off the event loop
+        from nba_api_functions.matchup import MATCHUP_GAMES, MATCHUP_SEASONS, get_matchup
+        worker = get_current_worker()
+        index = get_search_index()
+        home, visitor = index.find_team(self.game.HomeTeam), index.find_team(self.game.VisitorTeam)
+        if home is None or visitor is None:
+            self.app.call_from_thread(self.show_status, "Could not identify both teams.")
+            return
+        matchup = get_matchup(home['id'], visitor['id'])
+        if not worker.is_cancelled:
+            self.app.call_from_thread(
+                self.show_matchup, matchup.get(visitor['id'], []), matchup.get(home['id'], []),
+                f"Averages over each player's last {MATCHUP_GAMES} games against tonight's opponent "
+                f"in the last {MATCHUP_SEASONS} seasons. Select a player for their stats."
+            )
+
+    def show_status(self, message: str):
+        if self.is_attached:
+            self.query_one("#stats-status", Label).update(message)
+
+    def show_matchup(self, visitor_rows: list[MatchupRow], home_rows: list[MatchupRow], message: str):
+        """Fill each team's table, keyed by player ID."""
+        if not self.is_attached:
+            return
+        if not visitor_rows and not home_rows:
+            self.show_status("Could not load either roster.")
+            return
+        self.show_status(message)
+        for table_id, rows in (("#visitor-table", visitor_rows), ("#home-table", home_rows)):
+            table = self.query_one(table_id, DataTable)
+            for row in rows:
+                table.add_row(*("" if value is None else value for value in row[1:]), key=str(row.PLAYER_ID))
+
+    def on_data_table_row_selected(self, event: DataTable.RowSelected):
+        """Open the selected player's stats over this game view."""
+        self.app.call_later(self.app.handle_player_click, event.row_key.value)
+
+    def action_close(self) -> None:
+        self.workers.cancel_all()
+        self.dismiss()
+
+    async def on_button_pressed(self, event: Button.Pressed):
+        if event.button.id == "box-score-button":
+            await self.app.push_screen(BoxScoreModal(self.game))
+        elif event.button.id == "watch-button":
+            await self.app.push_screen(GameURLModal(self.game_url))
+        elif event.button.id == "close-button":
+            self.action_close()
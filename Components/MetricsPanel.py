@@ -0,0 +1,57 @@
+from rich.table import Table
+from textual.widgets import Static
+from nba_api_functions.api_cache import get_cache
+from nba_api_functions.metrics import CACHE, NETWORK, SHARED, SNAPSHOT, STALE, get_metrics
+
+# Seconds between panel refreshes while it is shown
+METRICS_REFRESH_SECONDS = 1.0
+
+
+def _milliseconds(seconds):
+    return "-" if seconds is None else f"{seconds * 1000:.0f}"
+
+
+class MetricsPanel(Static):
+    """Docked panel showing endpoint latency, error, retry, payload and cache metrics."""
+
+    def on_mount(self) -> None:
+        self.set_interval(METRICS_REFRESH_SECONDS, self.refresh_metrics)
+        self.refresh_metrics()
+
+    def refresh_metrics(self) -> None:
+        """Redraw the metrics table. Skipped while the panel is hidden."""
+        if not self.display:
+            return
+        cache_stats = get_cache().stats()
+        snapshot = get_metrics().snapshot(cache_stats)
+
+        table = Table(
+            title="Endpoint metrics",
+            caption=(
+                f"Cache: {cache_stats['entries']} entries, {cache_stats['bytes'] / 1024:.0f} KB, "
+                f"{cache_stats['evictions']} evictions, {cache_stats['hit_ratio']:.0%} hit ratio"
+            ),
+            expand=True,
+        )
+        for column in ("Endpoint", "Calls", "Cache", "Network", "Shared", "Stale", "Snapshot", "Errors", "Retries", "KB", "p50 ms", "p95 ms", "Hit %"):
+            table.add_column(column, justify="left" if column == "Endpoint" else "right")
+        for endpoint, data in snapshot["endpoints"].items():
+            requests = data["requests"]
+            table.add_row(
+                endpoint,
+                str(sum(requests.values())),
+                str(requests[CACHE]),
+                str(requests[NETWORK]),
+                str(requests[SHARED]),
+                str(requests[STALE]),
+                str(requests[SNAPSHOT]),
+                str(data["errors"]),
+                str(data["retries"]),
+                f"{data['response_bytes'] / 1024:.0f}",
+                _milliseconds(data["latency_p50_seconds"]),
+                _milliseconds(data["latency_p95_seconds"]),
+                f"{data['cache_hit_ratio']:.0%}",
+            )
+        if not snapshot["endpoints"]:
+            table.add_row("No endpoint calls yet", *[""] * 12)
+        self.update(table)
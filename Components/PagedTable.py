@@ -0,0 +1,177 @@
+import sys
+from collections import OrderedDict
+from datetime import date
+from functools import partial
+from rich.segment import Segment
+from textual.geometry import Size
+from textual.scroll_view import ScrollView
+from textual.strip import Strip
+
+# Rows fetched per query
+PAGE_SIZE = 100
+
+# Pages kept in memory, least recently drawn are dropped first
+MAX_CACHED_PAGES = 8
+
+COLUMN_GAP = 2
+
+
+def format_cell(value) -> str:
+    """Formats a cell the way DataTable does, with blanks for missing values."""
+    if value is None:
+        return ""
+    if isinstance(value, float):
+        return f"{value:.2f}"
+    if isinstance(value, date):
+        return value.isoformat()
+    return str(value)
+
+
+class PagedTable(ScrollView, can_focus=True):
+    """A read-only table that draws its rows from a paged data source.
+
+    Only the rows in view are drawn, and the pages they fall on are fetched and
+    formatted in a worker thread as they scroll into view. At most MAX_CACHED_PAGES
+    pages are kept, so memory and the time to open stay the same however many
+    rows the source has.
+
+    The source needs `columns` (names), `row_count` and `fetch_page(offset, limit)`
+    returning that slice of rows as tuples.
+    """
+
+    COMPONENT_CLASSES = {"paged-table--header", "paged-table--placeholder"}
+
+    DEFAULT_CSS = """
+    PagedTable {
+        height: 1fr;
+    }
+    PagedTable > .paged-table--header {
+        text-style: bold;
+        background: $panel;
+    }
+    PagedTable > .paged-table--placeholder {
+        color: $text-muted;
+    }
+    """
+
+    def __init__(self, source=None, page_size: int = PAGE_SIZE, max_cached_pages: int = MAX_CACHED_PAGES,
+                 name: str | None = None, id: str | None = None, classes: str | None = None):
+        super().__init__(name=name, id=id, classes=classes)
+        self.page_size = page_size
+        self.max_cached_pages = max_cached_pages
+        self.source = None
+        self._pages = OrderedDict()  # Formatted rows by page index
+        self._page_bytes = {}  # Approximate size of each cached page
+        self._pending_pages = set()
+        self._widths = []
+        self._numeric_columns = set()
+        if source is not None:
+            self.set_source(source)
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows in the source, whether or not they have been fetched."""
+        return self.source.row_count if self.source is not None else 0
+
+    def retained_bytes(self) -> int:
+        """Returns the approximate size of the cached pages."""
+        return sum(self._page_bytes.values())
+
+    def set_source(self, source, scroll_home: bool = True) -> None:
+        """Show another source's rows, dropping the pages of the previous one.
+
+        Args:
+            source: The new data source.
+            scroll_home: Scroll back to the first row. Pass False when the source is a
+                fresher read of the same rows.
+        """
+        self.source = source
+        self._pages.clear()
+        self._page_bytes.clear()
+        self._pending_pages.clear()
+        self._widths = [len(column) for column in source.columns]
+        self._numeric_columns = set()
+        self._update_virtual_size()
+        if scroll_home:
+            self.scroll_to(0, 0, animate=False)
+        self._request_page(0)
+        self.refresh()
+
+    def _update_virtual_size(self) -> None:
+        width = sum(self._widths) + COLUMN_GAP * max(len(self._widths) - 1, 0)
+        # The header takes the first line
+        self.virtual_size = Size(width, self.row_count + 1)
+
+    def _request_page(self, page: int) -> None:
+        if page in self._pages or page in self._pending_pages or not 0 <= page * self.page_size < self.row_count:
+            return
+        self._pending_pages.add(page)
+        self.run_worker(partial(self._load_page, self.source, page), group="paged-table", thread=True)
+
+    def _load_page(self, source, page: int):
+        """Fetch and format one page off the event loop."""
+        rows = source.fetch_page(page * self.page_size, self.page_size)
+        numeric_columns = {
+            index for row in rows[:1] for index, value in enumerate(row)
+            if isinstance(value, (int, float)) and not isinstance(value, bool)
+        }
+        formatted = [tuple(format_cell(value) for value in row) for row in rows]
+        size = sum(sys.getsizeof(row) + sum(map(sys.getsizeof, row)) for row in formatted)
+        self.app.call_from_thread(self._page_loaded, source, page, formatted, numeric_columns, size)
+
+    def _page_loaded(self, source, page: int, rows: list, numeric_columns: set, size: int) -> None:
+        if source is not self.source:
+            return
+        self._pending_pages.discard(page)
+        self._pages[page] = rows
+        self._page_bytes[page] = size
+        while len(self._pages) > self.max_cached_pages:
+            evicted, _ = self._pages.popitem(last=False)
+            del self._page_bytes[evicted]
+        self._numeric_columns |= numeric_columns
+        # Columns only ever widen, so rows already on screen don't shift back and forth
+        widths = [max(width, *(len(row[index]) for row in rows)) if rows else width
+                  for index, width in enumerate(self._widths)]
+        if widths != self._widths:
+            self._widths = widths
+            self._update_virtual_size()
+        self.refresh()
+
+    def _row(self, index: int):
+        """Returns a formatted row, or None after asking for its page."""
+        page, offset = divmod(index, self.page_size)
+        rows = self._pages.get(page)
+        if rows is None:
+            self._request_page(page)
+            return None
+        self._pages.move_to_end(page)
+        if offset >= self.page_size * 3 // 4:
+            # Read ahead, so scrolling down rarely shows an unfetched row
+            self._request_page(page + 1)
+        return rows[offset] if offset < len(rows) else None
+
+    def _line(self, cells) -> str:
+        return (" " * COLUMN_GAP).join(
+            cell.rjust(width) if index in self._numeric_columns else cell.ljust(width)
+            for index, (cell, width) in enumerate(zip(cells, self._widths))
+        )
+
+    def render_line(self, y: int) -> Strip:
+        scroll_x, scroll_y = self.scroll_offset
+        width = self.size.width
+        base_style = self.rich_style
+        if self.source is None:
+            return Strip.blank(width, base_style)
+        if y == 0:
+            # The header stays put while the rows scroll under it
+            text, style = self._line(self.source.columns), self.get_component_rich_style("paged-table--header")
+        else:
+            index = scroll_y + y - 1
+            if index >= self.row_count:
+                return Strip.blank(width, base_style)
+            cells = self._row(index)
+            if cells is None:
+                text, style = "…", self.get_component_rich_style("paged-table--placeholder")
+            else:
+                text, style = self._line(cells), base_style
+        return Strip([Segment(text, style)]).crop_extend(scroll_x, scroll_x + width, style)
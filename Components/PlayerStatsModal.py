@@ -1,9 +1,14 @@
+import time
+from functools import partial
 from textual.screen import ModalScreen
 from textual.app import App, ComposeResult
-from textual.widgets import Header, Static, Button, DataTable, Label
+from textual.widgets import Header, Static, Button, Label, Input
 from textual.containers import Container, Horizontal, VerticalScroll
-from nba_api_functions.player_profile import get_last_n_games_playergamelog
-from nba_api.stats.static import players
+from textual.worker import get_current_worker
+from nba_api_functions.api_cache import CURRENT_SEASON_GAME_LOG_TTL
+from nba_api_functions.search_index import get_search_index
+from Components.HeadToHeadModal import HeadToHeadModal
+from Components.PagedTable import PagedTable
 
 class PlayerStatsModal(ModalScreen):
     """Modal screen for displaying player statistics."""
@@ -12,9 +17,12 @@ class PlayerStatsModal(ModalScreen):
         super().__init__()
         self.player_id = player_id
         self.player_name = "Unknown Player"
+        self._stats_worker = None
+        self.career = False
+        self._loaded_at = None  # When the shown game log finished loading
         try:
-            # Get player info from NBA API
-            player_info = players.find_player_by_id(int(player_id))
+            # Get player info from the search index
+            player_info = get_search_index().players_by_id.get(int(player_id))
             if player_info:
                 self.player_name = player_info['full_name']
         except Exception as e:
@@ -23,18 +31,92 @@ class PlayerStatsModal(ModalScreen):
     def compose(self) -> ComposeResult:
         with Container(id="dialog"):
             yield Label(f"{self.player_name} - Statistics", id="dialog-title")
-            yield DataTable(id="stats-table")
+            with Horizontal(id="stats-header"):
+                yield Label("Loading game log...", id="stats-status")
+                yield Button("Career", id="scope-button")
+            yield PagedTable(id="stats-table")
+            yield Input(placeholder="Head-to-head vs team...", id="opponent-search")
             yield Button("Close", variant="primary", id="close-button")
             
-    def on_mount(self):
-        stats_df = get_last_n_games_playergamelog(int(self.player_id))
-        if stats_df is not None:
-            table = self.query_one("#stats-table", DataTable)
-            for column in stats_df.columns:
-                table.add_column(str(column))
-            for _, row in stats_df.iterrows():
-                table.add_row(*[str(val) for val in row])
+    def on_screen_resume(self):
+        # A pooled modal opened again keeps what it showed, unless its season may have new games
+        if self._stats_worker is not None and self._stats_worker.is_running:
+            return
+        if self._loaded_at is None or time.monotonic() - self._loaded_at > CURRENT_SEASON_GAME_LOG_TTL:
+            self.load_stats(self.career)
+
+    def retained_bytes(self) -> int:
+        """Returns the approximate size of the game log pages this modal holds."""
+        return self.query_one("#stats-table", PagedTable).retained_bytes() if self.is_mounted else 0
+
+    def load_stats(self, career: bool = False):
+        """Load this season's or the whole career's game log."""
+        self.career = career
+        self._loaded_at = None
+        self.query_one("#scope-button", Button).label = "This season" if career else "Career"
+        # Run on the app so that opening another player cancels this fetch
+        self._stats_worker = self.app.run_worker(
+            partial(self._fetch_stats, career),
+            name=f"player-stats-{self.player_id}",
+            group="player-stats",
+            exclusive=True,
+            thread=True,
+        )
+
+    def _fetch_stats(self, career: bool):
+        """Store the game log in a worker thread and hand a paged view of it back to the UI."""
+        # Imported here so the endpoints load off the event loop
+        from nba_api_functions.head_to_head import sync_player_seasons
+        from nba_api_functions.league_game_logs import StoredGameLogPages, sync_league_game_logs
+        from nba_api_functions.player_profile import get_career_seasons, get_current_season
+        worker = get_current_worker()
+        player_id = int(self.player_id)
+        if career:
+            seasons = get_career_seasons(player_id)
+            # Show what is stored already while the rest of the career is fetched
+            self.app.call_from_thread(self.show_stats, StoredGameLogPages(player_id, seasons), career, True)
+            if worker.is_cancelled:
+                return
+            sync_player_seasons(player_id, seasons)
+        else:
+            seasons = [get_current_season()]
+            # The player's own games are the fallback when the league-wide sync fails
+            if not sync_league_game_logs(seasons[0]) and not worker.is_cancelled:
+                sync_player_seasons(player_id, seasons)
+        if worker.is_cancelled:
+            return
+        self.app.call_from_thread(self.show_stats, StoredGameLogPages(player_id, seasons), career)
+
+    def show_stats(self, game_log_pages, career: bool, loading: bool = False):
+        """Show the stored game log in the paged stats table."""
+        if not self.is_attached or career != self.career:
+            return
+        status = self.query_one("#stats-status", Label)
+        scope = "Career" if career else "This season"
+        if not loading:
+            self._loaded_at = time.monotonic()
+        if not game_log_pages.row_count and not loading:
+            status.update(f"{scope}: no game log available.")
+            return
+        status.update(f"{scope}: {game_log_pages.row_count} games{', loading more...' if loading else ''}")
+        # Only the rows in view are read and formatted, however long the career.
+        # A career that finished loading keeps the place scrolled to meanwhile.
+        self.query_one("#stats-table", PagedTable).set_source(game_log_pages, scroll_home=loading or not career)
                 
+    def on_input_submitted(self, event: Input.Submitted):
+        """Open this player's games against the team typed in the opponent box."""
+        if event.input.id != "opponent-search":
+            return
+        team = get_search_index().find_team(event.value)
+        if team is None:
+            self.notify(f"No team matches '{event.value}'.", severity="warning")
+            return
+        self.app.push_screen(HeadToHeadModal(int(self.player_id), self.player_name, team))
+
     async def on_button_pressed(self, event: Button.Pressed):
-        if event.button.id == "close-button":
-            self.dismiss()
\ No newline at end of file
+        if event.button.id == "scope-button":
+            self.load_stats(not self.career)
+        elif event.button.id == "close-button":
+            if self._stats_worker is not None:
+                self._stats_worker.cancel()
+            self.dismiss()
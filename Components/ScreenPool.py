@@ -0,0 +1,72 @@
+from collections import OrderedDict
+from textual.app import App
+from textual.screen import Screen
+
+# Screens kept after they are closed
+DEFAULT_MAX_SCREENS = 10
+
+# Upper bound for the data the kept screens hold, as reported by their retained_bytes()
+DEFAULT_MAX_BYTES = 8 * 1024 * 1024
+
+
+class ScreenPool:
+    """
+    Least recently used pool of installed screens.
+
+    A pooled screen is installed on the app, so closing it keeps it mounted as it was
+    left and opening it again needs no compose or fetch. Once the pool holds more than
+    max_screens screens, or their retained_bytes() add up to more than max_bytes, the
+    least recently opened screens that are not on the screen stack are uninstalled
+    and removed.
+    """
+
+    def __init__(self, app: App, prefix: str, max_screens: int = DEFAULT_MAX_SCREENS,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        self.app = app
+        self.prefix = prefix
+        self.max_screens = max_screens
+        self.max_bytes = max_bytes
+        self.evictions = 0
+        self._screens = OrderedDict()  # Screen by installed name, least recently opened first
+
+    def __len__(self) -> int:
+        return len(self._screens)
+
+    def get(self, key, factory) -> Screen:
+        """
+        Returns the pooled screen for key, creating and installing it if needed.
+
+        Args:
+            key: Identifies the screen, e.g. a player ID.
+            factory (callable): Builds the screen when it is not pooled.
+
+        Returns:
+            Screen: The screen, marked as the most recently opened.
+        """
+        name = f"{self.prefix}-{key}"
+        screen = self._screens.get(name)
+        if screen is None:
+            screen = factory()
+            self.app.install_screen(screen, name)
+            self._screens[name] = screen
+        self._screens.move_to_end(name)
+        self.trim()
+        return screen
+
+    def retained_bytes(self) -> int:
+        """Returns the bytes of data held by the pooled screens."""
+        return sum(getattr(screen, "retained_bytes", lambda: 0)() for screen in self._screens.values())
+
+    def trim(self) -> None:
+        """Remove the least recently opened screens until the pool is within its limits."""
+        # The most recently opened screen is the one about to be shown
+        for name, screen in list(self._screens.items())[:-1]:
+            if len(self._screens) <= self.max_screens and self.retained_bytes() <= self.max_bytes:
+                return
+            if screen in self.app.screen_stack:
+                continue
+            self.app.uninstall_screen(name)
+            del self._screens[name]
+            self.evictions += 1
+            if screen.is_attached:
+                screen.remove()
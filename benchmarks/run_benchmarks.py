@@ -0,0 +1,247 @@
+"""
+Offline benchmarks for the NBA TUI.
+
+Generates synthetic stats.nba.com responses for today (see synthetic_fixtures.py),
+serves them from a local stub server and drives the app headlessly through Textual's
+pilot. Each pass runs in a fresh
+interpreter in a scratch directory, so it starts from empty caches and stores and
+none of the process-wide singletons (response cache, game log store, search index,
+finished scoreboards, prefetcher) carry over from an earlier pass.
+
+Usage:
+    python benchmarks/run_benchmarks.py                     # compare against baselines.json
+    python benchmarks/run_benchmarks.py --update-baselines  # record new baselines
+"""
+import argparse
+import asyncio
+import json
+import logging
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from benchmarks.stub_server import StubStatsServer
+from benchmarks.synthetic_fixtures import BENCHMARK_PLAYER_ID, BENCHMARK_TEAM_ID, write_fixtures
+
+BASELINES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baselines.json")
+
+# A metric fails when its median is this much slower than the baseline
+DEFAULT_TOLERANCE = 0.5
+
+TEAM_BUTTON_ID = f"#team_{BENCHMARK_TEAM_ID}"
+PLAYER_ID = str(BENCHMARK_PLAYER_ID)
+SEARCH_QUERY = "lebron"
+TERMINAL_SIZE = (160, 50)
+
+
+async def wait_for(pilot, predicate, timeout=10.0):
+    """Pauses the pilot until predicate() is true, raising TimeoutError after timeout seconds."""
+    deadline = time.perf_counter() + timeout
+    while not predicate():
+        if time.perf_counter() > deadline:
+            raise TimeoutError("Timed out waiting for the app")
+        await pilot.pause(0.001)
+
+
+def measure_startup_imports():
+    """Returns the milliseconds a fresh interpreter spends importing the app."""
+    code = "import time; started = time.perf_counter(); import menu; print((time.perf_counter() - started) * 1000)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+async def run_scenario():
+    """
+    Runs one pass over every scenario.
+
+    Returns:
+        dict: Milliseconds per metric.
+    """
+    from menu import nba_tui
+    from Components.BoxScoreModal import BoxScoreModal
+    from Components.PlayerStatsModal import PlayerStatsModal
+    from nba_api_functions.live_scoreboard import FINAL
+
+    results = {}
+    app = nba_tui()
+    async with app.run_test(size=TERMINAL_SIZE) as pilot:
+        started = time.perf_counter()
+        await wait_for(pilot, lambda: app.first_frame_ms is not None)
+        results["startup_to_first_frame_ms"] = app.first_frame_ms
+        await wait_for(pilot, lambda: len(app.game_buttons) > 0 and len(app.all_team_buttons) > 0)
+        results["startup_to_games_loaded_ms"] = app.first_frame_ms + (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        app.query_one(TEAM_BUTTON_ID).press()
+        await wait_for(pilot, lambda: app.roster_table.row_count > 0)
+        results["team_click_to_roster_ms"] = (time.perf_counter() - started) * 1000
+        await wait_for(pilot, lambda: len(app._roster_form) > 0)
+        results["team_click_to_form_ms"] = (time.perf_counter() - started) * 1000
+
+        started = time.perf_counter()
+        await app.handle_player_click(PLAYER_ID)
+        await wait_for(
+            pilot,
+            lambda: isinstance(app.screen, PlayerStatsModal)
+            and app.screen.query_one("#stats-table").row_count > 0
+        )
+        results["player_click_to_modal_ms"] = (time.perf_counter() - started) * 1000
+        app.pop_screen()
+        await pilot.pause()
+
+        started = time.perf_counter()
+        final_game = next(game for game in app._last_games if game.GameStatusID == FINAL)
+        await app.push_screen(BoxScoreModal(final_game))
+        await wait_for(
+            pilot,
+            lambda: isinstance(app.screen, BoxScoreModal) and app.screen.query_one("#home-table").row_count > 0
+        )
+        results["game_to_box_score_ms"] = (time.perf_counter() - started) * 1000
+        app.pop_screen()
+        await pilot.pause()
+
+        # Filter cost per keystroke, excluding the input debounce
+        keystroke_times = []
+        for length in range(1, len(SEARCH_QUERY) + 1):
+            started = time.perf_counter()
+            app._filter_and_display_roster(SEARCH_QUERY[:length])
+            keystroke_times.append((time.perf_counter() - started) * 1000)
+        app._filter_and_display_roster("")
+        results["search_keystroke_ms"] = max(keystroke_times)
+    return results
+
+
+def run_pass(latency, fixtures_dir):
+    """
+    Runs one pass in this process against a stub server, from the current directory.
+
+    Returns:
+        dict: Milliseconds per metric.
+    """
+    with StubStatsServer(fixtures_dir, latency=latency):
+        return asyncio.run(run_scenario())
+
+
+def run_pass_in_subprocess(latency, fixtures_dir):
+    """
+    Runs one pass in a fresh interpreter with an empty scratch directory as its working directory.
+
+    Returns:
+        dict: Milliseconds per metric.
+    """
+    scratch_dir = tempfile.mkdtemp(prefix="nba_tui_bench_")
+    try:
+        result = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--single-pass", "--latency", str(latency),
+             "--fixtures-dir", fixtures_dir],
+            cwd=scratch_dir, capture_output=True, text=True
+        )
+    finally:
+        shutil.rmtree(scratch_dir, ignore_errors=True)
+    if result.returncode != 0:
+        raise RuntimeError(f"Benchmark pass failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def run_benchmarks(runs, latency):
+    """
+    Runs every scenario `runs` times against the stub server, each pass from a cold start.
+
+    The synthetic responses are generated once, for today's date and season, so the
+    requests the app sends for "today" find their fixtures.
+
+    Args:
+        runs (int): Number of passes.
+        latency (float): Seconds of simulated network latency per request.
+
+    Returns:
+        dict: Median milliseconds per metric.
+    """
+    from nba_api_functions.player_profile import get_current_season
+    fixtures_dir = tempfile.mkdtemp(prefix="nba_tui_fixtures_")
+    samples = {}
+    try:
+        write_fixtures(fixtures_dir, date.today(), get_current_season())
+        for _ in range(runs):
+            results = run_pass_in_subprocess(latency, fixtures_dir)
+            results["startup_imports_ms"] = measure_startup_imports()
+            for metric, value in results.items():
+                samples.setdefault(metric, []).append(value)
+    finally:
+        shutil.rmtree(fixtures_dir, ignore_errors=True)
+    return {metric: statistics.median(values) for metric, values in samples.items()}
+
+
+def compare_to_baselines(medians, baselines, tolerance):
+    """
+    Prints each metric next to its baseline.
+
+    Returns:
+        list: Names of the metrics that regressed beyond the tolerance.
+    """
+    regressions = []
+    print(f"{'metric':32} {'median ms':>10} {'baseline':>10} {'change':>8}")
+    for metric, median in sorted(medians.items()):
+        baseline = baselines.get(metric)
+        if baseline is None:
+            print(f"{metric:32} {median:10.1f} {'-':>10} {'new':>8}")
+            continue
+        change = (median - baseline) / baseline if baseline else 0.0
+        flag = ""
+        if median > baseline * (1 + tolerance):
+            regressions.append(metric)
+            flag = "  REGRESSION"
+        print(f"{metric:32} {median:10.1f} {baseline:10.1f} {change:+8.0%}{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the offline NBA TUI benchmarks.")
+    parser.add_argument("--runs", type=int, default=5, help="Number of passes per metric (default: 5)")
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated network latency in seconds")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed slowdown over the baseline before failing (default: 0.5 = 50%%)")
+    parser.add_argument("--update-baselines", action="store_true", help="Store the medians as the new baselines")
+    # Used by run_pass_in_subprocess: run one pass here and print its results as JSON
+    parser.add_argument("--single-pass", action="store_true", help=argparse.SUPPRESS)
+    parser.add_argument("--fixtures-dir", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    if args.single_pass:
+        print(json.dumps(run_pass(args.latency, args.fixtures_dir)))
+        return 0
+    medians = run_benchmarks(args.runs, args.latency)
+    logging.disable(logging.NOTSET)
+
+    if args.update_baselines:
+        with open(BASELINES_PATH, "w") as baselines_file:
+            json.dump({metric: round(value, 2) for metric, value in sorted(medians.items())}, baselines_file, indent=4)
+            baselines_file.write("\n")
+        print(f"Baselines written to {BASELINES_PATH}")
+        compare_to_baselines(medians, {}, args.tolerance)
+        return 0
+
+    baselines = {}
+    if os.path.exists(BASELINES_PATH):
+        with open(BASELINES_PATH) as baselines_file:
+            baselines = json.load(baselines_file)
+
+    regressions = compare_to_baselines(medians, baselines, args.tolerance)
+    if regressions:
+        print(f"\nFAILED: {len(regressions)} metric(s) regressed beyond {args.tolerance:.0%}: {', '.join(regressions)}")
+        return 1
+    print("\nAll metrics within tolerance.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+import json
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qsl, urlparse
+from nba_api.stats.library.http import NBAStatsHTTP
+from benchmarks.synthetic_fixtures import fixture_path
+
+
+class StubStatsServer:
+    """
+    Local HTTP server that answers stats.nba.com requests from a fixtures directory.
+
+    A request to /stats/<endpoint>?<params> is answered with the fixture written for that
+    endpoint and those parameters (see synthetic_fixtures.fixture_path), after an optional
+    fixed latency, or with a 404 when there is none. Every request is counted per endpoint.
+    """
+
+    def __init__(self, fixtures_dir, latency=0.0):
+        self.fixtures_dir = fixtures_dir
+        self.latency = latency
+        self.requests = {}
+        self._fixtures = {}
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._make_handler())
+        self._thread = None
+        self._original_base_url = NBAStatsHTTP.base_url
+
+    @property
+    def base_url(self):
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/stats/{{endpoint}}"
+
+    def _fixture(self, endpoint, parameters):
+        path = fixture_path(self.fixtures_dir, endpoint, parameters)
+        if path not in self._fixtures:
+            if not os.path.exists(path):
+                return None
+            with open(path) as fixture_file:
+                self._fixtures[path] = fixture_file.read().encode("utf-8")
+        return self._fixtures[path]
+
+    def _make_handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                endpoint = url.path.rstrip("/").split("/")[-1].lower()
+                with server._lock:
+                    server.requests[endpoint] = server.requests.get(endpoint, 0) + 1
+                if server.latency:
+                    time.sleep(server.latency)
+                body = server._fixture(endpoint, dict(parse_qsl(url.query)))
+                if body is None:
+                    body = json.dumps({"Message": f"No fixture for {self.path}"}).encode("utf-8")
+                    self.send_response(404)
+                else:
+                    self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+    def start(self):
+        """Starts serving and points nba_api at the stub."""
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        NBAStatsHTTP.base_url = self.base_url
+        return self
+
+    def stop(self):
+        """Stops serving and restores the real stats.nba.com URL."""
+        NBAStatsHTTP.base_url = self._original_base_url
+        self._server.shutdown()
+        self._server.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
@@ -0,0 +1,595 @@
+"""
+Synthetic stats.nba.com responses for the offline benchmarks.
+
+Nothing here is recorded from stats.nba.com. A seeded generator builds a league (every
+team's roster drawn from nba_api's static list of active players), a schedule of games
+before the benchmark date with a box line per player, and tonight's scoreboard with
+final, live and upcoming games. Each response the app asks for is then written in the
+shape stats.nba.com returns it, with the headers nba_api expects for the endpoint.
+
+Fixtures are keyed by endpoint and request parameters (see fixture_path), so the stub
+server only ever answers a request with the response for exactly what it asked.
+"""
+import hashlib
+import json
+import os
+import random
+from datetime import date, timedelta
+from urllib.parse import urlencode
+from nba_api.stats.endpoints import (
+    BoxScoreAdvancedV3, BoxScoreTraditionalV3, CommonPlayerInfo, CommonTeamRoster, PlayerGameLog,
+    PlayerGameLogs, ScoreboardV2
+)
+from nba_api.stats.static import players, teams
+
+SEED = 2544
+
+# Days of games before the benchmark date, per season
+SCHEDULE_DAYS = 40
+GAMES_PER_DAY = 7
+ROSTER_SIZE = 15
+ROTATION_SIZE = 10
+
+# Tonight's first game is the benchmark team at home to the benchmark opponent, already final
+BENCHMARK_TEAM_ID = 1610612747  # Los Angeles Lakers
+BENCHMARK_OPPONENT_ID = 1610612744  # Golden State Warriors
+BENCHMARK_PLAYER_ID = 2544  # LeBron James
+
+# GAME_STATUS_ID of tonight's games, in scoreboard order
+TONIGHT_STATUSES = (3, 3, 2, 2, 1, 1)
+UPCOMING_TIMES = ("7:30 pm ET", "10:00 pm ET")
+
+ARENAS = {
+    'ATL': "State Farm Arena", 'BOS': "TD Garden", 'BKN': "Barclays Center", 'CHA': "Spectrum Center",
+    'CHI': "United Center", 'CLE': "Rocket Mortgage FieldHouse", 'DAL': "American Airlines Center",
+    'DEN': "Ball Arena", 'DET': "Little Caesars Arena", 'GSW': "Chase Center", 'HOU': "Toyota Center",
+    'IND': "Gainbridge Fieldhouse", 'LAC': "Intuit Dome", 'LAL': "Crypto.com Arena", 'MEM': "FedExForum",
+    'MIA': "Kaseya Center", 'MIL': "Fiserv Forum", 'MIN': "Target Center", 'NOP': "Smoothie King Center",
+    'NYK': "Madison Square Garden", 'OKC': "Paycom Center", 'ORL': "Kia Center", 'PHI': "Wells Fargo Center",
+    'PHX': "Footprint Center", 'POR': "Moda Center", 'SAC': "Golden 1 Center", 'SAS': "Frost Bank Center",
+    'TOR': "Scotiabank Arena", 'UTA': "Delta Center", 'WAS': "Capital One Arena",
+}
+
+SCHOOLS = (
+    "Kentucky", "Duke", "Kansas", "North Carolina", "UCLA", "Arizona", "Gonzaga", "Villanova",
+    "Michigan State", "Texas", "Baylor", "Florida", "Connecticut", "Virginia", "Indiana", "Alabama",
+    "Real Madrid", "Mega Basket", "Adelaide 36ers", "Ratiopharm Ulm", "Partizan", "Overtime Elite",
+)
+
+# (position, height range in inches, weight range in pounds)
+POSITIONS = (
+    ("G", (73, 78), (175, 205)),
+    ("G-F", (77, 80), (200, 220)),
+    ("F", (79, 82), (215, 240)),
+    ("F-C", (81, 84), (230, 255)),
+    ("C", (83, 86), (240, 270)),
+)
+
+TRADITIONAL_STAT_NAMES = {
+    'fieldGoalsMade': 'FGM', 'fieldGoalsAttempted': 'FGA', 'threePointersMade': 'FG3M',
+    'threePointersAttempted': 'FG3A', 'freeThrowsMade': 'FTM', 'freeThrowsAttempted': 'FTA',
+    'reboundsOffensive': 'OREB', 'reboundsDefensive': 'DREB', 'reboundsTotal': 'REB', 'assists': 'AST',
+    'steals': 'STL', 'blocks': 'BLK', 'turnovers': 'TOV', 'foulsPersonal': 'PF', 'points': 'PTS',
+}
+
+COUNTING_STATS = ('FGM', 'FGA', 'FG3M', 'FG3A', 'FTM', 'FTA', 'OREB', 'DREB', 'REB', 'AST', 'TOV',
+                  'STL', 'BLK', 'BLKA', 'PF', 'PFD', 'PTS')
+
+
+def fixture_key(endpoint, parameters):
+    """Returns the lookup key of a request: the endpoint and its non-empty parameters, sorted."""
+    query = urlencode(sorted((name, str(value)) for name, value in parameters.items() if value not in (None, "")))
+    return f"{endpoint.lower()}?{query}"
+
+
+def fixture_path(fixtures_dir, endpoint, parameters):
+    """Returns the file holding the response to a request."""
+    digest = hashlib.sha1(fixture_key(endpoint, parameters).encode("utf-8")).hexdigest()[:16]
+    return os.path.join(fixtures_dir, f"{endpoint.lower()}-{digest}.json")
+
+
+def season_start_year(season):
+    return int(season[:4])
+
+
+def previous_season(season):
+    start = season_start_year(season) - 1
+    return f"{start}-{str(start + 1)[-2:]}"
+
+
+def _percentage(made, attempted):
+    return round(made / attempted, 3) if attempted else 0.0
+
+
+def _made(rng, attempts, probability):
+    return sum(rng.random() < probability for _ in range(attempts))
+
+
+def _clock(minutes):
+    """Formats minutes as the box score's "MM:SS"."""
+    seconds = round(minutes * 60)
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+
+class SyntheticLeague:
+    """
+    A seeded league: rosters, a schedule of played games and tonight's scoreboard.
+
+    The same seed, benchmark date and season always give the same responses.
+    """
+
+    def __init__(self, game_date, season, seed=SEED, schedule_days=SCHEDULE_DAYS):
+        self.game_date = game_date
+        self.season = season
+        self.rng = random.Random(seed)
+        self.teams = {team['id']: team for team in teams.get_teams()}
+        self.rosters = self._build_rosters()
+        self.players = {player['id']: player for roster in self.rosters.values() for player in roster}
+        # Played games by season, oldest first, and tonight's games
+        self.games = {}
+        self.games[previous_season(season)] = self._play_schedule(
+            previous_season(season), game_date - timedelta(days=365), schedule_days
+        )
+        self.games[season] = self._play_schedule(season, game_date, schedule_days)
+        self.tonight = self._play_tonight()
+
+    def _build_rosters(self):
+        active = sorted(players.get_active_players(), key=lambda player: player['id'])
+        self.rng.shuffle(active)
+        benchmark_player = next(player for player in active if player['id'] == BENCHMARK_PLAYER_ID)
+        active.remove(benchmark_player)
+        rosters = {}
+        for index, team_id in enumerate(sorted(self.teams)):
+            picked = active[index * ROSTER_SIZE:(index + 1) * ROSTER_SIZE]
+            if team_id == BENCHMARK_TEAM_ID:
+                picked = [benchmark_player] + picked[1:]
+            numbers = self.rng.sample(range(0, 100), len(picked))
+            roster = [self._build_player(static_player, number) for static_player, number in zip(picked, numbers)]
+            # Starters and the rotation play the most minutes
+            rosters[team_id] = sorted(roster, key=lambda player: -player['minutes'])
+        return rosters
+
+    def _build_player(self, static_player, number):
+        rng = self.rng
+        position, heights, weights = rng.choice(POSITIONS)
+        height = rng.randint(*heights)
+        birth_date = date(1990, 1, 1) + timedelta(days=rng.randint(0, 15 * 365))
+        age = (self.game_date - birth_date).days // 365
+        experience = rng.randint(0, max(0, age - 19))
+        return {
+            'id': static_player['id'],
+            'first_name': static_player['first_name'],
+            'last_name': static_player['last_name'],
+            'full_name': static_player['full_name'],
+            'position': position,
+            'height': f"{height // 12}-{height % 12}",
+            'weight': str(rng.randint(*weights)),
+            'birth_date': birth_date,
+            'age': float(age),
+            'experience': "R" if experience == 0 else str(experience),
+            'school': rng.choice(SCHOOLS),
+            'number': str(number),
+            'minutes': rng.uniform(8, 36),
+            'usage': rng.uniform(0.6, 1.5),
+            'three_rate': rng.uniform(0.1, 0.5),
+            'rebounding': rng.uniform(0.5, 1.8),
+            'playmaking': rng.uniform(0.4, 2.0),
+        }
+
+    def _game_id(self, season, sequence):
+        return f"002{season_start_year(season) % 100:02d}{sequence:05d}"
+
+    def _play_schedule(self, season, end_date, days):
+        games = []
+        team_ids = sorted(self.teams)
+        for offset in range(days, 0, -1):
+            game_date = end_date - timedelta(days=offset)
+            self.rng.shuffle(team_ids)
+            for index in range(GAMES_PER_DAY):
+                home, visitor = team_ids[2 * index], team_ids[2 * index + 1]
+                game_id = self._game_id(season, len(games) + 1)
+                games.append(self._play_game(game_id, game_date, home, visitor))
+        return games
+
+    def _play_tonight(self):
+        others = [team_id for team_id in sorted(self.teams) if team_id not in (BENCHMARK_TEAM_ID, BENCHMARK_OPPONENT_ID)]
+        self.rng.shuffle(others)
+        pairs = [(BENCHMARK_TEAM_ID, BENCHMARK_OPPONENT_ID)]
+        pairs += [(others[2 * index], others[2 * index + 1]) for index in range(len(TONIGHT_STATUSES) - 1)]
+        played = len(self.games[self.season])
+        tonight = []
+        for index, ((home, visitor), status) in enumerate(zip(pairs, TONIGHT_STATUSES)):
+            game_id = self._game_id(self.season, played + index + 1)
+            if status == 1:
+                tonight.append({'game_id': game_id, 'date': self.game_date, 'home': home, 'visitor': visitor,
+                                'status': status, 'period': 0, 'lines': None})
+                continue
+            period = 4 if status == 3 else self.rng.randint(1, 4)
+            share = 1.0 if status == 3 else (period - self.rng.random()) / 4
+            game = self._play_game(game_id, self.game_date, home, visitor, share)
+            game.update(status=status, period=period)
+            if status == 3:
+                self.games[self.season].append(game)
+            tonight.append(game)
+        return tonight
+
+    def _play_game(self, game_id, game_date, home, visitor, share=1.0):
+        """Plays a game, or its first `share` of it, and returns every player's box line."""
+        lines = {team_id: self._team_lines(team_id, share) for team_id in (home, visitor)}
+        points = {team_id: sum(line['PTS'] for line in team_lines) for team_id, team_lines in lines.items()}
+        if share == 1.0 and points[home] == points[visitor]:
+            # Settle a tie at the line instead of playing overtime
+            lines[home][0]['FTA'] += 1
+            lines[home][0]['FTM'] += 1
+            lines[home][0]['PTS'] += 1
+            points[home] += 1
+        for team_id, opponent_id in ((home, visitor), (visitor, home)):
+            margin = points[team_id] - points[opponent_id]
+            for line in lines[team_id]:
+                line['PLUS_MINUS'] = round(margin * line['MIN'] / (48 * share)) + self.rng.randint(-5, 5)
+        game = {'game_id': game_id, 'date': game_date, 'home': home, 'visitor': visitor, 'lines': lines,
+                'points': points, 'status': 3, 'period': 4}
+        return game
+
+    def _team_lines(self, team_id, share):
+        rng = self.rng
+        rotation = self.rosters[team_id][:ROTATION_SIZE]
+        minutes = [player['minutes'] * rng.uniform(0.8, 1.2) for player in rotation]
+        scale = 240 * share / sum(minutes)
+        lines = []
+        for player, played in zip(rotation, minutes):
+            played = min(48.0 * share, played * scale)
+            fga = round(played * 0.38 * player['usage'] * rng.uniform(0.7, 1.3))
+            fg3a = round(fga * player['three_rate'])
+            fg3m = _made(rng, fg3a, 0.36)
+            fgm = fg3m + _made(rng, fga - fg3a, 0.52)
+            fta = round(played * 0.1 * player['usage'] * rng.uniform(0.3, 1.7))
+            ftm = _made(rng, fta, 0.78)
+            oreb = _made(rng, round(played * 0.06 * player['rebounding']), 0.5)
+            dreb = _made(rng, round(played * 0.2 * player['rebounding']), 0.7)
+            lines.append({
+                'PLAYER_ID': player['id'],
+                'MIN': round(played, 2),
+                'FGM': fgm, 'FGA': fga, 'FG3M': fg3m, 'FG3A': fg3a, 'FTM': ftm, 'FTA': fta,
+                'OREB': oreb, 'DREB': dreb, 'REB': oreb + dreb,
+                'AST': _made(rng, round(played * 0.2 * player['playmaking']), 0.5),
+                'TOV': _made(rng, round(played * 0.1 * player['usage']), 0.45),
+                'STL': _made(rng, round(played * 0.05), 0.5),
+                'BLK': _made(rng, round(played * 0.04 * player['rebounding']), 0.5),
+                'BLKA': _made(rng, fga - fg3a, 0.06),
+                'PF': min(6, _made(rng, round(played * 0.1), 0.5)),
+                'PFD': _made(rng, round(played * 0.1 * player['usage']), 0.5),
+                'PTS': 2 * fgm + fg3m + ftm,
+            })
+        return lines
+
+    def _record(self, season, team_id, before):
+        """Returns a team's "W-L" from its games before a date."""
+        wins = losses = 0
+        for game in self.games[season]:
+            if game['date'] >= before or team_id not in (game['home'], game['visitor']):
+                continue
+            won = game['points'][team_id] > game['points'][game['visitor'] if team_id == game['home'] else game['home']]
+            wins, losses = (wins + 1, losses) if won else (wins, losses + 1)
+        return f"{wins}-{losses}"
+
+    def game_log_rows(self, season):
+        """Returns the season's PlayerGameLogs rows, newest game first."""
+        headers = PlayerGameLogs.expected_data['PlayerGameLogs']
+        rows = []
+        for game in reversed(self.games[season]):
+            for team_id, opponent_id in ((game['home'], game['visitor']), (game['visitor'], game['home'])):
+                team, opponent = self.teams[team_id], self.teams[opponent_id]
+                separator = "vs." if team_id == game['home'] else "@"
+                won = game['points'][team_id] > game['points'][opponent_id]
+                for line in game['lines'][team_id]:
+                    player = self.players[line['PLAYER_ID']]
+                    doubles = sum(line[stat] >= 10 for stat in ('PTS', 'REB', 'AST', 'STL', 'BLK'))
+                    values = dict(line)
+                    values.update({
+                        'SEASON_YEAR': season,
+                        'PLAYER_NAME': player['full_name'],
+                        'TEAM_ID': team_id,
+                        'TEAM_ABBREVIATION': team['abbreviation'],
+                        'TEAM_NAME': team['full_name'],
+                        'GAME_ID': game['game_id'],
+                        'GAME_DATE': f"{game['date'].isoformat()}T00:00:00",
+                        'MATCHUP': f"{team['abbreviation']} {separator} {opponent['abbreviation']}",
+                        'WL': "W" if won else "L",
+                        'FG_PCT': _percentage(line['FGM'], line['FGA']),
+                        'FG3_PCT': _percentage(line['FG3M'], line['FG3A']),
+                        'FT_PCT': _percentage(line['FTM'], line['FTA']),
+                        'NBA_FANTASY_PTS': round(line['PTS'] + 1.2 * line['REB'] + 1.5 * line['AST']
+                                                 + 3 * line['STL'] + 3 * line['BLK'] - line['TOV'], 1),
+                        'DD2': int(doubles >= 2),
+                        'TD3': int(doubles >= 3),
+                    })
+                    # The *_RANK columns rank a row within the response; the app never reads them
+                    rows.append([values.get(header) for header in headers])
+        return headers, rows
+
+    def scoreboard(self, game_date):
+        """Returns the GameHeader and LineScore rows of one date."""
+        season = self.season if game_date > self.game_date - timedelta(days=365) else previous_season(self.season)
+        if game_date == self.game_date:
+            games = self.tonight
+        else:
+            games = [game for game in self.games.get(season, []) if game['date'] == game_date]
+        game_date_est = f"{game_date.isoformat()}T00:00:00"
+        headers, lines = [], []
+        for sequence, game in enumerate(games, start=1):
+            home, visitor = self.teams[game['home']], self.teams[game['visitor']]
+            status = game['status']
+            if status == 3:
+                status_text = "Final"
+            elif status == 2:
+                status_text = f"Q{game['period']} {self.rng.randint(0, 11)}:{self.rng.randint(0, 59):02d}"
+            else:
+                status_text = UPCOMING_TIMES[sequence % len(UPCOMING_TIMES)]
+            headers.append({
+                'GAME_DATE_EST': game_date_est, 'GAME_SEQUENCE': sequence, 'GAME_ID': game['game_id'],
+                'GAME_STATUS_ID': status, 'GAME_STATUS_TEXT': status_text,
+                'GAMECODE': f"{game_date.strftime('%Y%m%d')}/{visitor['abbreviation']}{home['abbreviation']}",
+                'HOME_TEAM_ID': home['id'], 'VISITOR_TEAM_ID': visitor['id'],
+                'SEASON': str(season_start_year(season)), 'LIVE_PERIOD': game['period'], 'LIVE_PC_TIME': "",
+                'LIVE_PERIOD_TIME_BCAST': "", 'ARENA_NAME': ARENAS[home['abbreviation']], 'WH_STATUS': 1,
+            })
+            for team in (visitor, home):
+                line = {
+                    'GAME_DATE_EST': game_date_est, 'GAME_SEQUENCE': sequence, 'GAME_ID': game['game_id'],
+                    'TEAM_ID': team['id'], 'TEAM_ABBREVIATION': team['abbreviation'],
+                    'TEAM_CITY_NAME': team['city'], 'TEAM_NAME': team['nickname'],
+                    'TEAM_WINS_LOSSES': self._record(season, team['id'], game_date),
+                }
+                if game['lines'] is not None:
+                    team_lines = game['lines'][team['id']]
+                    total = {stat: sum(player_line[stat] for player_line in team_lines) for stat in COUNTING_STATS}
+                    quarters = self._split(total['PTS'], game['period'])
+                    line.update({f"PTS_QTR{quarter}": points for quarter, points in enumerate(quarters, start=1)})
+                    line.update({
+                        'PTS': total['PTS'], 'FG_PCT': _percentage(total['FGM'], total['FGA']),
+                        'FT_PCT': _percentage(total['FTM'], total['FTA']),
+                        'FG3_PCT': _percentage(total['FG3M'], total['FG3A']),
+                        'AST': total['AST'], 'REB': total['REB'], 'TOV': total['TOV'],
+                    })
+                lines.append(line)
+        return headers, lines
+
+    def _split(self, points, periods):
+        """Splits points over the quarters played."""
+        weights = [self.rng.uniform(0.8, 1.2) for _ in range(periods)]
+        quarters = [int(points * weight / sum(weights)) for weight in weights]
+        quarters[-1] += points - sum(quarters)
+        return quarters
+
+    def box_score(self, game, advanced):
+        """Returns a game's BoxScoreTraditionalV3 or BoxScoreAdvancedV3 body."""
+        key = "boxScoreAdvanced" if advanced else "boxScoreTraditional"
+        body = {'gameId': game['game_id'], 'awayTeamId': game['visitor'], 'homeTeamId': game['home']}
+        for side, team_id in (("homeTeam", game['home']), ("awayTeam", game['visitor'])):
+            opponent_id = game['visitor'] if team_id == game['home'] else game['home']
+            team = self.teams[team_id]
+            lines = {line['PLAYER_ID']: line for line in game['lines'][team_id]}
+            total = {stat: sum(line[stat] for line in lines.values()) for stat in COUNTING_STATS}
+            total['MIN'] = round(sum(line['MIN'] for line in lines.values()))
+            total['PLUS_MINUS'] = game['points'][team_id] - game['points'][opponent_id]
+            opponent_total = {stat: sum(line[stat] for line in game['lines'][opponent_id]) for stat in COUNTING_STATS}
+            team_players = []
+            for index, player in enumerate(self.rosters[team_id]):
+                line = lines.get(player['id'])
+                statistics = self._advanced(line, total, opponent_total) if advanced else self._traditional(line)
+                team_players.append({
+                    'personId': player['id'],
+                    'firstName': player['first_name'],
+                    'familyName': player['last_name'],
+                    'nameI': f"{player['first_name'][:1]}. {player['last_name']}",
+                    'playerSlug': player['full_name'].lower().replace(" ", "-").replace(".", "").replace("'", ""),
+                    'position': player['position'][0] if index < 5 else "",
+                    'comment': "" if line is not None else "DNP - Coach's Decision",
+                    'jerseyNum': player['number'],
+                    'statistics': statistics,
+                })
+            team_body = {
+                'teamId': team_id,
+                'teamCity': team['city'],
+                'teamName': team['nickname'],
+                'teamTricode': team['abbreviation'],
+                'teamSlug': team['nickname'].lower().replace(" ", ""),
+                'players': team_players,
+                'statistics': self._advanced(total, total, opponent_total, team=True) if advanced
+                else self._traditional(total),
+            }
+            body[side] = team_body
+        return {'meta': {'version': 1, 'time': f"{game['date'].isoformat()} 00:00:00"}, key: body}
+
+    @staticmethod
+    def _traditional(line):
+        if line is None:
+            line = {'MIN': 0.0, 'PLUS_MINUS': 0, **{stat: 0 for stat in COUNTING_STATS}}
+        statistics = {name: line[stat] for name, stat in TRADITIONAL_STAT_NAMES.items()}
+        statistics.update({
+            'minutes': _clock(line['MIN']) if line['MIN'] else "",
+            'fieldGoalsPercentage': _percentage(line['FGM'], line['FGA']),
+            'threePointersPercentage': _percentage(line['FG3M'], line['FG3A']),
+            'freeThrowsPercentage': _percentage(line['FTM'], line['FTA']),
+            'plusMinusPoints': float(line['PLUS_MINUS']),
+        })
+        return statistics
+
+    @staticmethod
+    def _advanced(line, total, opponent_total, team=False):
+        """Returns advanced statistics from the usual box score estimates (possessions, TS%, usage, PIE)."""
+        if line is None:
+            return {'minutes': "", 'offensiveRating': 0.0, 'defensiveRating': 0.0, 'netRating': 0.0,
+                    'trueShootingPercentage': 0.0, 'usagePercentage': 0.0, 'PIE': 0.0}
+
+        def possessions(stats):
+            return max(1.0, stats['FGA'] + 0.44 * stats['FTA'] - stats['OREB'] + stats['TOV'])
+
+        def true_shooting(stats):
+            shots = 2 * (stats['FGA'] + 0.44 * stats['FTA'])
+            return stats['PTS'] / shots if shots else 0.0
+
+        def impact(stats):
+            return (stats['PTS'] + stats['FGM'] + stats['FTM'] - stats['FGA'] - stats['FTA'] + stats['DREB']
+                    + stats['OREB'] / 2 + stats['AST'] + stats['STL'] + stats['BLK'] / 2 - stats['PF'] - stats['TOV'])
+
+        team_rating = 100 * total['PTS'] / possessions(total)
+        team_true_shooting = true_shooting(total)
+        offensive_rating = team_rating if team or not team_true_shooting else \
+            team_rating * true_shooting(line) / team_true_shooting
+        defensive_rating = 100 * opponent_total['PTS'] / possessions(opponent_total)
+        plays = line['FGA'] + 0.44 * line['FTA'] + line['TOV']
+        team_plays = total['FGA'] + 0.44 * total['FTA'] + total['TOV']
+        usage = plays * (total['MIN'] / 5) / (line['MIN'] * team_plays) if line['MIN'] and team_plays else 0.0
+        game_impact = impact(total) + impact(opponent_total)
+        return {
+            'minutes': _clock(line['MIN']),
+            'offensiveRating': round(offensive_rating, 1),
+            'defensiveRating': round(defensive_rating, 1),
+            'netRating': round(offensive_rating - defensive_rating, 1),
+            'assistRatio': round(100 * line['AST'] / max(1.0, plays + line['AST']), 1),
+            'effectiveFieldGoalPercentage': _percentage(line['FGM'] + 0.5 * line['FG3M'], line['FGA']),
+            'trueShootingPercentage': round(true_shooting(line), 3),
+            'usagePercentage': 1.0 if team else round(usage, 3),
+            'pace': round(possessions(total) * 48 / (total['MIN'] / 5), 2),
+            'possessions': round(possessions(total) * (1 if team else line['MIN'] / total['MIN'] * 5), 1),
+            'PIE': round(impact(line) / game_impact, 3) if game_impact else 0.0,
+        }
+
+
+def _result_sets(endpoint_cls, rows_by_name, parameters):
+    """Returns a stats.nba.com body with every result set the endpoint defines."""
+    result_sets = []
+    for name, headers in endpoint_cls.expected_data.items():
+        rows = rows_by_name.get(name, [])
+        result_sets.append({
+            'name': name,
+            'headers': headers,
+            'rowSet': [[row.get(header) for header in headers] if isinstance(row, dict) else row for row in rows],
+        })
+    return {'resource': endpoint_cls.endpoint, 'parameters': parameters, 'resultSets': result_sets}
+
+
+def _write(fixtures_dir, endpoint_cls, body, **params):
+    parameters = endpoint_cls(get_request=False, **params).parameters
+    with open(fixture_path(fixtures_dir, endpoint_cls.endpoint, parameters), "w") as fixture_file:
+        json.dump(body, fixture_file)
+
+
+def _game_log_body(headers, rows, parameters):
+    return {'resource': PlayerGameLogs.endpoint, 'parameters': parameters,
+            'resultSets': [{'name': 'PlayerGameLogs', 'headers': headers, 'rowSet': rows}]}
+
+
+def write_fixtures(fixtures_dir, game_date, season, seed=SEED):
+    """
+    Writes every synthetic response the benchmarks can request.
+
+    Covers the scoreboard of each scheduled date and of game_date, every team's roster,
+    the league-wide, per-team and per-matchup PlayerGameLogs of the season and the one
+    before, and the benchmark player's PlayerGameLog and CommonPlayerInfo, and both box
+    scores of tonight's started games.
+
+    Args:
+        fixtures_dir (str): Directory to write to.
+        game_date (date): The benchmark's "today".
+        season (str): The season the app considers current (e.g., "2024-25").
+        seed (int): Seed of the generator.
+
+    Returns:
+        int: Number of fixtures written.
+    """
+    os.makedirs(fixtures_dir, exist_ok=True)
+    league = SyntheticLeague(game_date, season, seed)
+    written = 0
+
+    scoreboard_dates = {game['date'] for games in league.games.values() for game in games} | {game_date}
+    for scoreboard_date in sorted(scoreboard_dates):
+        game_header, line_score = league.scoreboard(scoreboard_date)
+        game_date_param = scoreboard_date.strftime('%m/%d/%Y')
+        body = _result_sets(ScoreboardV2, {'GameHeader': game_header, 'LineScore': line_score},
+                            {'GameDate': game_date_param, 'LeagueID': "00", 'DayOffset': "0"})
+        _write(fixtures_dir, ScoreboardV2, body, game_date=game_date_param)
+        written += 1
+
+    for team_id, roster in league.rosters.items():
+        rows = [{
+            'TeamID': team_id, 'SEASON': str(season_start_year(season)), 'LeagueID': "00",
+            'PLAYER': player['full_name'], 'PLAYER_SLUG': player['full_name'].lower().replace(" ", "-"),
+            'NUM': player['number'], 'POSITION': player['position'], 'HEIGHT': player['height'],
+            'WEIGHT': player['weight'], 'BIRTH_DATE': player['birth_date'].strftime('%b %d, %Y').upper(),
+            'AGE': player['age'], 'EXP': player['experience'], 'SCHOOL': player['school'], 'PLAYER_ID': player['id'],
+        } for player in sorted(roster, key=lambda player: player['last_name'])]
+        body = _result_sets(CommonTeamRoster, {'CommonTeamRoster': rows},
+                            {'TeamID': team_id, 'LeagueID': "00", 'Season': season})
+        _write(fixtures_dir, CommonTeamRoster, body, team_id=team_id, season=season)
+        written += 1
+
+    matchups = [(game['home'], game['visitor']) for game in league.tonight]
+    matchups += [(visitor, home) for home, visitor in matchups]
+    for log_season in league.games:
+        headers, rows = league.game_log_rows(log_season)
+        columns = {name: index for index, name in enumerate(headers)}
+        _write(fixtures_dir, PlayerGameLogs, _game_log_body(headers, rows, {'SeasonYear': log_season}),
+               season_nullable=log_season)
+        written += 1
+        for team_id in league.teams:
+            team_rows = [row for row in rows if row[columns['TEAM_ID']] == team_id]
+            _write(fixtures_dir, PlayerGameLogs,
+                   _game_log_body(headers, team_rows, {'SeasonYear': log_season, 'TeamID': team_id}),
+                   season_nullable=log_season, team_id_nullable=team_id)
+            written += 1
+        for team_id, opponent_id in matchups:
+            opponent = league.teams[opponent_id]['abbreviation']
+            matchup_rows = [row for row in rows if row[columns['TEAM_ID']] == team_id
+                            and row[columns['MATCHUP']].endswith(f" {opponent}")]
+            _write(fixtures_dir, PlayerGameLogs,
+                   _game_log_body(headers, matchup_rows,
+                                  {'SeasonYear': log_season, 'TeamID': team_id, 'OppTeamID': opponent_id}),
+                   season_nullable=log_season, team_id_nullable=team_id, opp_team_id_nullable=opponent_id)
+            written += 1
+        player_rows = [row for row in rows if row[columns['PLAYER_ID']] == BENCHMARK_PLAYER_ID]
+        _write(fixtures_dir, PlayerGameLogs,
+               _game_log_body(headers, player_rows, {'SeasonYear': log_season, 'PlayerID': BENCHMARK_PLAYER_ID}),
+               season_nullable=log_season, player_id_nullable=BENCHMARK_PLAYER_ID)
+        season_log = [{
+            'SEASON_ID': f"2{season_start_year(log_season)}", 'Player_ID': BENCHMARK_PLAYER_ID,
+            'Game_ID': row[columns['GAME_ID']],
+            'GAME_DATE': date.fromisoformat(row[columns['GAME_DATE']][:10]).strftime('%b %d, %Y').upper(),
+            'MIN': round(row[columns['MIN']]), 'VIDEO_AVAILABLE': 1,
+            **{name: row[columns[name]] for name in PlayerGameLog.expected_data['PlayerGameLog']
+               if name in columns and name != 'MIN'},
+        } for row in player_rows]
+        _write(fixtures_dir, PlayerGameLog,
+               _result_sets(PlayerGameLog, {'PlayerGameLog': season_log},
+                            {'PlayerID': BENCHMARK_PLAYER_ID, 'Season': log_season, 'SeasonType': "Regular Season"}),
+               player_id=BENCHMARK_PLAYER_ID, season=log_season)
+        written += 2
+
+    player = league.players[BENCHMARK_PLAYER_ID]
+    team = league.teams[BENCHMARK_TEAM_ID]
+    info = {
+        'PERSON_ID': player['id'], 'FIRST_NAME': player['first_name'], 'LAST_NAME': player['last_name'],
+        'DISPLAY_FIRST_LAST': player['full_name'],
+        'DISPLAY_LAST_COMMA_FIRST': f"{player['last_name']}, {player['first_name']}",
+        'DISPLAY_FI_LAST': f"{player['first_name'][:1]}. {player['last_name']}",
+        'BIRTHDATE': f"{player['birth_date'].isoformat()}T00:00:00", 'SCHOOL': player['school'],
+        'HEIGHT': player['height'], 'WEIGHT': player['weight'], 'JERSEY': player['number'],
+        'POSITION': player['position'], 'ROSTERSTATUS': "Active", 'TEAM_ID': team['id'],
+        'TEAM_NAME': team['nickname'], 'TEAM_ABBREVIATION': team['abbreviation'], 'TEAM_CITY': team['city'],
+        'FROM_YEAR': str(season_start_year(previous_season(season))), 'TO_YEAR': str(season_start_year(season)),
+        'NBA_FLAG': "Y", 'GAMES_PLAYED_FLAG': "Y",
+    }
+    _write(fixtures_dir, CommonPlayerInfo,
+           _result_sets(CommonPlayerInfo, {'CommonPlayerInfo': [info]}, {'PlayerID': BENCHMARK_PLAYER_ID}),
+           player_id=BENCHMARK_PLAYER_ID)
+    written += 1
+
+    for game in league.tonight:
+        if game['lines'] is None:
+            continue
+        for endpoint_cls, advanced in ((BoxScoreTraditionalV3, False), (BoxScoreAdvancedV3, True)):
+            _write(fixtures_dir, endpoint_cls, league.box_score(game, advanced), game_id=game['game_id'])
+            written += 1
+    return written
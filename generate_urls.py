@@ -1,117 +1,245 @@
+import logging
+import os
 import sqlite3
+import threading
 from datetime import datetime
 from nba_api.stats.endpoints import scoreboardv2
+from nba_api_functions.api_client import call_endpoint
+from nba_api_functions.resilience import FETCH_ERRORS
 
 
-DB_NAME = "url_generator.db"
+# Shipped with the repository and only ever read. The app works on a copy of it, so a
+# normal run never rewrites a tracked file.
+SEED_DB_NAME = "url_generator.db"
+DB_NAME = "url_generator_local.db"
+
+
+class UrlRepository:
+    """
+    Data access for the stream URL database.
+
+    Keeps one long-lived connection in WAL mode. URLs are stored with the NBA game ID
+    they belong to so they can be looked up per game instead of by position. A new
+    database starts as a copy of the seed database, which is then migrated.
+    """
+
+    def __init__(self, db_name=DB_NAME, seed_db_name=SEED_DB_NAME):
+        self.db_name = db_name
+        self._lock = threading.Lock()
+        is_new = not os.path.exists(db_name)
+        self._conn = sqlite3.connect(db_name, check_same_thread=False)
+        if is_new and os.path.exists(seed_db_name):
+            self._copy_seed(seed_db_name)
+        self.initialize()
+
+    def _copy_seed(self, seed_db_name):
+        """Copies the seed database into the new one, opening the seed read-only."""
+        try:
+            seed = sqlite3.connect(f"file:{seed_db_name}?mode=ro", uri=True)
+            try:
+                seed.backup(self._conn)
+            finally:
+                seed.close()
+        except sqlite3.Error as e:
+            logging.warning(f"Could not copy {seed_db_name}, starting with an empty URL database: {e}")
+
+    def initialize(self):
+        """
+        Creates the tables and indexes if they don't already exist and compacts the state table.
+        """
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute("PRAGMA journal_mode=WAL")
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS state (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                last_match_id INTEGER NOT NULL,
+                last_generated_date TEXT NOT NULL
+            )
+            """)
+            cursor.execute("""
+            CREATE TABLE IF NOT EXISTS urls (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                match_id INTEGER NOT NULL,
+                url TEXT NOT NULL,
+                generated_date TEXT NOT NULL,
+                game_id TEXT
+            )
+            """)
+            # Databases created before game IDs were stored lack the column
+            columns = [row[1] for row in cursor.execute("PRAGMA table_info(urls)")]
+            if "game_id" not in columns:
+                cursor.execute("ALTER TABLE urls ADD COLUMN game_id TEXT")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_urls_generated_date ON urls (generated_date)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_urls_match_id ON urls (match_id)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_urls_game_id ON urls (game_id)")
+            self._compact_state(cursor)
+            self._conn.commit()
+
+    @staticmethod
+    def _compact_state(cursor):
+        # Only the latest state row is ever read
+        cursor.execute("DELETE FROM state WHERE id < (SELECT MAX(id) FROM state)")
+
+    def get_last_state(self):
+        """
+        Retrieves the last match_id and the date it was generated.
+
+        Returns:
+            tuple: (last_match_id, last_generated_date)
+        """
+        with self._lock:
+            result = self._conn.execute(
+                "SELECT last_match_id, last_generated_date FROM state ORDER BY id DESC LIMIT 1"
+            ).fetchone()
+        return result if result else (None, None)
+
+    def update_last_state(self, last_match_id, generated_date):
+        """
+        Records the last match_id and generation date, keeping a single state row.
+
+        Parameters:
+            last_match_id (int): The last match ID generated.
+            generated_date (str): The date when URLs were last generated.
+        """
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute(
+                "INSERT INTO state (last_match_id, last_generated_date) VALUES (?, ?)",
+                (last_match_id, generated_date)
+            )
+            self._compact_state(cursor)
+            self._conn.commit()
+
+    def save_urls(self, urls, generated_date, game_ids=None):
+        """
+        Saves generated URLs.
+
+        Parameters:
+            urls (list): List of generated URLs.
+            generated_date (str): The date when the URLs were generated.
+            game_ids (list, optional): The NBA game ID for each URL, in the same order.
+        """
+        game_ids = game_ids or [None] * len(urls)
+        with self._lock:
+            self._conn.executemany(
+                "INSERT INTO urls (match_id, url, generated_date, game_id) VALUES (?, ?, ?, ?)",
+                [(int(url.split('/')[-1]), url, generated_date, game_id) for url, game_id in zip(urls, game_ids)]
+            )
+            self._conn.commit()
+
+    def urls_for_date(self, generated_date):
+        """
+        Fetches the URLs generated on one date.
+
+        Parameters:
+            generated_date (str): The date in 'YYYY-MM-DD' format.
+
+        Returns:
+            list: (game_id, url) tuples in match order. game_id is None for rows saved without one.
+        """
+        with self._lock:
+            return self._conn.execute(
+                "SELECT game_id, url FROM urls WHERE generated_date = ? ORDER BY match_id ASC",
+                (generated_date,)
+            ).fetchall()
+
+
+_repository = None
+_repository_lock = threading.Lock()
+
+
+def get_repository():
+    """Returns the process-wide UrlRepository, opening the database on first use."""
+    global _repository
+    with _repository_lock:
+        if _repository is None:
+            _repository = UrlRepository()
+        return _repository
 
 
 def initialize_database():
     """
     Initializes the SQLite database with the necessary tables.
     """
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
-
-    # Create tables if they don't already exist
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS state (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        last_match_id INTEGER NOT NULL,
-        last_generated_date TEXT NOT NULL
-    )
-    """)
-    cursor.execute("""
-    CREATE TABLE IF NOT EXISTS urls (
-        id INTEGER PRIMARY KEY AUTOINCREMENT,
-        match_id INTEGER NOT NULL,
-        url TEXT NOT NULL,
-        generated_date TEXT NOT NULL
-    )
-    """)
-    conn.commit()
-    conn.close()
+    get_repository().initialize()
 
 
 def get_last_state():
     """
     Retrieves the last match_id and the date it was generated from the database.
-    
+
     Returns:
         tuple: (last_match_id, last_generated_date)
     """
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
-    cursor.execute("SELECT last_match_id, last_generated_date FROM state ORDER BY id DESC LIMIT 1")
-    result = cursor.fetchone()
-    conn.close()
-    return result if result else (None, None)
+    return get_repository().get_last_state()
 
 
 def update_last_state(last_match_id, generated_date):
     """
     Updates the last match_id and the generation date in the database.
-    
+
     Parameters:
         last_match_id (int): The last match ID generated.
         generated_date (str): The date when URLs were last generated.
     """
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
-    cursor.execute("INSERT INTO state (last_match_id, last_generated_date) VALUES (?, ?)", (last_match_id, generated_date))
-    conn.commit()
-    conn.close()
+    get_repository().update_last_state(last_match_id, generated_date)
 
 
-def save_urls_to_db(urls, generated_date):
+def save_urls_to_db(urls, generated_date, game_ids=None):
     """
     Saves the generated URLs to the database.
-    
+
     Parameters:
         urls (list): List of generated URLs.
         generated_date (str): The date when the URLs were generated.
+        game_ids (list, optional): The NBA game ID for each URL, in the same order.
     """
-    conn = sqlite3.connect(DB_NAME)
-    cursor = conn.cursor()
-    cursor.executemany("INSERT INTO urls (match_id, url, generated_date) VALUES (?, ?, ?)",
-                       [(int(url.split('/')[-1]), url, generated_date) for url in urls])
-    conn.commit()
-    conn.close()
+    get_repository().save_urls(urls, generated_date, game_ids)
 
 
-def get_todays_nba_game_count():
+def get_todays_nba_game_ids():
     """
-    Fetches today's NBA games using the nba_api and returns the count of games.
+    Fetches today's NBA games using the nba_api and returns their game IDs.
 
     Returns:
-        int: The number of NBA games scheduled for today.
+        list: Game IDs in scoreboard order. Empty if there's an error or no games are scheduled.
     """
     try:
         # Get today's date in MM/DD/YYYY format as required by the API
         today = datetime.today().strftime('%m/%d/%Y')
-        
+
         # Fetch the scoreboard data for today using ScoreboardV2
-        sb = scoreboardv2.ScoreboardV2(game_date=today, timeout=10)
-        
+        sb = call_endpoint(scoreboardv2.ScoreboardV2, game_date=today, timeout=10)
+
         # Extract the game header data as a DataFrame
         game_header_df = sb.game_header.get_data_frame()
-        
-        # Return the count of games
-        return len(game_header_df)
-    
-    except Exception as e:
-        print(f"An error occurred: {e}")
-        return 0  # Return 0 if there's an error or no games are scheduled
+
+        return game_header_df['GAME_ID'].tolist() if not game_header_df.empty else []
+
+    except FETCH_ERRORS as e:
+        print(f"Could not fetch today's scoreboard: {e}")
+        return []
+
+
+def get_todays_nba_game_count():
+    """
+    Fetches today's NBA games using the nba_api and returns the count of games.
+
+    Returns:
+        int: The number of NBA games scheduled for today.
+    """
+    return len(get_todays_nba_game_ids())
 
 
 def generate_urls(start_id, n):
     """
     Generates a list of URLs with incremented match IDs.
-    
+
     Parameters:
         start_id (int): The starting match ID.
         n (int): The number of URLs to generate.
-    
+
     Returns:
         list: A list of generated URLs.
     """
@@ -119,36 +247,39 @@ def generate_urls(start_id, n):
     urls = [f"{base_url}{match_id}" for match_id in range(start_id + 1, start_id + n + 1)]
     return urls
 
-import sqlite3
 
-def get_urls_from_db():
+def get_urls_from_db(generated_date=None, game_ids=None):
     """
-    Fetches all URLs from the database.
+    Fetches the URLs generated on a date, keyed by NBA game ID.
+
+    Parameters:
+        generated_date (str, optional): The date in 'YYYY-MM-DD' format. Defaults to today.
+        game_ids (list, optional): The date's game IDs in scoreboard order. URLs saved
+            without a game ID are assigned to these by position.
 
     Returns:
-        list: A list of tuples containing (match_id, url, generated_date).
+        dict: A mapping of {game_id: url}.
     """
+    generated_date = generated_date or datetime.now().strftime("%Y-%m-%d")
     try:
-        conn = sqlite3.connect("url_generator.db")
-        cursor = conn.cursor()
-        
-        # Query to fetch all URLs from the database
-        cursor.execute("SELECT match_id, url, generated_date FROM urls ORDER BY id ASC")
-        urls = cursor.fetchall()
-        
-        conn.close()
-        return urls
-
+        rows = get_repository().urls_for_date(generated_date)
     except sqlite3.Error as e:
         print(f"An error occurred while fetching URLs from the database: {e}")
-        return []
+        return {}
 
+    game_urls = {}
+    for position, (game_id, url) in enumerate(rows):
+        if game_id is None and game_ids is not None and position < len(game_ids):
+            game_id = game_ids[position]
+        if game_id is not None:
+            game_urls[game_id] = url
+    return game_urls
 
 
 def main():
     # Initialize the database and ensure tables exist
     initialize_database()
-    
+
     # Get today's date
     today = datetime.now().strftime("%Y-%m-%d")
 
@@ -158,8 +289,9 @@ def main():
         print(f"URLs have already been generated for today ({today}).")
         return
 
-    # Fetch the count of today's NBA games
-    game_count = get_todays_nba_game_count()
+    # Fetch today's NBA games
+    game_ids = get_todays_nba_game_ids()
+    game_count = len(game_ids)
 
     if game_count == 0:
         print("No NBA games scheduled for today. Exiting.")
@@ -172,7 +304,7 @@ def main():
     urls = generate_urls(starting_match_id, game_count)
 
     # Save the URLs to the database
-    save_urls_to_db(urls, today)
+    save_urls_to_db(urls, today, game_ids)
 
     # Update the last state in the database
     new_last_match_id = starting_match_id + game_count
@@ -1,5 +1,141 @@
-from menu import Menu
-if __name__ == "__main__":
-    
+import argparse
+import logging
+import os
+import re
+import subprocess
+import sys
+
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modules the app imports on first use rather than at startup
+DEFERRED_MODULES = [
+    "pandas",
+    "nba_api.stats.endpoints",
+    "nba_api.stats.static.players",
+    "nba_api_functions.get_todays_nba_games",
+    "nba_api_functions.get_team_roster",
+    "nba_api_functions.player_profile",
+    "nba_api_functions.league_game_logs",
+    "nba_api_functions.roster_form",
+    "Components.PlayerStatsModal",
+    "Components.MatchupModal",
+    "nba_api_functions.box_score",
+]
+
+IMPORT_TIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$")
+
+
+def parse_import_times(output):
+    """
+    Parses the output of `python -X importtime`.
+
+    Args:
+        output (str): The stderr of the profiled interpreter.
+
+    Returns:
+        list: (module, self_us, cumulative_us, depth) tuples in the order the imports finished.
+    """
+    imports = []
+    for line in output.splitlines():
+        match = IMPORT_TIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            imports.append((module, int(self_us), int(cumulative_us), len(indent) // 2))
+    return imports
+
+
+def import_profile(top=15):
+    """
+    Prints the import cost of the startup path and of each deferred module.
+
+    The imports run in a fresh interpreter with -X importtime so nothing is already cached.
+
+    Args:
+        top (int): Number of slowest startup modules to list.
+    """
+    code = "; ".join(["import menu"] + [f"import {module}" for module in DEFERRED_MODULES])
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=APP_DIR, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        print(result.stderr, file=sys.stderr)
+        return result.returncode
 
+    imports = parse_import_times(result.stderr)
+    # Top-level entries are the modules imported by the -c statement, each after the previous ones
+    top_level = [entry for entry in imports if entry[3] == 0]
+    startup_end = next(index for index, entry in enumerate(imports) if entry[0] == "menu" and entry[3] == 0)
+    startup = imports[:startup_end + 1]
+    # Includes the interpreter's own site imports, which are part of process start too
+    startup_us = sum(entry[2] for entry in startup if entry[3] == 0)
 
+    print(f"Startup imports (before the first frame): {startup_us / 1000:.1f} ms")
+    print(f"{'module':50} {'self ms':>9} {'cumulative ms':>14}")
+    for module, self_us, cumulative_us, _ in sorted(startup, key=lambda entry: entry[1], reverse=True)[:top]:
+        print(f"{module:50} {self_us / 1000:9.1f} {cumulative_us / 1000:14.1f}")
+
+    print("\nDeferred imports (loaded on first use, after modules already imported):")
+    for module in DEFERRED_MODULES:
+        cumulative_us = next((entry[2] for entry in top_level if entry[0] == module), 0)
+        print(f"{module:50} {cumulative_us / 1000:24.1f}")
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="nba_tui", description="NBA scores, rosters and player stats in the terminal.")
+    parser.add_argument("--import-profile", action="store_true",
+                        help="Report the import cost of each module instead of starting the app")
+    parser.add_argument("--top", type=int, default=15, help="Modules listed by --import-profile (default: 15)")
+    parser.add_argument("--metrics-textfile", metavar="PATH",
+                        help="Keep endpoint metrics in a Prometheus textfile (e.g. for the node exporter) while running")
+    parser.add_argument("--snapshot", metavar="PATH", dest="snapshot_path",
+                        help="Start from a snapshot bundle, fetching only what it doesn't hold")
+    parser.add_argument("--offline", action="store_true",
+                        help="With --snapshot, never use the network and show the snapshot's latest scoreboard "
+                             "when it holds none for today")
+    commands = parser.add_subparsers(dest="command", metavar="COMMAND")
+    export_parser = commands.add_parser("export", help="Stream rosters, game logs or scoreboards to CSV or JSON lines",
+                                        description="Stream rosters, game logs or scoreboards to CSV or JSON lines.")
+    from nba_api_functions.export import add_export_arguments
+    add_export_arguments(export_parser)
+    snapshot_parser = commands.add_parser(
+        "snapshot", help="Capture rosters, game logs and scoreboards into a bundle for offline use",
+        description="Capture rosters, game logs and scoreboards into a bundle the app can start from with --snapshot."
+    )
+    from nba_api_functions.snapshot import add_snapshot_arguments
+    add_snapshot_arguments(snapshot_parser)
+    args = parser.parse_args(argv)
+
+    if args.import_profile:
+        return import_profile(args.top)
+
+    if args.command == "export":
+        from nba_api_functions.export import run_export
+        logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+        return run_export(args)
+
+    if args.command == "snapshot":
+        from nba_api_functions.snapshot import run_snapshot
+        logging.basicConfig(level=logging.INFO, stream=sys.stderr)
+        return run_snapshot(args)
+
+    if args.offline and not args.snapshot_path:
+        parser.error("--offline needs a --snapshot to run from")
+
+    if args.snapshot_path:
+        from nba_api_functions.snapshot import open_snapshot
+        try:
+            open_snapshot(args.snapshot_path, offline=args.offline)
+        except (OSError, ValueError) as e:
+            print(f"Could not open snapshot {args.snapshot_path}: {e}", file=sys.stderr)
+            return 2
+
+    from menu import nba_tui
+    logging.getLogger(__name__).info("Starting NBA TUI application...")
+    nba_tui(metrics_textfile=args.metrics_textfile).run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
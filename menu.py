@@ -1,173 +1,606 @@
+from __future__ import annotations
+
+from functools import partial
+from operator import itemgetter
+from typing import TYPE_CHECKING
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, VerticalScroll
-from textual.widgets import Header, Static, Button, DataTable, Label, Input  # Add Input to imports
-from textual import events
-from nba_api.stats.static import teams, players
-from nba_api_functions.get_todays_nba_games import get_todays_nba_games
-from nba_api_functions.get_team_roster import get_team_roster
-from nba_api_functions.player_profile import get_last_n_games_playergamelog
-from generate_urls import get_urls_from_db
-import pandas as pd
+from textual.widgets import Header, Footer, Static, Button, DataTable, Label, Input  # Add Input to imports
+from textual import events, work
+from textual.worker import get_current_worker
+from nba_api_functions.live_scoreboard import next_poll_interval, SCHEDULED
+from nba_api_functions.search_index import get_search_index, TEAM
 import logging
-import webbrowser
-from Components.PlayerStatsModal import PlayerStatsModal
 from Components.GameURLModal import GameURLModal
+from Components.GlobalSearchModal import GlobalSearchModal
+from Components.MetricsPanel import MetricsPanel
+from Components.ScreenPool import ScreenPool
+from nba_api_functions.api_cache import get_cache
+from nba_api_functions.metrics import get_metrics
+from nba_api_functions.prefetch import (
+    PLAYER_PRIORITY, ROSTER_PRIORITY, get_prefetcher, prefetch_player_game_log, prefetch_roster
+)
+from nba_api_functions.rows import FormRow
 from datetime import datetime
+import time
+
+# The nba_api endpoints and the stats modals are imported where they are first used,
+# so the first frame is drawn before they load
+if TYPE_CHECKING:
+    from nba_api_functions.rows import GameRow, RosterRow
 
 
 # Set up logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Target time from startup to the first drawn frame
+FIRST_FRAME_BUDGET_MS = 200
+
+# Delay after the last keystroke before the roster is filtered
+SEARCH_DEBOUNCE_SECONDS = 0.15
+
+# Above this many rows leaving the table, clearing and re-adding the matches is cheaper
+MAX_INCREMENTAL_ROW_REMOVALS = 25
+
+# Files written by the metrics export
+METRICS_JSON_PATH = "nba_tui_metrics.json"
+METRICS_PROMETHEUS_PATH = "nba_tui_metrics.prom"
+
+# Seconds between rewrites of the Prometheus textfile given on the command line
+METRICS_TEXTFILE_SECONDS = 15
+
+# Seconds after the first frame before the league-wide game logs are synced in the background
+GAME_LOG_SYNC_DELAY_SECONDS = 10
+
+# Fuzzy team matches scoring below this are hidden from the team list
+TEAM_FILTER_MIN_SCORE = 30
+
+ROSTER_COLUMNS = [
+    'PLAYER', 'TEAM_ABBREVIATION', 'NUM', 'POSITION', 'HEIGHT', 'WEIGHT',
+    'BIRTH_DATE', 'AGE', 'EXP', 'SCHOOL'
+]
+
+# Recent-form columns appended to a single team's roster, filled in once its game logs load
+FORM_COLUMNS = list(FormRow._fields[1:])
+BLANK_FORM_CELLS = ("",) * len(FORM_COLUMNS)
+
 class nba_tui(App):
     CSS_PATH = "combining_layouts.tcss"
+    BINDINGS = [
+        ("r", "prefetch_rosters", "Load all rosters"),
+        ("a", "show_league", "All players"),
+        ("slash", "global_search", "Search"),
+        ("l", "toggle_live", "Live scores"),
+        ("c", "show_calendar", "Calendar"),
+        ("d", "toggle_metrics", "Metrics"),
+        ("x", "export_metrics", "Export metrics"),
+    ]
     
-    def __init__(self):
+    def __init__(self, metrics_textfile: str | None = None):
         super().__init__()
-        self.player_id_map = {}  # Store player ID mapping
+        self._started_at = time.perf_counter()
+        self.metrics_textfile = metrics_textfile  # Prometheus textfile kept up to date while running
+        self.first_frame_ms = None
+        self.player_screens = ScreenPool(self, "player-stats")  # Recently opened player stats modals
         self.game_urls = {}
         self.all_team_buttons = []  # Store all team buttons
-        self.current_roster_df = None  # Store current roster for filtering
+        self.current_roster = None  # Rows of the current roster, for filtering
+        self._roster_search_keys = []  # Lowercase player name per roster row
+        self.league_roster = None  # Every team's roster once prefetched
+        self._displayed_player_keys = []  # Row keys currently shown in the roster table
+        self._roster_cells = None  # Picks the displayed columns out of a RosterRow
+        self._roster_sort = None  # (column key, reverse) of the last header the user clicked
+        self._form_team_id = None  # Team whose form columns the roster table shows
+        self._roster_form = {}  # FormRow by PLAYER_ID for that team
+        self._player_search_timer = None
+        self.game_buttons = {}  # Game button by GameID
+        self._game_texts = {}  # Last label shown on each game button
+        self._last_games = None
+        self.live_mode = True  # Poll the scoreboard while games are upcoming or live
+        self._scoreboard_timer = None
 
     def compose(self) -> ComposeResult:
         yield Header()
         with Container(id="app-grid"):
             with Container(id="left-pane"):
-                with VerticalScroll(id="left-pane"):
-                    games_df = get_todays_nba_games()
-                    urls = get_urls_from_db()
-                    self.game_urls = {i: url[1] for i, url in enumerate(urls)}
-                    
-                    if not games_df.empty:
-                        for idx, game in games_df.iterrows():
-                            # Convert time to readable format
-                            try:
-                                game_time = datetime.strptime(game['GameTime'], '%Y-%m-%dT%H:%M:%S')
-                                formatted_time = game_time.strftime('%I:%M %p')
-                            except:
-                                formatted_time = game['GameTime']
-                                
-                            game_text = (
-                                f"{game['HomeTeam']} vs {game['VisitorTeam']}\n"
-                                f"Arena: {game['Arena']}\n"
-                                f"Time: {formatted_time}"
-                            )
-                            game_button = Button(game_text, id=f"game_{idx}", classes="game-button")
-                            yield game_button
-                    else:
-                        yield Static("No games scheduled today")
+                self.games_list = VerticalScroll(id="left-pane")
+                with self.games_list:
+                    yield Static("Loading today's games...", id="games-placeholder")
             
             # Separate container for teams section
             with Container(id="teams-section"):
                 yield Input(placeholder="Search teams...", id="team-search")
-                with VerticalScroll(id="teams-list"):
-                    try:
-                        nba_teams = teams.get_teams()
-                        logger.info(f"Fetched {len(nba_teams)} teams")
-                        for team in nba_teams:
-                            valid_id = f"team_{team['id']}"
-                            team_button = Button(f"{team['full_name']}", id=valid_id, classes="team-button")
-                            self.all_team_buttons.append(team_button)
-                            yield team_button
-                    except Exception as e:
-                        logger.error(f"Error loading teams: {str(e)}")
-                        yield Static("Error loading teams")
+                self.teams_list = VerticalScroll(id="teams-list")
+                with self.teams_list:
+                    yield Static("Loading teams...", id="teams-placeholder")
             with Container(id="bottom-right"):
+                yield Input(placeholder="Search players...", id="player-search")
                 self.roster_table = DataTable()
                 self.roster_table.styles.width = "100%"
                 self.roster_table.styles.height = "100%"
                 yield self.roster_table
+        yield MetricsPanel(id="metrics-panel")
+        yield Footer()
+
+    def on_mount(self) -> None:
+        """Start the background loaders once the placeholder layout is up."""
+        self.call_after_refresh(self._record_first_frame)
+        if self.metrics_textfile:
+            self.set_interval(METRICS_TEXTFILE_SECONDS, self._write_metrics_textfile)
+
+    def on_unmount(self) -> None:
+        """Leave the final metrics in the Prometheus textfile."""
+        get_prefetcher().clear()
+        if self.metrics_textfile:
+            self._write_metrics_textfile()
+
+    def _write_metrics_textfile(self) -> None:
+        """Rewrite the Prometheus textfile for the node exporter."""
+        try:
+            get_metrics().write_prometheus_textfile(self.metrics_textfile, get_cache().stats())
+        except OSError as e:
+            logger.error(f"Could not write metrics to {self.metrics_textfile}: {e}")
+
+    def _record_first_frame(self) -> None:
+        """Log the time from app construction to the first drawn frame."""
+        self.first_frame_ms = (time.perf_counter() - self._started_at) * 1000
+        if self.first_frame_ms > FIRST_FRAME_BUDGET_MS:
+            logger.warning(f"First frame took {self.first_frame_ms:.0f} ms (budget {FIRST_FRAME_BUDGET_MS} ms)")
+        else:
+            logger.info(f"First frame drawn in {self.first_frame_ms:.0f} ms")
+        # The loaders import pandas and the endpoints, which would hold the GIL during the first frame
+        self.load_games()
+        self.load_teams()
+        # Parsing a league season's game logs holds the GIL for a while, keep it clear of the first clicks.
+        # A player view opened before then syncs on demand.
+        self.set_timer(GAME_LOG_SYNC_DELAY_SECONDS, self.sync_game_logs)
+
+    @work(thread=True, exclusive=True, group="games")
+    def load_games(self) -> None:
+        """Fetch today's scoreboard and stream URLs off the event loop."""
+        from nba_api_functions.get_todays_nba_games import get_todays_nba_game_rows
+        from generate_urls import get_urls_from_db
+        games = get_todays_nba_game_rows()
+        game_urls = get_urls_from_db(game_ids=[game.GameID for game in games])
+        self.call_from_thread(self.show_games, games, game_urls)
+
+    def show_games(self, games: list[GameRow], game_urls: dict) -> None:
+        """Replace the games placeholder with one button per game."""
+        self.game_urls = game_urls
+        self.game_buttons = {}
+        self._game_texts = {}
+        game_widgets = []
+        if games:
+            for game in games:
+                game_text = self._game_button_text(game)
+                button = Button(game_text, id=f"game_{game.GameID}", classes="game-button")
+                self.game_buttons[game.GameID] = button
+                self._game_texts[game.GameID] = game_text
+                game_widgets.append(button)
+        else:
+            game_widgets.append(Static("No games scheduled today"))
+        self.games_list.remove_children()
+        self.games_list.mount_all(game_widgets)
+        self._last_games = games
+        self._schedule_scoreboard_poll(games)
+
+    @staticmethod
+    def _game_button_text(game: GameRow) -> str:
+        """Format the label of a game button."""
+        # Convert time to readable format
+        try:
+            game_time = datetime.strptime(game.GameTime, '%Y-%m-%dT%H:%M:%S')
+            formatted_time = game_time.strftime('%I:%M %p')
+        except:
+            formatted_time = game.GameTime
+
+        game_text = (
+            f"{game.HomeTeam} vs {game.VisitorTeam}\n"
+            f"Arena: {game.Arena}\n"
+            f"Time: {formatted_time}"
+        )
+        if game.GameStatusID != SCHEDULED and game.HomeScore is not None:
+            game_text += f"\nScore: {int(game.HomeScore)} - {int(game.VisitorScore)}"
+        return game_text
+
+    def action_toggle_metrics(self) -> None:
+        """Show or hide the endpoint metrics panel."""
+        panel = self.query_one("#metrics-panel", MetricsPanel)
+        panel.display = not panel.display
+        panel.refresh_metrics()
+
+    def action_export_metrics(self) -> None:
+        """Write the endpoint metrics as JSON and in the Prometheus text format."""
+        cache_stats = get_cache().stats()
+        try:
+            with open(METRICS_JSON_PATH, "w") as metrics_file:
+                metrics_file.write(get_metrics().to_json(cache_stats))
+            get_metrics().write_prometheus_textfile(METRICS_PROMETHEUS_PATH, cache_stats)
+        except OSError as e:
+            self.notify(f"Could not export metrics: {e}", severity="error")
+            return
+        self.notify(f"Metrics written to {METRICS_JSON_PATH} and {METRICS_PROMETHEUS_PATH}.")
+
+    def action_toggle_live(self) -> None:
+        """Turn live score updates on or off."""
+        self.live_mode = not self.live_mode
+        if self.live_mode:
+            self.notify("Live scores on.")
+            self.poll_scoreboard()
+        else:
+            self.notify("Live scores off.")
+            if self._scoreboard_timer is not None:
+                self._scoreboard_timer.stop()
+
+    def _schedule_scoreboard_poll(self, games: list[GameRow]) -> None:
+        """Schedule the next scoreboard poll based on the state of today's games."""
+        if self._scoreboard_timer is not None:
+            self._scoreboard_timer.stop()
+            self._scoreboard_timer = None
+        if not self.live_mode:
+            return
+        interval = next_poll_interval(games)
+        if interval is None:
+            logger.info("No live or upcoming games, stopping scoreboard updates")
+            return
+        logger.info(f"Next scoreboard poll in {interval:.0f} s")
+        self._scoreboard_timer = self.set_timer(interval, self.poll_scoreboard)
+
+    @work(thread=True, exclusive=True, group="games")
+    def poll_scoreboard(self) -> None:
+        """Fetch a fresh scoreboard, bypassing the cache."""
+        from nba_api_functions.get_todays_nba_games import get_todays_nba_game_rows
+        games = get_todays_nba_game_rows(use_cache=False)
+        self.call_from_thread(self.apply_scoreboard, games)
+
+    def apply_scoreboard(self, games: list[GameRow]) -> None:
+        """Update only the game buttons whose score or status changed."""
+        if not games and self.game_buttons:
+            # A failed poll returns no games, keep the current buttons and try again
+            self._schedule_scoreboard_poll(self._last_games)
+            return
+        if {game.GameID for game in games} != set(self.game_buttons):
+            self.show_games(games, self.game_urls)
+            return
+        changed = 0
+        for game in games:
+            game_text = self._game_button_text(game)
+            if self._game_texts.get(game.GameID) != game_text:
+                self.game_buttons[game.GameID].label = game_text
+                self._game_texts[game.GameID] = game_text
+                changed += 1
+        logger.info(f"Scoreboard updated, {changed} of {len(games)} games changed")
+        self._last_games = games
+        self._schedule_scoreboard_poll(games)
+
+    @work(thread=True, exclusive=True, group="teams")
+    def load_teams(self) -> None:
+        """Load the team list off the event loop."""
+        try:
+            # Building the search index here keeps its cost off the event loop
+            nba_teams = list(get_search_index().teams_by_id.values())
+            logger.info(f"Fetched {len(nba_teams)} teams")
+            self.call_from_thread(self.show_teams, nba_teams)
+        except Exception as e:
+            logger.error(f"Error loading teams: {str(e)}")
+            self.call_from_thread(self.show_teams, None)
 
-    def update_roster_display(self, roster_df: pd.DataFrame):
+    def show_teams(self, nba_teams: list | None) -> None:
+        """Replace the teams placeholder with one button per team."""
+        self.teams_list.remove_children()
+        if nba_teams is None:
+            self.teams_list.mount(Static("Error loading teams"))
+            return
+        self.all_team_buttons = [
+            Button(f"{team['full_name']}", id=f"team_{team['id']}", classes="team-button")
+            for team in nba_teams
+        ]
+        self.teams_list.mount_all(self.all_team_buttons)
+
+    @work(thread=True, exclusive=True, group="game-logs")
+    def sync_game_logs(self) -> None:
+        """Bring the local league-wide game logs up to date, so player views need no request."""
+        from nba_api_functions.league_game_logs import sync_league_game_logs
+        sync_league_game_logs()
+
+    def action_prefetch_rosters(self) -> None:
+        """Warm every team's roster in the background."""
+        self.notify("Loading all team rosters in the background...")
+        self.prefetch_league_rosters()
+
+    @work(thread=True, exclusive=True, group="league-rosters")
+    def prefetch_league_rosters(self) -> None:
+        """Fetch all 30 rosters through the rate-limited bulk loader."""
+        from nba_api_functions.get_all_team_rosters import get_all_team_roster_rows
+        league_rows = get_all_team_roster_rows()
+        self.call_from_thread(self.store_league_rosters, league_rows)
+
+    def store_league_rosters(self, league_rows: list[RosterRow]) -> None:
+        """Keep the league-wide roster and map every player name to its ID."""
+        if not league_rows:
+            self.notify("Could not load team rosters.", severity="error")
+            return
+        self.league_roster = league_rows
+        self.notify(f"Loaded {len(league_rows)} players from {len({row.TEAM_ID for row in league_rows})} teams.")
+
+    @work(thread=True, exclusive=True, group="roster")
+    def load_roster(self, team_name: str) -> None:
+        """Fetch a team roster off the event loop.
+
+        Pressing another team cancels this worker. Repeated presses of the same team
+        share one request in call_endpoint.
+        """
+        from nba_api_functions.get_team_roster import get_team_roster_rows
+        worker = get_current_worker()
+        try:
+            roster_rows = get_team_roster_rows(team_name)
+        except Exception as e:
+            logger.error(f"Error loading roster for {team_name}: {str(e)}")
+            return
+        if not worker.is_cancelled:
+            self.call_from_thread(self.update_roster_display, roster_rows)
+
+    def update_roster_display(self, roster_rows: list[RosterRow]):
         """Update the roster table with team data."""
-        self.current_roster_df = roster_df  # Store the full roster
-        self._filter_and_display_roster()
+        if not roster_rows:
+            self.current_roster = None
+            self._roster_search_keys = []
+            self.roster_table.clear(columns=True)
+            self._displayed_player_keys = []
+            self._form_team_id = None
+            return
+        # Store the full roster with a normalized search key computed once per row
+        unique_rows = {}
+        for row in roster_rows:
+            unique_rows.setdefault(str(row.PLAYER_ID), row)
+        self.current_roster = list(unique_rows.items())
+        self._roster_search_keys = [row.PLAYER.lower() for row in unique_rows.values()]
+
+        # The team column only has values on the league-wide roster
+        show_team = any(row.TEAM_ABBREVIATION for row in unique_rows.values())
+        columns = [column for column in ROSTER_COLUMNS if show_team or column != 'TEAM_ABBREVIATION']
+        self._roster_cells = itemgetter(*[roster_rows[0]._fields.index(column) for column in columns])
+        # Recent form is computed per team, so a single team's roster gets the form columns
+        self._form_team_id = None if show_team else roster_rows[0].TEAM_ID
+        self._roster_form = {}
+        if self._form_team_id is not None:
+            columns += FORM_COLUMNS
+            # After the roster is drawn, so importing numpy does not hold the GIL in front of it
+            self.call_after_refresh(self.load_roster_form, self._form_team_id)
+        if self._roster_sort is not None and self._roster_sort[0] not in columns:
+            self._roster_sort = None
+        self.roster_table.clear(columns=True)
+        for column in columns:
+            self.roster_table.add_column(column, key=column)
+        self._displayed_player_keys = []
+        self._filter_and_display_roster(self.query_one("#player-search", Input).value)
+
+    @work(thread=True, exclusive=True, group="roster-form")
+    def load_roster_form(self, team_id: int) -> None:
+        """Fetch the team's game logs and compute every player's recent form off the event loop."""
+        from nba_api_functions.roster_form import get_roster_form
+        worker = get_current_worker()
+        form = get_roster_form(team_id)
+        if not worker.is_cancelled:
+            self.call_from_thread(self.show_roster_form, team_id, form)
+
+    def show_roster_form(self, team_id: int, form: dict) -> None:
+        """Fill the form columns, unless another roster was opened meanwhile."""
+        if team_id != self._form_team_id:
+            return
+        self._roster_form = form
+        # Rebuild the rows (not the columns) so every shown player picks up the new cells
+        self.roster_table.clear()
+        self._displayed_player_keys = []
+        self._filter_and_display_roster(self.query_one("#player-search", Input).value)
+
+    def _roster_row_cells(self, row: RosterRow) -> tuple:
+        """Returns the table cells of a roster row, with its form cells on a single team's roster."""
+        cells = self._roster_cells(row)
+        if self._form_team_id is None:
+            return cells
+        form = self._roster_form.get(row.PLAYER_ID)
+        if form is None:
+            return (*cells, *BLANK_FORM_CELLS)
+        return (*cells, *("" if value is None else value for value in form[1:]))
+
+    def _sort_roster_table(self) -> None:
+        """Sort the roster table by the column the user picked, keeping blank cells last."""
+        column, reverse = self._roster_sort
+
+        def sort_key(value):
+            blank = value is None or value == ""
+            # Flipped with the direction so blanks sort last either way, and never compared to numbers
+            return (blank != reverse, 0 if blank else value)
+
+        self.roster_table.sort(column, key=sort_key, reverse=reverse)
 
     def _filter_and_display_roster(self, search_term: str = ""):
-        """Filter and display roster based on search term."""
+        """Filter and display roster based on search term.
+
+        Only rows that enter or leave the match set are added to or removed from the table.
+        """
         try:
-            self.roster_table.clear()
-            if self.current_roster_df is not None and not self.current_roster_df.empty:
-                filtered_df = self.current_roster_df
-                if search_term:
-                    filtered_df = self.current_roster_df[
-                        self.current_roster_df['PLAYER'].str.lower().str.contains(search_term.lower())
-                    ]
-
-                desired_columns = [
-                    'PLAYER', 'NUM', 'POSITION', 'HEIGHT', 'WEIGHT',
-                    'BIRTH_DATE', 'AGE', 'EXP', 'SCHOOL'
+            roster = self.current_roster
+            if roster is None:
+                return
+            search_term = search_term.strip().lower()
+            if search_term:
+                matched = [
+                    entry for entry, search_key in zip(roster, self._roster_search_keys)
+                    if search_term in search_key
                 ]
-                
-                for column in desired_columns:
-                    if column in filtered_df.columns:
-                        self.roster_table.add_column(column)
-                
-                for _, row in filtered_df.iterrows():
-                    row_data = []
-                    for col in desired_columns:
-                        if col in filtered_df.columns:
-                            row_data.append(str(row[col]))
-                    self.player_id_map[row['PLAYER']] = row['PLAYER_ID']
-                    self.roster_table.add_row(*row_data)
+            else:
+                matched = roster
+            matched_keys = {row_key for row_key, _ in matched}
+            displayed_keys = set(self._displayed_player_keys)
+
+            removed_keys = displayed_keys - matched_keys
+            if len(removed_keys) > MAX_INCREMENTAL_ROW_REMOVALS:
+                # Each removal reindexes the table, so rebuild the rows (not the columns) instead
+                self.roster_table.clear()
+                displayed_keys = set()
+            else:
+                for row_key in removed_keys:
+                    self.roster_table.remove_row(row_key)
+
+            added = [(row_key, row) for row_key, row in matched if row_key not in displayed_keys]
+            if added:
+                for row_key, row in added:
+                    self.roster_table.add_row(*self._roster_row_cells(row), key=row_key)
+                if self._roster_sort is not None:
+                    self._sort_roster_table()
+                elif displayed_keys & matched_keys:
+                    # Rows were appended after ones already shown, restore roster order. The sort
+                    # key only sees a row's cells, so look its player up by them: players may share a name
+                    order = {row.PLAYER_ID: index for index, (_, row) in enumerate(roster)}
+                    player_ids = {self._roster_row_cells(row): row.PLAYER_ID for _, row in matched}
+                    self.roster_table.sort(key=lambda cells: order.get(player_ids.get(cells), 0))
+
+            self._displayed_player_keys = [row_key for row_key, _ in matched]
 
         except Exception as e:
             logger.error(f"Error filtering roster: {str(e)}")
 
+    def action_show_league(self) -> None:
+        """Show every prefetched player in the roster table."""
+        if self.league_roster is None:
+            self.notify("Press 'r' to load all rosters first.")
+            return
+        self.update_roster_display(self.league_roster)
+
+    def action_show_calendar(self) -> None:
+        """Open the day-by-day games calendar."""
+        from Components.CalendarModal import CalendarModal
+        self.push_screen(CalendarModal())
+
+    def action_global_search(self) -> None:
+        """Open the player and team search."""
+        self.push_screen(GlobalSearchModal(), self.open_search_result)
+
+    def open_search_result(self, result: tuple | None) -> None:
+        """Open the roster or stats of the search result the user chose."""
+        if result is None:
+            return
+        kind, entry_id = result
+        if kind == TEAM:
+            team = get_search_index().teams_by_id[entry_id]
+            self.load_roster(team['full_name'])
+        else:
+            self.call_later(self.handle_player_click, str(entry_id))
+
     async def on_button_pressed(self, event: Button.Pressed) -> None:
         """Handle button presses."""
         logger.info(f"Button pressed: {event.button.id}")
         if event.button.id and event.button.id.startswith("team_"):
-            try:
-                team_name = str(event.button.label)
-                logger.info(f"Fetching roster for {team_name}")
-                roster_df = get_team_roster(team_name)
-                self.update_roster_display(roster_df)
-            except Exception as e:
-                logger.error(f"Error handling button press: {str(e)}")
+            get_prefetcher().cancel(("roster", int(event.button.id.split("_")[1])))
+            team_name = str(event.button.label)
+            logger.info(f"Fetching roster for {team_name}")
+            self.load_roster(team_name)
         button_name = event.button.name
         if button_name and button_name.startswith("player_"):
             player_id = button_name.split("_")[1]
             await self.handle_player_click(player_id)
         if event.button.id and event.button.id.startswith("game_"):
-            game_idx = int(event.button.id.split("_")[1])
-            if game_idx in self.game_urls:
-                game_url = self.game_urls[game_idx]
-                modal = GameURLModal(game_url)
-                await self.push_screen(modal)
+            game_id = event.button.id.split("_", 1)[1]
+            await self.open_game(game_id)
+
+    async def open_game(self, game_id: str) -> None:
+        """Open the matchup view of one of today's games, with its stream URL when there is one."""
+        from Components.MatchupModal import MatchupModal
+        game = next((game for game in self._last_games or [] if game.GameID == game_id), None)
+        if game is None:
+            if game_id in self.game_urls:
+                await self.push_screen(GameURLModal(self.game_urls[game_id]))
+            return
+        await self.push_screen(MatchupModal(game, self.game_urls.get(game_id)))
+
+    def on_data_table_header_selected(self, event: DataTable.HeaderSelected) -> None:
+        """Sort the roster by the clicked column. Clicking it again flips the order."""
+        if event.data_table is not self.roster_table or self.current_roster is None:
+            return
+        column = event.column_key.value
+        if self._roster_sort is not None and self._roster_sort[0] == column:
+            reverse = not self._roster_sort[1]
+        else:
+            # Highest first for the form statistics, alphabetical for the roster details
+            reverse = column in FORM_COLUMNS
+        self._roster_sort = (column, reverse)
+        self._sort_roster_table()
+
+    def on_descendant_focus(self, event: events.DescendantFocus) -> None:
+        self._prefetch_team_roster(event.widget)
+
+    def on_enter(self, event: events.Enter) -> None:
+        self._prefetch_team_roster(event.node)
+
+    def _prefetch_team_roster(self, widget) -> None:
+        """Queue the roster of a team button that was focused or hovered, ahead of a press."""
+        if isinstance(widget, Button) and widget.id and widget.id.startswith("team_"):
+            team_id = int(widget.id.split("_")[1])
+            get_prefetcher().submit(("roster", team_id), partial(prefetch_roster, team_id), ROSTER_PRIORITY)
+
+    def on_data_table_cell_highlighted(self, event: DataTable.CellHighlighted) -> None:
+        """Queue the game log of the player under the roster cursor, ahead of a selection."""
+        # The cursor also lands on a cell whenever the table is filled, which says nothing about the user
+        if event.data_table is not self.roster_table or not self.roster_table.has_focus:
+            return
+        row_key = event.cell_key.row_key.value
+        if row_key is None:
+            return
+        player_id = int(row_key)
+        get_prefetcher().submit(
+            ("game_log", player_id), partial(prefetch_player_game_log, player_id), PLAYER_PRIORITY
+        )
 
     async def on_data_table_cell_selected(self, event: DataTable.CellSelected):
         """Handle cell selection in the roster table."""
         try:
-            # First column (index 0) contains player names
-            if event.coordinate.column == 0:  
-                player_name = event.value
-                if player_name in self.player_id_map:
-                    player_id = self.player_id_map[player_name]
-                    await self.handle_player_click(player_id)
+            # First column (index 0) contains player names, rows are keyed by player ID
+            if event.data_table is self.roster_table and event.coordinate.column == 0:
+                await self.handle_player_click(event.cell_key.row_key.value)
         except Exception as e:
             logger.error(f"Error handling cell selection: {str(e)}")
             logger.error(f"Event details: coordinate={event.coordinate}, value={event.value}")
 
     async def handle_player_click(self, player_id: str):
         """Handle the player button click event."""
+        from Components.PlayerStatsModal import PlayerStatsModal
         logger.info(f"Player with ID {player_id} clicked")
-        # Show player stats modal
-        stats_modal = PlayerStatsModal(player_id)
+        get_prefetcher().cancel(("game_log", int(player_id)))
+        # A newer click supersedes a stats modal that is still open
+        if isinstance(self.screen, PlayerStatsModal):
+            self.pop_screen()
+        # A recently opened player comes back as it was left, without a fetch
+        stats_modal = self.player_screens.get(str(player_id), lambda: PlayerStatsModal(str(player_id)))
         await self.push_screen(stats_modal)
 
     async def on_input_changed(self, event: Input.Changed) -> None:
         """Handle search input changes."""
         if event.input.id == "team-search":
-            search_term = event.value.lower()
+            search_term = event.value
             logger.info(f"Searching for: {search_term}")
+            matched_ids = None
+            if search_term.strip():
+                matched_ids = {
+                    result.id for result in get_search_index().search(
+                        search_term, kind=TEAM, limit=len(self.all_team_buttons),
+                        min_score=TEAM_FILTER_MIN_SCORE
+                    )
+                }
             for button in self.all_team_buttons:
-                if search_term in str(button.label).lower():
-                    button.styles.display = "block"
-                else:
-                    button.styles.display = "none"
+                team_id = int(button.id.split("_")[1])
+                button.display = matched_ids is None or team_id in matched_ids
         elif event.input.id == "player-search":
-            self._filter_and_display_roster(event.value)
+            # Wait for typing to pause before filtering
+            if self._player_search_timer is not None:
+                self._player_search_timer.stop()
+            search_term = event.value
+            self._player_search_timer = self.set_timer(
+                SEARCH_DEBOUNCE_SECONDS,
+                lambda: self._filter_and_display_roster(search_term)
+            )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,261 @@
+import sqlite3
+import threading
+import time
+import json
+import logging
+from datetime import datetime
+
+
+CACHE_DB_NAME = "nba_api_cache.db"
+
+# Per-endpoint time-to-live values in seconds. None means the entry never expires.
+FOREVER = None
+LIVE_SCOREBOARD_TTL = 15
+ROSTER_TTL = 6 * 60 * 60
+CURRENT_SEASON_GAME_LOG_TTL = 30 * 60
+DEFAULT_TTL = 5 * 60
+
+# Upper bound for the stored response bodies before least recently used entries are evicted.
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def _current_season_start_year():
+    today = datetime.today()
+    return today.year if today.month >= 10 else today.year - 1
+
+
+def is_past_season(season):
+    try:
+        return int(str(season)[:4]) < _current_season_start_year()
+    except (TypeError, ValueError):
+        return False
+
+
+def season_end_timestamp(season):
+    """
+    Returns when a season counts as over, as a Unix timestamp.
+
+    Matches is_past_season: a season is over once the next one starts in October,
+    after its playoffs. Data synced after this moment holds every game of the season.
+    """
+    return datetime(int(str(season)[:4]) + 1, 10, 1).timestamp()
+
+
+def is_final_sync(season, synced_at):
+    """Returns True if a sync at synced_at happened after the season was over, so it never needs repeating."""
+    try:
+        return is_past_season(season) and synced_at >= season_end_timestamp(season)
+    except (TypeError, ValueError):
+        return False
+
+
+def is_past_date(game_date):
+    for date_format in ('%m/%d/%Y', '%Y-%m-%d'):
+        try:
+            return datetime.strptime(str(game_date), date_format).date() < datetime.today().date()
+        except ValueError:
+            continue
+    return False
+
+
+def ttl_for(endpoint, parameters):
+    """
+    Returns the time-to-live for a response of the given endpoint.
+
+    Args:
+        endpoint (str): The nba_api endpoint name (e.g., "commonteamroster").
+        parameters (dict): The request parameters sent to the endpoint.
+
+    Returns:
+        int or None: Seconds until the entry expires, or None if it never expires.
+    """
+    if endpoint == "scoreboardv2":
+        # Scoreboards for past dates only contain finished games
+        return FOREVER if is_past_date(parameters.get("GameDate")) else LIVE_SCOREBOARD_TTL
+    if endpoint in ("playergamelog", "playergamelogs"):
+        return FOREVER if is_past_season(parameters.get("Season")) else CURRENT_SEASON_GAME_LOG_TTL
+    if endpoint == "commonteamroster":
+        return ROSTER_TTL
+    return DEFAULT_TTL
+
+
+def make_cache_key(endpoint, parameters):
+    """
+    Builds a stable cache key from an endpoint name and its request parameters.
+
+    Values are compared as they are sent in the query string, so 1610612747 and
+    numpy.int64(1610612747) map to the same entry.
+    """
+    normalized = {key: "" if value is None else str(value) for key, value in parameters.items()}
+    return f"{endpoint}?{json.dumps(normalized, sort_keys=True)}"
+
+
+class CachedResponse:
+    """A raw endpoint response read back from the cache."""
+
+    def __init__(self, response, url, fetched_at, expires_at):
+        self.response = response
+        self.url = url
+        self.fetched_at = fetched_at
+        self.expires_at = expires_at
+
+    @property
+    def is_expired(self):
+        return self.expires_at is not None and self.expires_at <= time.time()
+
+
+class ApiCache:
+    """
+    Read-through SQLite cache for raw nba_api responses.
+
+    Entries carry an optional expiry time and are evicted least recently used
+    first once the stored bodies exceed max_bytes.
+    """
+
+    def __init__(self, db_name=CACHE_DB_NAME, max_bytes=DEFAULT_MAX_BYTES):
+        self.db_name = db_name
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.endpoint_stats = {}
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_name, check_same_thread=False)
+        self._initialize()
+
+    def _initialize(self):
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                cache_key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                url TEXT,
+                response TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                fetched_at REAL NOT NULL,
+                expires_at REAL,
+                last_access REAL NOT NULL
+            )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_last_access ON responses (last_access)")
+            self._conn.commit()
+
+    def _count(self, endpoint, outcome):
+        stats = self.endpoint_stats.setdefault(endpoint, {"hits": 0, "misses": 0})
+        stats[outcome] += 1
+        if outcome == "hits":
+            self.hits += 1
+        else:
+            self.misses += 1
+
+    def get(self, endpoint, cache_key, allow_stale=False):
+        """
+        Looks up a cached response.
+
+        Args:
+            endpoint (str): The endpoint name, used for the per-endpoint counters.
+            cache_key (str): Key built with make_cache_key.
+            allow_stale (bool): Return expired entries instead of treating them as misses.
+                Such a lookup is a fallback after a counted one, so it isn't counted again.
+
+        Returns:
+            CachedResponse or None: The cached response, or None on a miss.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response, url, fetched_at, expires_at FROM responses WHERE cache_key = ?",
+                (cache_key,)
+            ).fetchone()
+            if row is None:
+                if not allow_stale:
+                    self._count(endpoint, "misses")
+                return None
+            cached = CachedResponse(*row)
+            if cached.is_expired and not allow_stale:
+                self._count(endpoint, "misses")
+                return None
+            self._conn.execute(
+                "UPDATE responses SET last_access = ? WHERE cache_key = ?", (time.time(), cache_key)
+            )
+            self._conn.commit()
+            if not allow_stale:
+                self._count(endpoint, "hits")
+            return cached
+
+    def set(self, endpoint, cache_key, response, url=None, ttl=DEFAULT_TTL):
+        """
+        Stores a raw response and evicts old entries if the cache is over its size limit.
+
+        Args:
+            endpoint (str): The endpoint name.
+            cache_key (str): Key built with make_cache_key.
+            response (str): The raw JSON response body.
+            url (str, optional): The request URL, kept for debugging.
+            ttl (int or None): Seconds until the entry expires. None keeps it forever.
+        """
+        now = time.time()
+        expires_at = None if ttl is None else now + ttl
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(cache_key, endpoint, url, response, size, fetched_at, expires_at, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (cache_key, endpoint, url, response, len(response), now, expires_at, now)
+            )
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        total_size = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total_size <= self.max_bytes:
+            return
+        rows = self._conn.execute("SELECT cache_key, size FROM responses ORDER BY last_access ASC").fetchall()
+        for cache_key, size in rows:
+            if total_size <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM responses WHERE cache_key = ?", (cache_key,))
+            total_size -= size
+            self.evictions += 1
+        logging.info(f"Evicted cache entries, {total_size} bytes remaining.")
+
+    def clear(self):
+        """Removes every cached response."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+
+    def stats(self):
+        """
+        Returns the cache counters.
+
+        Returns:
+            dict: Hits, misses, evictions, hit ratio, entry count, stored bytes and per-endpoint counters.
+        """
+        with self._lock:
+            entries, size = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM responses"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "entries": entries,
+            "bytes": size,
+            "endpoints": {name: dict(counts) for name, counts in self.endpoint_stats.items()},
+        }
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_cache():
+    """Returns the process-wide ApiCache, creating it on first use."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            _cache = ApiCache()
+        return _cache
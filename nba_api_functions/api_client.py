@@ -0,0 +1,152 @@
+import logging
+import time
+from nba_api.stats.library.http import NBAStatsHTTP, NBAStatsResponse
+from nba_api_functions.api_cache import get_cache, make_cache_key, ttl_for
+from nba_api_functions.metrics import CACHE, NETWORK, SHARED, SNAPSHOT, STALE, get_metrics
+from nba_api_functions.resilience import (
+    DEFAULT_RETRY_POLICY, RETRYABLE_STATUS_CODES, CircuitOpenError, OfflineError, UpstreamError, call_with_retry,
+    is_retryable
+)
+from nba_api_functions.rate_limiter import get_rate_limiter
+from nba_api_functions.single_flight import SingleFlight
+from nba_api_functions.snapshot import get_snapshot, is_offline
+
+# Marker for "use the TTL from ttl_for", since None already means "never expires"
+ENDPOINT_TTL = object()
+
+_single_flight = SingleFlight()
+
+# Called with (endpoint, cache_key, response, url) for every loaded response
+_response_listeners = []
+
+
+def add_response_listener(listener):
+    """Calls listener(endpoint, cache_key, response, url) for every response loaded, e.g. to record a snapshot."""
+    _response_listeners.append(listener)
+
+
+def remove_response_listener(listener):
+    """Stops calling a listener added with add_response_listener."""
+    _response_listeners.remove(listener)
+
+
+def call_endpoint(endpoint_cls, use_cache=True, ttl=ENDPOINT_TTL, retry_policy=DEFAULT_RETRY_POLICY, **params):
+    """
+    Calls an nba_api endpoint through the shared response cache.
+
+    The endpoint is built without sending a request. On a cache hit its response is
+    loaded from the stored body. On a miss the request waits for the shared rate
+    limiter, is sent, and the body is cached with the endpoint's TTL. Concurrent
+    misses for the same endpoint and parameters share a single request.
+
+    When the app was started from a snapshot bundle (see snapshot.py), cache misses
+    are answered from it before going to the network.
+
+    Requests are retried with backoff under the shared concurrency cap and circuit
+    breaker (see resilience.py). If they still fail, or the circuit is open, an expired
+    cached response, or else the snapshot's, is served when one exists. Every call's
+    latency, response source and downloaded bytes are recorded in the metrics registry.
+
+    Args:
+        endpoint_cls (type): The nba_api endpoint class (e.g., CommonTeamRoster).
+        use_cache (bool): Set to False to always go to the network. The fresh response is still stored.
+        ttl (int or None, optional): Overrides the TTL from ttl_for. None keeps the entry forever.
+        retry_policy (RetryPolicy, optional): Attempts and backoff for network requests.
+        **params: Keyword arguments passed to the endpoint constructor.
+
+    Returns:
+        Endpoint: The loaded endpoint instance, with its data sets available as usual.
+    """
+    started = time.perf_counter()
+    try:
+        endpoint, source, response_bytes = _load_endpoint(endpoint_cls, use_cache, ttl, retry_policy, params)
+    except Exception:
+        get_metrics().record_error(endpoint_cls.endpoint)
+        raise
+    get_metrics().record_call(endpoint.endpoint, time.perf_counter() - started, source, response_bytes)
+    for listener in list(_response_listeners):
+        listener(endpoint.endpoint, make_cache_key(endpoint.endpoint, endpoint.parameters),
+                 endpoint.nba_response.get_response(), endpoint.nba_response.get_url())
+    return endpoint
+
+
+def _send_request(endpoint):
+    """Sends an endpoint's request, raising UpstreamError if stats.nba.com is throttling or failing."""
+    try:
+        endpoint.get_request()
+    except (ValueError, KeyError) as e:
+        # Throttled and failed requests come back as bodies that don't parse
+        status_code = getattr(endpoint.nba_response, "_status_code", None)
+        if status_code in RETRYABLE_STATUS_CODES:
+            raise UpstreamError(endpoint.nba_response.get_url(), status_code) from e
+        raise
+
+
+def _load_endpoint(endpoint_cls, use_cache, ttl, retry_policy, params):
+    """Loads an endpoint and reports where its response came from and how many bytes were downloaded."""
+    endpoint = endpoint_cls(get_request=False, **params)
+    cache = get_cache()
+    cache_key = make_cache_key(endpoint.endpoint, endpoint.parameters)
+
+    # An offline snapshot replaces the network, so even a forced refresh is answered from it
+    offline = is_offline()
+    if use_cache or offline:
+        cached = cache.get(endpoint.endpoint, cache_key)
+        if cached is not None:
+            endpoint.nba_response = NBAStatsResponse(response=cached.response, status_code=200, url=cached.url)
+            endpoint.load_response()
+            return endpoint, CACHE, 0
+        snapshot = get_snapshot()
+        stored = snapshot.get(cache_key) if snapshot is not None else None
+        if stored is not None:
+            endpoint.nba_response = NBAStatsResponse(response=stored.response, status_code=200, url=stored.url)
+            endpoint.load_response()
+            return endpoint, SNAPSHOT, 0
+    if offline:
+        stale = cache.get(endpoint.endpoint, cache_key, allow_stale=True)
+        if stale is None:
+            raise OfflineError(endpoint.endpoint)
+        endpoint.nba_response = NBAStatsResponse(response=stale.response, status_code=200, url=stale.url)
+        endpoint.load_response()
+        return endpoint, STALE, 0
+
+    if ttl is ENDPOINT_TTL:
+        ttl = ttl_for(endpoint.endpoint, endpoint.parameters)
+
+    def fetch():
+        call_with_retry(
+            NBAStatsHTTP.base_url,
+            lambda: _send_request(endpoint),
+            policy=retry_policy,
+            on_retry=lambda attempt, error: get_metrics().record_retry(endpoint.endpoint),
+            # Wait for the rate limiter before taking a slot, so waiting never holds one
+            acquire=get_rate_limiter().acquire
+        )
+        try:
+            cache.set(endpoint.endpoint, cache_key, endpoint.nba_response.get_response(),
+                      url=endpoint.nba_response.get_url(), ttl=ttl)
+        except Exception as e:
+            logging.warning(f"Could not cache {endpoint.endpoint} response: {e}")
+        return endpoint.nba_response
+
+    try:
+        nba_response = _single_flight.do(cache_key, fetch)
+    except Exception as e:
+        if not (isinstance(e, CircuitOpenError) or is_retryable(e)):
+            raise
+        stale = cache.get(endpoint.endpoint, cache_key, allow_stale=True)
+        if stale is None and get_snapshot() is not None:
+            stale = get_snapshot().get(cache_key)
+        if stale is None:
+            raise
+        logging.warning(f"Serving stale {endpoint.endpoint} response: {e}")
+        endpoint.nba_response = NBAStatsResponse(response=stale.response, status_code=200, url=stale.url)
+        endpoint.load_response()
+        return endpoint, STALE, 0
+    if endpoint.nba_response is not nba_response:
+        # Another caller sent the request, load its response into this endpoint
+        endpoint.nba_response = nba_response
+        endpoint.load_response()
+        return endpoint, SHARED, 0
+
+    return endpoint, NETWORK, len(nba_response.get_response().encode("utf-8"))
@@ -0,0 +1,108 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from nba_api.stats.endpoints import BoxScoreAdvancedV3, BoxScoreTraditionalV3
+from nba_api_functions.api_cache import FOREVER
+from nba_api_functions.api_client import call_endpoint
+from nba_api_functions.resilience import FETCH_ERRORS
+from nba_api_functions.rows import BoxScoreRow
+
+# A live box score changes with every play, so it is stored already expired: later opens
+# fetch it again, and it is only served as the stale fallback when stats.nba.com is down.
+# Stored this way, a box score fetched while live is never mistaken for the final one.
+LIVE_BOX_SCORE_TTL = 0
+
+# Box scores of final games by game ID. They never change again, so they are answered
+# from memory; the response cache keeps them on disk across sessions.
+_final_box_scores = {}
+_final_box_scores_lock = threading.Lock()
+
+# BoxScoreTraditionalV3 columns of the BoxScoreRow fields from PTS to PLUS_MINUS
+TRADITIONAL_COLUMNS = (
+    'points', 'reboundsTotal', 'assists', 'steals', 'blocks', 'turnovers',
+    'fieldGoalsMade', 'fieldGoalsAttempted', 'threePointersMade', 'threePointersAttempted',
+    'freeThrowsMade', 'freeThrowsAttempted', 'plusMinusPoints',
+)
+
+# BoxScoreAdvancedV3 fractions shown as percentages
+PERCENT_COLUMNS = ('trueShootingPercentage', 'usagePercentage', 'PIE')
+
+
+def _records(data_set):
+    """Returns the rows of an endpoint data set as dicts keyed by header."""
+    result_set = data_set.get_dict()
+    return [dict(zip(result_set['headers'], values)) for values in result_set['data']]
+
+
+def _box_score_row(traditional, advanced, player_id, player, position):
+    """Builds a BoxScoreRow from a player's or team's traditional and advanced rows."""
+    percentages = [
+        None if advanced.get(column) is None else round(advanced[column] * 100, 1)
+        for column in PERCENT_COLUMNS
+    ]
+    return BoxScoreRow(
+        player_id,
+        traditional['teamId'],
+        player,
+        position,
+        traditional.get('minutes') or "",
+        *[traditional.get(column) for column in TRADITIONAL_COLUMNS],
+        advanced.get('offensiveRating'),
+        advanced.get('defensiveRating'),
+        *percentages
+    )
+
+
+def _fetch_box_score(endpoint_cls, game_id, final):
+    if final:
+        return call_endpoint(endpoint_cls, ttl=FOREVER, game_id=game_id, timeout=30)
+    return call_endpoint(endpoint_cls, use_cache=False, ttl=LIVE_BOX_SCORE_TTL, game_id=game_id, timeout=30)
+
+
+def get_box_score(game_id, final=False):
+    """
+    Fetches a game's traditional and advanced box scores in parallel and joins them.
+
+    A final game's responses are cached forever and its rows kept in memory, so every
+    later open is answered locally. A live game's box score is always fetched again.
+
+    Args:
+        game_id (str): The NBA game ID (e.g., "0022400001").
+        final (bool): Whether the game is over, as given by the scoreboard's GameStatusID.
+
+    Returns:
+        dict: list[BoxScoreRow] by team ID, players in box score order followed by the team's
+            totals (PLAYER_ID None). Empty if the fetch fails or the game has not started.
+    """
+    if final:
+        with _final_box_scores_lock:
+            if game_id in _final_box_scores:
+                return _final_box_scores[game_id]
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            traditional, advanced = executor.map(
+                lambda endpoint_cls: _fetch_box_score(endpoint_cls, game_id, final),
+                (BoxScoreTraditionalV3, BoxScoreAdvancedV3)
+            )
+    except FETCH_ERRORS as e:
+        logging.error(f"Could not fetch the box score of game {game_id}: {e}")
+        return {}
+
+    advanced_players = {row['personId']: row for row in _records(advanced.player_stats)}
+    advanced_teams = {row['teamId']: row for row in _records(advanced.team_stats)}
+    box_score = {}
+    for row in _records(traditional.player_stats):
+        player = f"{row.get('firstName') or ''} {row.get('familyName') or ''}".strip()
+        box_score.setdefault(row['teamId'], []).append(
+            _box_score_row(row, advanced_players.get(row['personId'], {}), row['personId'], player,
+                           row.get('position') or "")
+        )
+    for row in _records(traditional.team_stats):
+        box_score.setdefault(row['teamId'], []).append(
+            _box_score_row(row, advanced_teams.get(row['teamId'], {}), None, "Team totals", "")
+        )
+
+    if final and box_score:
+        with _final_box_scores_lock:
+            _final_box_scores[game_id] = box_score
+    return box_score
@@ -0,0 +1,245 @@
+import csv
+import json
+import logging
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import date, datetime
+from itertools import islice
+from nba_api_functions.search_index import get_search_index
+
+# The endpoints are imported where they are first used, so main.py can add the
+# export arguments without slowing down the app's startup
+
+# Requests are spaced by the shared rate limiter, so a few workers are enough to keep it busy
+DEFAULT_MAX_WORKERS = 4
+
+ROSTERS = "rosters"
+GAME_LOGS = "gamelogs"
+SCOREBOARDS = "scoreboards"
+EXPORT_KINDS = (ROSTERS, GAME_LOGS, SCOREBOARDS)
+
+CSV = "csv"
+JSONL = "jsonl"
+EXPORT_FORMATS = (CSV, JSONL)
+
+
+def expand_seasons(values):
+    """
+    Expands season arguments into a list of seasons.
+
+    Args:
+        values (list[str]): Seasons in 'YYYY-YY' format, or ranges such as '2021-22:2024-25'.
+
+    Returns:
+        list[str]: Every season named, oldest first within a range.
+
+    Raises:
+        ValueError: A season has an invalid format.
+    """
+    from nba_api_functions.get_team_roster import resolve_season
+    seasons = []
+    for value in values:
+        first, _, last = value.partition(":")
+        first, last = resolve_season(first), resolve_season(last or first)
+        if first is None or last is None:
+            raise ValueError(f"Invalid season '{value}'. Please use 'YYYY-YY' or 'YYYY-YY:YYYY-YY'.")
+        seasons.extend(
+            f"{year}-{str(year + 1)[-2:]}" for year in range(int(first[:4]), int(last[:4]) + 1)
+        )
+    return seasons
+
+
+def stream_results(fetch, items, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Runs fetch over items concurrently and yields results as they finish.
+
+    At most max_workers calls are in flight and finished results are handed over
+    immediately, so memory stays bounded however many items there are. Failed calls
+    are logged and skipped.
+
+    Args:
+        fetch (callable): Called with one item, returns that item's records.
+        items (iterable): The work, consumed lazily.
+        max_workers (int): Maximum number of calls at the same time.
+
+    Yields:
+        tuple: (item, records) in completion order.
+    """
+    from nba_api_functions.resilience import FETCH_ERRORS
+    items = iter(items)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending = {executor.submit(fetch, item): item for item in islice(items, max_workers)}
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                item = pending.pop(future)
+                for next_item in islice(items, 1):
+                    pending[executor.submit(fetch, next_item)] = next_item
+                try:
+                    records = future.result()
+                except FETCH_ERRORS as e:
+                    logging.error(f"Export of {item} failed: {e}")
+                    continue
+                yield item, records
+
+
+def _json_default(value):
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+class RecordWriter:
+    """Writes records (dicts) to a stream as CSV or JSON lines, one batch at a time."""
+
+    def __init__(self, stream, export_format=CSV):
+        self.stream = stream
+        self.export_format = export_format
+        self.records_written = 0
+        self._csv_writer = None
+
+    def write_batch(self, records):
+        """Writes records and flushes them, so readers of the stream see each batch as it arrives."""
+        for record in records:
+            if self.export_format == JSONL:
+                self.stream.write(json.dumps(record, default=_json_default) + "\n")
+            else:
+                if self._csv_writer is None:
+                    # The first record decides the columns, later ones with other keys are aligned to them
+                    self._csv_writer = csv.DictWriter(self.stream, fieldnames=list(record), extrasaction="ignore")
+                    self._csv_writer.writeheader()
+                self._csv_writer.writerow(record)
+            self.records_written += 1
+        self.stream.flush()
+
+
+def _roster_records(team_season):
+    from nba_api_functions.get_team_roster import get_team_roster_rows_by_id
+    team_id, season = team_season
+    team = get_search_index().teams_by_id[team_id]
+    return [
+        {"SEASON": season, **row._replace(TEAM_ABBREVIATION=team['abbreviation'], TEAM_NAME=team['full_name'])._asdict()}
+        for row in get_team_roster_rows_by_id(team_id, season, team['full_name'])
+    ]
+
+
+def _game_log_fetcher(start=None, end=None):
+    from nba_api.stats.endpoints import PlayerGameLogs
+    from nba_api_functions.api_client import call_endpoint
+    dates = {}
+    if start is not None:
+        dates['date_from_nullable'] = start.strftime('%m/%d/%Y')
+    if end is not None:
+        dates['date_to_nullable'] = end.strftime('%m/%d/%Y')
+
+    def fetch(team_season):
+        team_id, season = team_season
+        return call_endpoint(
+            PlayerGameLogs,
+            season_nullable=season,
+            team_id_nullable=team_id or "",
+            timeout=60,
+            **dates
+        ).get_normalized_dict()['PlayerGameLogs']
+    return fetch
+
+
+def _scoreboard_records(game_date):
+    from nba_api_functions.get_games import get_game_rows_for_date
+    return [row._asdict() for row in get_game_rows_for_date(game_date)]
+
+
+def export(kind, stream, export_format=CSV, team_ids=None, seasons=None, start=None, end=None,
+           max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Fetches rosters, game logs or scoreboards concurrently and streams them to a file.
+
+    Args:
+        kind (str): ROSTERS, GAME_LOGS or SCOREBOARDS.
+        stream: A text stream to write to.
+        export_format (str): CSV or JSONL.
+        team_ids (list[int], optional): Teams to export. Rosters default to every team,
+            game logs to the whole league in one request per season.
+        seasons (list[str], optional): Seasons for rosters and game logs. Defaults to the current season.
+        start (date, optional): First game date. Required for scoreboards, filters game logs.
+        end (date, optional): Last game date. Defaults to start for scoreboards, filters game logs.
+        max_workers (int): Maximum number of requests at the same time.
+
+    Returns:
+        int: Number of records written. Records appear in the order their requests finish.
+    """
+    from nba_api_functions.get_games import date_range
+    from nba_api_functions.get_team_roster import resolve_season
+    if kind in (ROSTERS, GAME_LOGS):
+        seasons = seasons or [resolve_season()]
+    if kind == ROSTERS:
+        team_ids = team_ids or list(get_search_index().teams_by_id)
+        fetch, items = _roster_records, ((team_id, season) for season in seasons for team_id in team_ids)
+    elif kind == GAME_LOGS:
+        # Without teams, one league-wide request per season
+        items = ((team_id, season) for season in seasons for team_id in team_ids or [None])
+        fetch = _game_log_fetcher(start, end)
+    elif kind == SCOREBOARDS:
+        if start is None:
+            raise ValueError("Scoreboard exports need a start date.")
+        fetch, items = _scoreboard_records, date_range(start, end or start)
+    else:
+        raise ValueError(f"Unknown export '{kind}'. Choose from {', '.join(EXPORT_KINDS)}.")
+
+    writer = RecordWriter(stream, export_format)
+    for item, records in stream_results(fetch, items, max_workers):
+        writer.write_batch(records)
+        logging.info(f"Exported {len(records)} records for {item}.")
+    return writer.records_written
+
+
+def add_export_arguments(parser):
+    """Adds the `export` command's arguments to an argparse parser."""
+    parser.add_argument("kind", choices=EXPORT_KINDS, help="What to export")
+    parser.add_argument("--team", action="append", dest="teams", metavar="TEAM",
+                        help="Team name, abbreviation or ID. Repeat for several teams (default: all)")
+    parser.add_argument("--season", action="append", dest="seasons", metavar="SEASON",
+                        help="Season such as 2024-25, or a range such as 2021-22:2024-25. Repeatable")
+    parser.add_argument("--start", type=date.fromisoformat, metavar="YYYY-MM-DD", help="First game date")
+    parser.add_argument("--end", type=date.fromisoformat, metavar="YYYY-MM-DD", help="Last game date")
+    parser.add_argument("--format", choices=EXPORT_FORMATS, dest="export_format",
+                        help="Output format (default: from the output file's extension, else csv)")
+    parser.add_argument("-o", "--output", default="-", help="Output file (default: stdout)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help=f"Concurrent requests (default: {DEFAULT_MAX_WORKERS})")
+
+
+def run_export(args):
+    """
+    Runs the `export` command.
+
+    Logs go to stderr, so the records can be piped from stdout.
+
+    Returns:
+        int: The process exit code.
+    """
+    team_ids = []
+    for team in args.teams or []:
+        team_info = get_search_index().find_team(team)
+        if team_info is None:
+            logging.error(f"Team '{team}' not found.")
+            return 2
+        team_ids.append(team_info['id'])
+    try:
+        seasons = expand_seasons(args.seasons or [])
+    except ValueError as e:
+        logging.error(e)
+        return 2
+
+    export_format = args.export_format or (JSONL if args.output.endswith((".jsonl", ".ndjson")) else CSV)
+    stream = sys.stdout if args.output == "-" else open(args.output, "w", newline="")
+    try:
+        written = export(args.kind, stream, export_format, team_ids, seasons, args.start, args.end, args.workers)
+    except ValueError as e:
+        logging.error(e)
+        return 2
+    finally:
+        if stream is not sys.stdout:
+            stream.close()
+    logging.info(f"Exported {written} {args.kind} records.")
+    return 0
@@ -0,0 +1,339 @@
+import sqlite3
+import threading
+import time
+import json
+from nba_api_functions.api_cache import CURRENT_SEASON_GAME_LOG_TTL, is_final_sync
+from nba_api_functions.search_index import get_search_index
+
+
+GAME_LOG_DB_NAME = "nba_game_logs.db"
+
+
+def opponent_abbreviation(matchup):
+    """
+    Returns the opponent's abbreviation from a MATCHUP value.
+
+    Args:
+        matchup (str): A matchup such as "SAC vs. MIN" or "SAC @ MIN".
+
+    Returns:
+        str: The opponent abbreviation (e.g., "MIN").
+    """
+    return matchup.split()[-1] if matchup else ""
+
+
+class GameLogStore:
+    """
+    Local SQLite store of player game logs.
+
+    Rows are keyed by (player_id, game_id) and indexed by (player_id, opponent_team_id, season)
+    so head-to-head queries never need the network. The store remembers which
+    (player, season) pairs have been synced, and for league-wide ingestion the last
+    game date stored per season; a season synced after it was over never needs syncing again.
+    """
+
+    def __init__(self, db_name=GAME_LOG_DB_NAME):
+        self.db_name = db_name
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_name, check_same_thread=False)
+        self._initialize()
+
+    def _initialize(self):
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS player_game_logs (
+                player_id INTEGER NOT NULL,
+                game_id TEXT NOT NULL,
+                season TEXT NOT NULL,
+                team_id INTEGER,
+                opponent_team_id INTEGER,
+                game_date TEXT NOT NULL,
+                matchup TEXT,
+                data TEXT NOT NULL,
+                PRIMARY KEY (player_id, game_id)
+            )
+            """)
+            self._conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_player_game_logs_h2h
+            ON player_game_logs (player_id, opponent_team_id, season, game_date)
+            """)
+            self._conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_player_game_logs_player_date
+            ON player_game_logs (player_id, game_date)
+            """)
+            self._conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_player_game_logs_team
+            ON player_game_logs (team_id, season)
+            """)
+            self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS synced_league_seasons (
+                season TEXT PRIMARY KEY,
+                last_game_date TEXT,
+                synced_at REAL NOT NULL
+            )
+            """)
+            self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS synced_player_seasons (
+                player_id INTEGER NOT NULL,
+                season TEXT NOT NULL,
+                synced_at REAL NOT NULL,
+                PRIMARY KEY (player_id, season)
+            )
+            """)
+            self._conn.commit()
+
+    def add_game_logs(self, season, rows):
+        """
+        Inserts or replaces game log rows.
+
+        Args:
+            season (str): The season the rows belong to (e.g., "2024-25").
+            rows (list[dict]): Normalized PlayerGameLogs rows.
+
+        Returns:
+            int: Number of rows written.
+        """
+        teams_by_abbreviation = get_search_index().teams_by_abbreviation
+        records = []
+        for row in rows:
+            opponent = teams_by_abbreviation.get(opponent_abbreviation(row.get('MATCHUP')).lower())
+            records.append((
+                row['PLAYER_ID'],
+                row['GAME_ID'],
+                season,
+                row.get('TEAM_ID'),
+                opponent['id'] if opponent else None,
+                str(row['GAME_DATE'])[:10],
+                row.get('MATCHUP'),
+                json.dumps(row),
+            ))
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO player_game_logs "
+                "(player_id, game_id, season, team_id, opponent_team_id, game_date, matchup, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                records
+            )
+            self._conn.commit()
+        return len(records)
+
+    def mark_synced(self, player_id, season):
+        """Records that every game of a player's season has been stored."""
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO synced_player_seasons (player_id, season, synced_at) VALUES (?, ?, ?)",
+                (player_id, season, time.time())
+            )
+            self._conn.commit()
+
+    def is_synced(self, player_id, season):
+        """
+        Returns True if a player's season is stored and still fresh.
+
+        A season synced after it was over stays fresh forever. The current season, or
+        a past one last synced while it was being played, is refreshed after
+        CURRENT_SEASON_GAME_LOG_TTL seconds so new games are picked up.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT synced_at FROM synced_player_seasons WHERE player_id = ? AND season = ?",
+                (player_id, season)
+            ).fetchone()
+        if row is None:
+            return False
+        return is_final_sync(season, row[0]) or time.time() - row[0] < CURRENT_SEASON_GAME_LOG_TTL
+
+    def mark_league_synced(self, season, last_game_date):
+        """
+        Records that every game of a season up to last_game_date has been stored.
+
+        Args:
+            season (str): The season (e.g., "2024-25").
+            last_game_date (str or None): Latest stored game date as 'YYYY-MM-DD', None if no games were played yet.
+        """
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO synced_league_seasons (season, last_game_date, synced_at) VALUES (?, ?, ?)",
+                (season, last_game_date, time.time())
+            )
+            self._conn.commit()
+
+    def league_sync_state(self, season):
+        """
+        Returns how far a season's league-wide game logs have been stored.
+
+        Returns:
+            tuple or None: (last_game_date, synced_at), or None if the season was never ingested.
+        """
+        with self._lock:
+            return self._conn.execute(
+                "SELECT last_game_date, synced_at FROM synced_league_seasons WHERE season = ?",
+                (season,)
+            ).fetchone()
+
+    def is_league_synced(self, season):
+        """
+        Returns True if every player's games of a season are stored and still fresh.
+
+        A season synced after it was over stays fresh forever. Otherwise, including a
+        past season last synced while it was still being played, the sync is fresh for
+        CURRENT_SEASON_GAME_LOG_TTL seconds, after which one more incremental sync picks
+        up the remaining games.
+        """
+        state = self.league_sync_state(season)
+        if state is None:
+            return False
+        return is_final_sync(season, state[1]) or time.time() - state[1] < CURRENT_SEASON_GAME_LOG_TTL
+
+    def recent_games(self, player_id, season, limit=None):
+        """
+        Returns a player's games of one season, newest first.
+
+        Args:
+            player_id (int): The NBA player ID.
+            season (str): The season (e.g., "2024-25").
+            limit (int, optional): Maximum number of games.
+
+        Returns:
+            list[dict]: The stored PlayerGameLogs rows.
+        """
+        query = "SELECT data FROM player_game_logs WHERE player_id = ? AND season = ? ORDER BY game_date DESC"
+        params = [player_id, season]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def _player_filter(self, player_id, seasons):
+        """Returns the WHERE clause and parameters selecting a player's games of some seasons, or all of them."""
+        if seasons is None:
+            return "WHERE player_id = ?", [player_id]
+        placeholders = ", ".join("?" for _ in seasons)
+        return f"WHERE player_id = ? AND season IN ({placeholders})", [player_id, *seasons]
+
+    def count_player_games(self, player_id, seasons=None):
+        """
+        Returns how many games of a player are stored.
+
+        Args:
+            player_id (int): The NBA player ID.
+            seasons (list[str], optional): Seasons to include. Defaults to every stored season.
+
+        Returns:
+            int: Number of stored games.
+        """
+        where, params = self._player_filter(player_id, seasons)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM player_game_logs {where}", params).fetchone()[0]
+
+    def player_games_page(self, player_id, seasons=None, offset=0, limit=100):
+        """
+        Returns one page of a player's games, newest first.
+
+        Args:
+            player_id (int): The NBA player ID.
+            seasons (list[str], optional): Seasons to include. Defaults to every stored season.
+            offset (int): Number of newer games to skip.
+            limit (int): Maximum number of games.
+
+        Returns:
+            list[dict]: The stored PlayerGameLogs rows.
+        """
+        where, params = self._player_filter(player_id, seasons)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT data FROM player_game_logs {where} ORDER BY game_date DESC, game_id DESC LIMIT ? OFFSET ?",
+                [*params, limit, offset]
+            ).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def team_games(self, team_id, season):
+        """
+        Returns every stored game of a team's players in one season.
+
+        Args:
+            team_id (int): The NBA team ID.
+            season (str): The season (e.g., "2024-25").
+
+        Returns:
+            list[dict]: The stored PlayerGameLogs rows, in no particular order.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM player_game_logs WHERE team_id = ? AND season = ?",
+                (team_id, season)
+            ).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def head_to_head(self, player_id, opponent_team_id, seasons, limit=None):
+        """
+        Returns a player's games against one opponent, newest first.
+
+        Args:
+            player_id (int): The NBA player ID.
+            opponent_team_id (int): The opponent's NBA team ID.
+            seasons (list[str]): Seasons to include (e.g., ["2024-25", "2023-24"]).
+            limit (int, optional): Maximum number of games.
+
+        Returns:
+            list[dict]: The stored PlayerGameLogs rows.
+        """
+        placeholders = ", ".join("?" for _ in seasons)
+        query = (
+            "SELECT data FROM player_game_logs "
+            f"WHERE player_id = ? AND opponent_team_id = ? AND season IN ({placeholders}) "
+            "ORDER BY game_date DESC"
+        )
+        params = [player_id, opponent_team_id, *seasons]
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def matchup_games(self, player_ids_by_opponent, seasons):
+        """
+        Returns the games of several groups of players against one opponent each, in one query.
+
+        Args:
+            player_ids_by_opponent (dict): list of NBA player IDs by opponent team ID,
+                e.g. each side's roster by the other side's team ID.
+            seasons (list[str]): Seasons to include (e.g., ["2024-25", "2023-24"]).
+
+        Returns:
+            list[dict]: The stored PlayerGameLogs rows, in no particular order.
+        """
+        groups = [(opponent, player_ids) for opponent, player_ids in player_ids_by_opponent.items() if player_ids]
+        if not groups or not seasons:
+            return []
+        conditions = " OR ".join(
+            f"(opponent_team_id = ? AND player_id IN ({', '.join('?' for _ in player_ids)}))"
+            for _, player_ids in groups
+        )
+        query = (
+            "SELECT data FROM player_game_logs "
+            f"WHERE season IN ({', '.join('?' for _ in seasons)}) AND ({conditions})"
+        )
+        params = [*seasons]
+        for opponent, player_ids in groups:
+            params += [opponent, *player_ids]
+        with self._lock:
+            rows = self._conn.execute(query, params).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+
+_store = None
+_store_lock = threading.Lock()
+
+
+def get_game_log_store():
+    """Returns the process-wide GameLogStore, creating it on first use."""
+    global _store
+    with _store_lock:
+        if _store is None:
+            _store = GameLogStore()
+        return _store
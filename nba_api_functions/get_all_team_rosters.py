@@ -1,53 +1,122 @@
-from get_all_nba_teams import get_all_nba_teams
-from get_team_roster import get_team_roster
-import pandas as pd
-from datetime import date, timedelta
-from nba_api.stats.endpoints import CommonTeamRoster
-from nba_api.stats.static import teams
-import warnings
-import re
+from nba_api_functions.get_team_roster import get_team_roster_rows_by_id, resolve_season
+from nba_api_functions.rows import RosterRow, to_data_frame
+from nba_api_functions.search_index import get_search_index
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
+# Requests are spaced by the shared rate limiter, so a few workers are enough to keep it busy
+DEFAULT_MAX_WORKERS = 4
+
+
+def get_all_team_roster_rows(season=None, max_workers=DEFAULT_MAX_WORKERS, on_team_loaded=None):
+    """
+    Retrieves the rosters of all NBA teams concurrently as lightweight rows.
+
+    Requests run on a bounded thread pool and go through the shared cache and rate
+    limiter, so a warm cache answers the whole sweep without touching the network.
+
+    Args:
+        season (str, optional): The NBA season in the format "YYYY-YY" (e.g., "2023-24").
+                                If not provided, defaults to the latest season.
+        max_workers (int): Maximum number of rosters fetched at the same time. Default is 4.
+        on_team_loaded (callable, optional): Called with (team_id, roster_rows) as each roster arrives.
+
+    Returns:
+        list[RosterRow]: Every team's players with TEAM_ID, TEAM_ABBREVIATION and TEAM_NAME set.
+                         Empty if nothing could be fetched.
+    """
+    teams_by_id = get_search_index().teams_by_id
+
+    if not teams_by_id:
+        logging.error("No team data available to retrieve rosters.")
+        return []
+
+    season = resolve_season(season)
+    if season is None:
+        return []
+
+    league_rows = []
+    teams_loaded = 0
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(get_team_roster_rows_by_id, team_id, season, team['full_name']): team_id
+            for team_id, team in teams_by_id.items()
+        }
+        for future in as_completed(futures):
+            team_id = futures[future]
+            team = teams_by_id[team_id]
+            try:
+                roster_rows = future.result()
+            except Exception as e:
+                logging.error(f"Roster fetch failed for {team['full_name']}: {e}")
+                continue
+
+            if not roster_rows:
+                continue
+
+            roster_rows = [
+                row._replace(TEAM_ID=team_id, TEAM_ABBREVIATION=team['abbreviation'], TEAM_NAME=team['full_name'])
+                for row in roster_rows
+            ]
+            league_rows.extend(roster_rows)
+            teams_loaded += 1
+            if on_team_loaded is not None:
+                on_team_loaded(team_id, roster_rows)
+
+    logging.info(f"Fetched {teams_loaded} of {len(teams_by_id)} team rosters for {season}.")
+    return league_rows
+
+
+def get_all_team_rosters(season=None, max_workers=DEFAULT_MAX_WORKERS, on_team_loaded=None):
+    """
+    Retrieves the rosters of all NBA teams concurrently.
+
+    Args:
+        season (str, optional): The NBA season in the format "YYYY-YY" (e.g., "2023-24").
+                                If not provided, defaults to the latest season.
+        max_workers (int): Maximum number of rosters fetched at the same time. Default is 4.
+        on_team_loaded (callable, optional): Called with (team_id, roster_df) as each roster arrives.
+
+    Returns:
+        pd.DataFrame: All rosters in one DataFrame with TEAM_ID, TEAM_ABBREVIATION and TEAM_NAME
+                      columns added to the usual roster columns. Empty if nothing could be fetched.
+    """
+    on_rows_loaded = None
+    if on_team_loaded is not None:
+        on_rows_loaded = lambda team_id, roster_rows: on_team_loaded(team_id, to_data_frame(roster_rows, RosterRow))
+    return to_data_frame(get_all_team_roster_rows(season, max_workers, on_rows_loaded), RosterRow)
+
 
 def print_all_team_rosters(season=None):
     """
     Retrieves and prints the rosters of all NBA teams for a specified season.
-    
+
     Args:
-        season (str, optional): The NBA season in the format "YYYY-YY" (e.g., "2023-24"). 
+        season (str, optional): The NBA season in the format "YYYY-YY" (e.g., "2023-24").
                                 If not provided, defaults to the latest season.
-    
+
     Returns:
         None
     """
     try:
-        # Step 1: Retrieve all NBA teams
-        all_teams_df = get_all_nba_teams()
-        
-        if all_teams_df.empty:
-            logging.error("No team data available to retrieve rosters.")
+        league_df = get_all_team_rosters(season)
+
+        if league_df.empty:
+            logging.error("No roster data available.")
             return
-        
-        # Step 2: Iterate over each team and fetch roster
-        for index, team in all_teams_df.iterrows():
-            team_name = team['FullName']
-            team_abbreviation = team['Abbreviation']
-            
-            logging.info(f"Processing roster for {team_name} ({team_abbreviation})")
-            
-            # Fetch the roster for the team
-            roster_df = get_team_roster(team_abbreviation, season)
-            
-            if not roster_df.empty:
-                print(f"\n=== {team_name} Roster ({season or 'Latest Season'}) ===")
-                print(roster_df.to_string(index=False))
-            else:
-                print(f"\n=== {team_name} Roster ({season or 'Latest Season'}) ===")
-                print("No roster data found.")
-        
+
+        for team_name, roster_df in league_df.groupby('TEAM_NAME', sort=True):
+            print(f"\n=== {team_name} Roster ({season or 'Latest Season'}) ===")
+            print(roster_df.drop(columns=['TEAM_ID', 'TEAM_ABBREVIATION', 'TEAM_NAME']).to_string(index=False))
+
         logging.info("Completed fetching all team rosters.")
-    
+
     except Exception as e:
         logging.error(f"An error occurred while printing all team rosters: {e}")
+
+
+if __name__ == "__main__":
+    print_all_team_rosters()
@@ -0,0 +1,146 @@
+import logging
+import threading
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import date, datetime, timedelta
+from nba_api.stats.endpoints import scoreboardv2
+from nba_api_functions.api_cache import FOREVER, get_cache, make_cache_key
+from nba_api_functions.api_client import call_endpoint
+from nba_api_functions.live_scoreboard import FINAL
+from nba_api_functions.resilience import FETCH_ERRORS
+from nba_api_functions.rows import GameRow
+from nba_api_functions.search_index import get_search_index
+
+# Requests are spaced by the shared rate limiter, so a few workers are enough to keep it busy
+DEFAULT_MAX_WORKERS = 4
+
+# Games of settled dates, whose games are all final or that passed without games, by date.
+# They never change again, so they are answered from memory; the response cache keeps
+# them on disk across sessions.
+_finished_games = {}
+_finished_games_lock = threading.Lock()
+
+
+def date_range(start, end):
+    """Returns every date from start to end, both included."""
+    return [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+
+@lru_cache(maxsize=None)
+def _team_names():
+    """Returns the full team name by team ID, built once from the search index."""
+    return {team_id: team['full_name'] for team_id, team in get_search_index().teams_by_id.items()}
+
+
+def get_game_rows_for_date(game_date, use_cache=True):
+    """
+    Fetches the NBA games of one date as lightweight rows.
+
+    Args:
+        game_date (date): The day of the scoreboard.
+        use_cache (bool): Set to False to bypass the cached scoreboard, e.g. when polling live scores.
+
+    Returns:
+        list[GameRow]: One row per game in scoreboard order. GameStatusID is 1 before tip-off,
+                       2 while live and 3 once final. Scores are None before tip-off.
+                       Empty if there's an error or no games are scheduled.
+    """
+    if use_cache:
+        with _finished_games_lock:
+            if game_date in _finished_games:
+                return _finished_games[game_date]
+    try:
+        # Fetch the scoreboard using ScoreboardV2, which takes the date as MM/DD/YYYY
+        sb = call_endpoint(
+            scoreboardv2.ScoreboardV2,
+            use_cache=use_cache,
+            game_date=game_date.strftime('%m/%d/%Y'),
+            timeout=10
+        )
+    except FETCH_ERRORS as e:
+        logging.error(f"Could not fetch the scoreboard for {game_date}: {e}")
+        return []
+
+    game_header = sb.game_header.get_dict()
+    rows = game_header['data']
+    if rows:
+        # Map whole columns at once rather than looking teams up game by game
+        columns = dict(zip(game_header['headers'], zip(*rows)))
+        team_names = _team_names()
+        line_score = sb.line_score.get_dict()
+        line_columns = dict(zip(line_score['headers'], zip(*line_score['data']))) if line_score['data'] else {}
+        points = dict(zip(
+            zip(line_columns.get('GAME_ID', ()), line_columns.get('TEAM_ID', ())),
+            line_columns.get('PTS', ())
+        ))
+        games = [
+            GameRow(*values) for values in zip(
+                columns['GAME_ID'],
+                [datetime.fromisoformat(game_date_est[:10]).date() for game_date_est in columns['GAME_DATE_EST']],
+                columns['ARENA_NAME'],
+                map(team_names.get, columns['HOME_TEAM_ID']),
+                map(team_names.get, columns['VISITOR_TEAM_ID']),
+                columns['GAME_STATUS_TEXT'],
+                columns['GAME_STATUS_ID'],
+                columns['LIVE_PERIOD'],
+                map(points.get, zip(columns['GAME_ID'], columns['HOME_TEAM_ID'])),
+                map(points.get, zip(columns['GAME_ID'], columns['VISITOR_TEAM_ID'])),
+            )
+        ]
+    else:
+        logging.info(f"No games found for {game_date}.")
+        games = []
+
+    # A date is settled once all its games are final, or it passed without games
+    if all(game.GameStatusID == FINAL for game in games) if games else game_date < date.today():
+        with _finished_games_lock:
+            _finished_games[game_date] = games
+        if game_date >= date.today():
+            # Past dates are cached forever already, today's scoreboard only briefly while games are on
+            get_cache().set(
+                sb.endpoint, make_cache_key(sb.endpoint, sb.parameters), sb.nba_response.get_response(),
+                url=sb.nba_response.get_url(), ttl=FOREVER
+            )
+    return games
+
+
+def get_games(start, end=None, use_cache=True, max_workers=DEFAULT_MAX_WORKERS, on_date_loaded=None,
+              should_cancel=None, exclude=()):
+    """
+    Fetches the games of every date from start to end concurrently.
+
+    Requests run on a bounded thread pool behind the shared rate limiter. Settled
+    dates already fetched are answered from memory without a request.
+
+    Args:
+        start (date): The first day.
+        end (date, optional): The last day, included. Defaults to start.
+        use_cache (bool): Set to False to bypass the cached scoreboards.
+        max_workers (int): Maximum number of dates fetched at the same time.
+        on_date_loaded (callable, optional): Called with (game_date, games) as each date arrives.
+        should_cancel (callable, optional): Returns True once the caller no longer needs the result.
+            Checked before each date's request is sent.
+        exclude (collection of date, optional): Dates not to fetch, e.g. ones the caller already loaded.
+
+    Returns:
+        dict: list[GameRow] by date, in date order. Dates that could not be fetched have no games,
+              excluded dates and dates skipped after cancelling are left out.
+    """
+    dates = [game_date for game_date in date_range(start, end or start) if game_date not in exclude]
+
+    def fetch(game_date):
+        if should_cancel is not None and should_cancel():
+            return None
+        return get_game_rows_for_date(game_date, use_cache)
+
+    games_by_date = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fetch, game_date): game_date for game_date in dates}
+        for future in as_completed(futures):
+            game_date, games = futures[future], future.result()
+            if games is None:
+                continue
+            games_by_date[game_date] = games
+            if on_date_loaded is not None:
+                on_date_loaded(game_date, games)
+    return {game_date: games_by_date[game_date] for game_date in dates if game_date in games_by_date}
@@ -1,114 +1,138 @@
-import pandas as pd
-from datetime import date, timedelta
+from datetime import date
 from nba_api.stats.endpoints import CommonTeamRoster
-from nba_api.stats.static import teams
 import warnings
 import re
 import logging
-from nba_api_functions.get_all_nba_teams import get_all_nba_teams
+from nba_api_functions.search_index import get_search_index
+from nba_api_functions.api_client import call_endpoint
+from nba_api_functions.resilience import FETCH_ERRORS
+from nba_api_functions.rows import RosterRow, rows_from_data_set, to_data_frame
 
+# Columns of the single-team roster DataFrames
+ROSTER_FIELDS = [
+    'PLAYER', 'NUM', 'POSITION', 'HEIGHT', 'WEIGHT',
+    'BIRTH_DATE', 'AGE', 'EXP', 'SCHOOL', 'PLAYER_ID'
+]
 
-def get_team_roster(team, season=None):
+
+def resolve_season(season=None):
     """
-    Retrieves the roster of players for a specified NBA team and season.
+    Returns the season to request, defaulting to the latest season.
+    
+    Args:
+        season (str, optional): The NBA season in the format "YYYY-YY" (e.g., "2023-24").
+    
+    Returns:
+        str or None: The season string, or None if the given season has an invalid format.
+    """
+    if not season:
+        today = date.today()
+        year = today.year
+        month = today.month
+        # NBA season typically starts in October
+        if month >= 10:
+            season_start_year = year
+        else:
+            season_start_year = year - 1
+        season = f"{season_start_year}-{str(season_start_year + 1)[-2:]}"
+        logging.info(f"No season provided. Defaulting to the latest season: {season}")
+        return season
+    # Validate season format
+    if not re.match(r'^\d{4}-\d{2}$', season):
+        logging.error("Invalid season format. Please use 'YYYY-YY' (e.g., '2023-24').")
+        return None
+    return season
+
+
+def get_team_roster_rows(team, season=None):
+    """
+    Retrieves the roster of players for a specified NBA team and season as lightweight rows.
     
     Args:
         team (str): The name or abbreviation of the NBA team (e.g., "Los Angeles Lakers" or "LAL").
         season (str, optional): The NBA season in the format "YYYY-YY" (e.g., "2023-24"). Defaults to the latest season.
     
     Returns:
-        pd.DataFrame: DataFrame containing player details such as PLAYER, NUM, POSITION, HEIGHT, WEIGHT, BIRTH_DATE, AGE, EXP, SCHOOL, PLAYER_ID.
+        list[RosterRow]: One row per player. Empty if the team is unknown or the fetch fails.
     """
     try:
         # Suppress warnings from nba_api
         warnings.filterwarnings("ignore")
         
-        # Step 1: Retrieve all NBA teams
-        all_teams_df = get_all_nba_teams()
+        # Step 1: Match the team by ID, abbreviation or full name through the search index
+        team_info = get_search_index().find_team(team.strip())
         
-        if all_teams_df.empty:
-            logging.error("No team data available to map the team name or abbreviation.")
-            return pd.DataFrame()
-        
-        # Step 2: Normalize team input for matching
-        team_input = team.strip().lower()
-        
-        # Attempt to match by FullName or Abbreviation
-        matched_team = all_teams_df[
-            (all_teams_df['FullName'].str.lower() == team_input) |
-            (all_teams_df['Abbreviation'].str.lower() == team_input)
-        ]
-        
-        if matched_team.empty:
+        if team_info is None:
             logging.error(f"Team '{team}' not found. Please check the team name or abbreviation.")
-            return pd.DataFrame()
+            return []
         
-        # If multiple matches found, select the first one
-        team_info = matched_team.iloc[0]
-        team_id = team_info['TeamID']
-        team_full_name = team_info['FullName']
-        team_abbreviation = team_info['Abbreviation']
+        return get_team_roster_rows_by_id(team_info['id'], season, team_info['full_name'])
+    
+    except FETCH_ERRORS as e:
+        logging.error(f"Could not fetch the team roster: {e}")
+        return []
+
+
+def get_team_roster_rows_by_id(team_id, season=None, team_full_name=None):
+    """
+    Retrieves the roster of players for an NBA team ID and season as lightweight rows.
+    
+    Args:
+        team_id (int): The NBA team ID (e.g., 1610612747).
+        season (str, optional): The NBA season in the format "YYYY-YY" (e.g., "2023-24"). Defaults to the latest season.
+        team_full_name (str, optional): Team name used in log messages.
+    
+    Returns:
+        list[RosterRow]: One row per player, with TEAM_ID set. Empty if the fetch fails.
+    """
+    try:
+        # Suppress warnings from nba_api
+        warnings.filterwarnings("ignore")
         
-        logging.info(f"Fetching roster for Team: {team_full_name} (ID: {team_id}, Abbreviation: {team_abbreviation})")
+        team_full_name = team_full_name or str(team_id)
+        logging.info(f"Fetching roster for Team: {team_full_name} (ID: {team_id})")
         
-        # Step 3: Determine the season if not provided
-        if not season:
-            today = date.today()
-            year = today.year
-            month = today.month
-            # NBA season typically starts in October
-            if month >= 10:
-                season_start_year = year
-            else:
-                season_start_year = year - 1
-            season = f"{season_start_year}-{str(season_start_year + 1)[-2:]}"
-            logging.info(f"No season provided. Defaulting to the latest season: {season}")
-        else:
-            # Validate season format
-            if not re.match(r'^\d{4}-\d{2}$', season):
-                logging.error("Invalid season format. Please use 'YYYY-YY' (e.g., '2023-24').")
-                return pd.DataFrame()
+        # Step 2: Determine the season if not provided
+        season = resolve_season(season)
+        if season is None:
+            return []
         
-        # Step 4: Fetch the team roster using CommonTeamRoster
-        roster = CommonTeamRoster(
+        # Step 3: Fetch the team roster using CommonTeamRoster
+        roster = call_endpoint(
+            CommonTeamRoster,
             team_id=team_id,
             season=season,
             timeout=10
         )
         
-        # Step 5: Extract the roster data
-        roster_df = roster.common_team_roster.get_data_frame()
-        
-        if roster_df.empty:
-            logging.info(f"No roster data found for Team '{team_full_name}' in Season '{season}'.")
-            return pd.DataFrame()
-        
-        # Step 6: Clean and format the roster DataFrame
-        # Rename columns for clarity if needed
-        # (Assuming columns are already appropriately named)
-        
-        # Optionally, select specific columns
-        desired_columns = [
-            'PLAYER', 'NUM', 'POSITION', 'HEIGHT', 'WEIGHT',
-            'BIRTH_DATE', 'AGE', 'EXP', 'SCHOOL', 'PLAYER_ID'
+        # Step 4: Build rows straight from the result set
+        roster_rows = [
+            row._replace(TEAM_ID=team_id)
+            for row in rows_from_data_set(roster.common_team_roster, RosterRow)
         ]
         
-        # Check if all desired columns are present
-        missing_cols = [col for col in desired_columns if col not in roster_df.columns]
-        if missing_cols:
-            logging.warning(f"Missing columns in roster data: {missing_cols}")
-            # Proceed with available columns
-            desired_columns = [col for col in desired_columns if col in roster_df.columns]
-        
-        roster_df = roster_df[desired_columns]
-        
-        # Reset index for cleanliness
-        roster_df.reset_index(drop=True, inplace=True)
+        if not roster_rows:
+            logging.info(f"No roster data found for Team '{team_full_name}' in Season '{season}'.")
+            return []
         
         logging.info(f"Retrieved roster for Team '{team_full_name}' in Season '{season}'.")
         
-        return roster_df
+        return roster_rows
     
-    except Exception as e:
-        logging.error(f"An error occurred while fetching the team roster: {e}")
-        return pd.DataFrame()
+    except FETCH_ERRORS as e:
+        logging.error(f"Could not fetch the team roster: {e}")
+        return []
+
+
+def get_team_roster(team, season=None):
+    """
+    Retrieves the roster of players for a specified NBA team and season.
+    
+    Args:
+        team (str): The name or abbreviation of the NBA team (e.g., "Los Angeles Lakers" or "LAL").
+        season (str, optional): The NBA season in the format "YYYY-YY" (e.g., "2023-24"). Defaults to the latest season.
+    
+    Returns:
+        pd.DataFrame: DataFrame containing player details such as PLAYER, NUM, POSITION, HEIGHT, WEIGHT, BIRTH_DATE, AGE, EXP, SCHOOL, PLAYER_ID.
+    """
+    return to_data_frame(get_team_roster_rows(team, season), RosterRow)[ROSTER_FIELDS]
@@ -1,52 +1,48 @@
-import pandas as pd
-from datetime import datetime
-from nba_api.stats.endpoints import scoreboardv2
-from nba_api.stats.static import teams
-import warnings
-def get_todays_nba_games():
+import logging
+from datetime import date
+from nba_api_functions.get_games import get_game_rows_for_date
+from nba_api_functions.rows import GameRow, to_data_frame
+from nba_api_functions.snapshot import get_snapshot, is_offline
+
+GAME_COLUMNS = list(GameRow._fields)
+
+def get_todays_nba_game_rows(use_cache=True):
     """
-    Fetches today's NBA games using the nba_api and extracts game date, arena name,
-    home team, visitor team, and scheduled game time (if available) from GAME_STATUS_TEXT.
+    Fetches today's NBA games as lightweight rows, without building a DataFrame.
+
+    Offline from a snapshot that holds no games for today, the latest scoreboard
+    it holds before today (or else its latest) is shown instead.
+    
+    Args:
+        use_cache (bool): Set to False to bypass the cached scoreboard, e.g. when polling live scores.
     
     Returns:
-        pd.DataFrame: DataFrame with columns ['GameDate', 'Arena', 'HomeTeam', 'VisitorTeam', 'GameTime']
+        list[GameRow]: One row per game in scoreboard order. GameStatusID is 1 before tip-off,
+                       2 while live and 3 once final. Scores are None before tip-off.
+                       Empty if there's an error or no games are scheduled.
     """
-    try:
-        # Get today's date in MM/DD/YYYY format as required by the API
-        today = datetime.today().strftime('%m/%d/%Y')
-        
-        # Fetch the scoreboard data for today using ScoreboardV2
-        sb = scoreboardv2.ScoreboardV2(game_date=today, timeout=10)
-        
-        # Extract the game header data as a DataFrame
-        game_header_df = sb.game_header.get_data_frame()
-        
-        if game_header_df.empty:
-            print("No game data found for today. Please verify the date and try again.")
-            return pd.DataFrame(columns=['GameDate', 'Arena', 'HomeTeam', 'VisitorTeam', 'GameTime'])
-        
-        # Retrieve team information
-        all_teams = teams.get_teams()
-        team_id_to_name = {team['id']: team['full_name'] for team in all_teams}
-        
-        # Map HOME_TEAM_ID and VISITOR_TEAM_ID to team names
-        game_header_df['HomeTeam'] = game_header_df['HOME_TEAM_ID'].map(team_id_to_name)
-        game_header_df['VisitorTeam'] = game_header_df['VISITOR_TEAM_ID'].map(team_id_to_name)
-        
-        # Parse GAME_DATE_EST to datetime and extract date
-        game_header_df['GameDate'] = pd.to_datetime(game_header_df['GAME_DATE_EST']).dt.date
-        
-        # Extract Arena Name
-        game_header_df['Arena'] = game_header_df['ARENA_NAME']
-        
-        # Apply the function to extract GameTime
-        game_header_df['GameTime'] = game_header_df['GAME_STATUS_TEXT']
-        
-        # Select the relevant columns
-        result_df = game_header_df[['GameDate', 'Arena', 'HomeTeam', 'VisitorTeam', 'GameTime']].copy()
-        
-        return result_df.reset_index(drop=True)
+    today = date.today()
+    rows = get_game_rows_for_date(today, use_cache)
+    if not rows and is_offline():
+        latest = get_snapshot().latest_scoreboard_date(before=today)
+        if latest is not None and latest != today:
+            logging.info(f"Offline snapshot holds no games for {today}, showing {latest}.")
+            rows = get_game_rows_for_date(latest, use_cache)
+    return rows
+
+
+def get_todays_nba_games(use_cache=True):
+    """
+    Fetches today's NBA games using the nba_api and extracts game date, arena name,
+    home team, visitor team, and scheduled game time (if available) from GAME_STATUS_TEXT,
+    along with the game status, period and current score.
     
-    except Exception as e:
-        print(f"An error occurred: {e}")
-        return pd.DataFrame(columns=['GameDate', 'Arena', 'HomeTeam', 'VisitorTeam', 'GameTime'])
+    Args:
+        use_cache (bool): Set to False to bypass the cached scoreboard, e.g. when polling live scores.
+    
+    Returns:
+        pd.DataFrame: DataFrame with columns ['GameID', 'GameDate', 'Arena', 'HomeTeam', 'VisitorTeam', 'GameTime',
+                      'GameStatusID', 'Period', 'HomeScore', 'VisitorScore']. GameStatusID is 1 before tip-off,
+                      2 while live and 3 once final. Scores are missing before tip-off.
+    """
+    return to_data_frame(get_todays_nba_game_rows(use_cache), GameRow)
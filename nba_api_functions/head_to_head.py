@@ -0,0 +1,104 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from nba_api.stats.endpoints import PlayerGameLogs
+from nba_api_functions.api_client import call_endpoint
+from nba_api_functions.game_log_store import get_game_log_store
+from nba_api_functions.league_game_logs import sync_league_seasons
+from nba_api_functions.player_profile import get_current_season
+from nba_api_functions.rows import HeadToHeadRow
+
+# Requests are spaced by the shared rate limiter, so a few workers are enough
+DEFAULT_MAX_WORKERS = 4
+
+HEAD_TO_HEAD_COLUMNS = list(HeadToHeadRow._fields)
+
+
+def previous_seasons(season, count):
+    """
+    Returns a season followed by the seasons before it.
+
+    Args:
+        season (str): The most recent season in 'YYYY-YY' format (e.g., '2024-25').
+        count (int): Total number of seasons to return.
+
+    Returns:
+        list[str]: Seasons in 'YYYY-YY' format, newest first (e.g., ['2024-25', '2023-24']).
+    """
+    start_year = int(season[:4])
+    return [f"{year}-{str(year + 1)[-2:]}" for year in range(start_year, start_year - count, -1)]
+
+
+def sync_player_seasons(player_id, seasons, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Stores a player's game logs for every season that is not already in the local store.
+
+    Missing seasons are fetched concurrently through the shared cache and rate limiter.
+    Seasons whose league-wide game logs are stored already count as stored.
+
+    Args:
+        player_id (int): The NBA player ID.
+        seasons (list[str]): Seasons in 'YYYY-YY' format.
+        max_workers (int): Maximum number of seasons fetched at the same time.
+
+    Returns:
+        list[str]: The seasons that were fetched.
+    """
+    store = get_game_log_store()
+    missing_seasons = [
+        season for season in seasons
+        if not store.is_synced(player_id, season) and not store.is_league_synced(season)
+    ]
+    if not missing_seasons:
+        return []
+
+    def sync(season):
+        game_logs = call_endpoint(
+            PlayerGameLogs,
+            season_nullable=season,
+            player_id_nullable=player_id,
+            timeout=30
+        ).get_normalized_dict()['PlayerGameLogs']
+        store.add_game_logs(season, game_logs)
+        store.mark_synced(player_id, season)
+        return len(game_logs)
+
+    fetched = []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(sync, season): season for season in missing_seasons}
+        for future in as_completed(futures):
+            season = futures[future]
+            try:
+                logging.info(f"Stored {future.result()} games for player {player_id} in {season}.")
+                fetched.append(season)
+            except Exception as e:
+                logging.error(f"Error fetching {season} game logs for player {player_id}: {e}")
+    return fetched
+
+
+def get_head_to_head_rows(player_id, opponent_team_id, seasons=None, n_games=5):
+    """
+    Returns a player's most recent games against an opponent as lightweight rows.
+
+    Answered from the local game log store. Seasons that are not stored yet are
+    ingested league-wide first, so later lookups for any player need no request.
+    The player's own game logs are fetched for seasons whose league-wide sync fails.
+
+    Args:
+        player_id (int): The NBA player ID.
+        opponent_team_id (int): The opponent's NBA team ID.
+        seasons (list[str], optional): Seasons to search. Defaults to the current and previous season.
+        n_games (int, optional): Maximum number of games. Default is 5. None returns every game.
+
+    Returns:
+        list[HeadToHeadRow]: One row per game, newest first.
+    """
+    if seasons is None:
+        seasons = previous_seasons(get_current_season(), 2)
+
+    sync_player_seasons(player_id, sync_league_seasons(seasons))
+    games = get_game_log_store().head_to_head(player_id, opponent_team_id, seasons, limit=n_games)
+
+    return [
+        HeadToHeadRow(game['GAME_DATE'][:10], *[game.get(column) for column in HEAD_TO_HEAD_COLUMNS[1:]])
+        for game in games
+    ]
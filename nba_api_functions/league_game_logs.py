@@ -0,0 +1,196 @@
+import argparse
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from nba_api.stats.endpoints import PlayerGameLogs
+from nba_api_functions.api_client import call_endpoint
+from nba_api_functions.game_log_store import get_game_log_store
+from nba_api_functions.player_profile import get_current_season
+from nba_api_functions.resilience import FETCH_ERRORS
+from nba_api_functions.rows import GameLogRow, parse_game_log_date
+
+# A whole league season is tens of thousands of rows, give the request more time
+LEAGUE_GAME_LOG_TIMEOUT = 60
+
+# Seasons ingested at the same time
+DEFAULT_MAX_WORKERS = 2
+
+_season_locks = {}
+_season_locks_lock = threading.Lock()
+
+
+def _season_lock(season):
+    """Returns the lock that keeps one ingestion per season running at a time."""
+    with _season_locks_lock:
+        return _season_locks.setdefault(season, threading.Lock())
+
+
+def is_league_sync_running(season):
+    """Returns True while a season's league-wide game logs are being synced."""
+    return _season_lock(season).locked()
+
+
+def fetch_league_game_logs(season, date_from=None):
+    """
+    Fetches every player's games of a season in one PlayerGameLogs request.
+
+    Args:
+        season (str): Season in 'YYYY-YY' format.
+        date_from (str, optional): First game date as 'YYYY-MM-DD'. Defaults to the whole season.
+
+    Returns:
+        list[dict]: The normalized PlayerGameLogs rows.
+
+    Raises:
+        One of FETCH_ERRORS if the request fails.
+    """
+    params = {}
+    if date_from:
+        params['date_from_nullable'] = datetime.strptime(date_from, '%Y-%m-%d').strftime('%m/%d/%Y')
+    return call_endpoint(
+        PlayerGameLogs,
+        season_nullable=season,
+        timeout=LEAGUE_GAME_LOG_TIMEOUT,
+        **params
+    ).get_normalized_dict()['PlayerGameLogs']
+
+
+def sync_league_game_logs(season=None, force=False):
+    """
+    Stores every player's games of a season with league-wide PlayerGameLogs requests.
+
+    The first sync of a season fetches all of it in one request. Later syncs only ask
+    for games from the last stored game date on; that date is fetched again because
+    its late games may not have been final when it was stored. Callers arriving while
+    a season is being ingested wait for it rather than sending their own request.
+
+    Args:
+        season (str, optional): Season in 'YYYY-YY' format. Defaults to the current season.
+        force (bool): Sync even if the stored season is still fresh.
+
+    Returns:
+        bool: True if the season's games in the local store are current, False if the fetch failed.
+    """
+    season = season or get_current_season()
+    store = get_game_log_store()
+    with _season_lock(season):
+        if not force and store.is_league_synced(season):
+            return True
+
+        state = store.league_sync_state(season)
+        last_game_date = state[0] if state else None
+        try:
+            game_logs = fetch_league_game_logs(season, last_game_date)
+        except FETCH_ERRORS as e:
+            logging.error(f"Could not fetch league game logs for {season}: {e}")
+            return False
+
+        store.add_game_logs(season, game_logs)
+        newest_game_date = max((str(game['GAME_DATE'])[:10] for game in game_logs), default=last_game_date)
+        store.mark_league_synced(season, newest_game_date)
+        logging.info(
+            f"Stored {len(game_logs)} league games for {season}"
+            f"{f' since {last_game_date}' if last_game_date else ''}."
+        )
+        return True
+
+
+def sync_league_seasons(seasons, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Syncs several seasons' league-wide game logs concurrently.
+
+    Args:
+        seasons (list[str]): Seasons in 'YYYY-YY' format.
+        max_workers (int): Maximum number of seasons fetched at the same time.
+
+    Returns:
+        list[str]: The seasons that could not be synced.
+    """
+    store = get_game_log_store()
+    missing_seasons = [season for season in seasons if not store.is_league_synced(season)]
+    if not missing_seasons:
+        return []
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        synced = list(executor.map(sync_league_game_logs, missing_seasons))
+    return [season for season, ok in zip(missing_seasons, synced) if not ok]
+
+
+def _game_log_row(game):
+    """Builds a GameLogRow from a stored PlayerGameLogs row."""
+    return GameLogRow(
+        game['PLAYER_ID'],
+        parse_game_log_date(game['GAME_DATE']),
+        *[game.get(field) for field in GameLogRow._fields[2:]]
+    )
+
+
+def stored_game_log_rows(player_id, season, n_games=None):
+    """
+    Returns a player's games of a season from the local store as GameLogRows.
+
+    Args:
+        player_id (int): The NBA player ID.
+        season (str): Season in 'YYYY-YY' format.
+        n_games (int, optional): Maximum number of games. None returns every game.
+
+    Returns:
+        list[GameLogRow]: One row per game, newest first.
+    """
+    return [_game_log_row(game) for game in get_game_log_store().recent_games(player_id, season, limit=n_games)]
+
+
+class StoredGameLogPages:
+    """
+    A player's stored games as a paged data source, newest first.
+
+    Only the number of games is read up front; each page is a separate
+    LIMIT/OFFSET query, so a whole career costs no more to open than a season.
+
+    Attributes:
+        columns (tuple[str]): The GameLogRow field names.
+        row_count (int): Number of games, counted when the source is created.
+    """
+
+    columns = GameLogRow._fields
+
+    def __init__(self, player_id, seasons=None):
+        """
+        Args:
+            player_id (int): The NBA player ID.
+            seasons (list[str], optional): Seasons to include. Defaults to every stored season.
+        """
+        self.player_id = player_id
+        self.seasons = seasons
+        self.row_count = get_game_log_store().count_player_games(player_id, seasons)
+
+    def fetch_page(self, offset, limit):
+        """
+        Returns up to limit games starting at offset.
+
+        Returns:
+            list[GameLogRow]: The page's games, newest first.
+        """
+        return [
+            _game_log_row(game)
+            for game in get_game_log_store().player_games_page(self.player_id, self.seasons, offset, limit)
+        ]
+
+
+def main():
+    """
+    Ingests league-wide game logs for the given seasons into the local store.
+    """
+    parser = argparse.ArgumentParser(description="Store league-wide NBA game logs locally.")
+    parser.add_argument("seasons", nargs="*", help="Seasons in 'YYYY-YY' format (default: the current season)")
+    parser.add_argument("--force", action="store_true", help="Sync seasons that are still fresh")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    for season in args.seasons or [get_current_season()]:
+        if not sync_league_game_logs(season, force=args.force):
+            print(f"Failed to sync {season}.")
+
+
+if __name__ == "__main__":
+    main()
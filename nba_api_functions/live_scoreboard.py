@@ -0,0 +1,92 @@
+import re
+from datetime import datetime, timedelta
+
+# GAME_STATUS_ID values returned by ScoreboardV2
+SCHEDULED = 1
+LIVE = 2
+FINAL = 3
+
+# Poll intervals in seconds
+CLOSE_GAME_INTERVAL = 5
+LIVE_GAME_INTERVAL = 20
+MIN_PREGAME_INTERVAL = 60
+MAX_PREGAME_INTERVAL = 15 * 60
+UNKNOWN_TIPOFF_INTERVAL = 5 * 60
+
+# A live game in the fourth quarter or overtime within this many points counts as close
+CLOSE_GAME_MARGIN = 8
+CLOSE_GAME_PERIOD = 4
+
+
+def _eastern_time():
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo("America/New_York")
+    except Exception:
+        return None
+
+
+def parse_tipoff(status_text, now=None):
+    """
+    Parses a scheduled tip-off such as "7:30 pm ET" from GAME_STATUS_TEXT.
+
+    Args:
+        status_text (str): The GAME_STATUS_TEXT of a game that has not started.
+        now (datetime, optional): Current time, timezone-aware. Defaults to now.
+
+    Returns:
+        datetime or None: Today's tip-off in Eastern time, or None if it can't be parsed.
+    """
+    eastern = _eastern_time()
+    match = re.match(r'^\s*(\d{1,2}):(\d{2})\s*([ap]m)\s*ET', str(status_text), re.IGNORECASE)
+    if eastern is None or match is None:
+        return None
+    hour, minute, meridiem = int(match.group(1)), int(match.group(2)), match.group(3).lower()
+    hour = hour % 12 + (12 if meridiem == 'pm' else 0)
+    now = (now or datetime.now(eastern)).astimezone(eastern)
+    return now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+
+
+def is_close_game(game):
+    """Returns True for a live game late in the game with a small margin."""
+    try:
+        margin = abs(int(game.HomeScore) - int(game.VisitorScore))
+        return int(game.Period) >= CLOSE_GAME_PERIOD and margin <= CLOSE_GAME_MARGIN
+    except (TypeError, ValueError):
+        return False
+
+
+def next_poll_interval(games, now=None):
+    """
+    Chooses how long to wait before polling the scoreboard again.
+
+    Polls every few seconds while a close game is live, less often for other live
+    games, rarely before tip-off, and not at all once every game is final.
+
+    Args:
+        games (list[GameRow]): Output of get_todays_nba_game_rows.
+        now (datetime, optional): Current time, timezone-aware. Defaults to now.
+
+    Returns:
+        float or None: Seconds until the next poll, or None to stop polling.
+    """
+    if not games:
+        return None
+    statuses = [int(game.GameStatusID) for game in games]
+    if all(status == FINAL for status in statuses):
+        return None
+
+    live_games = [game for game, status in zip(games, statuses) if status == LIVE]
+    if live_games:
+        if any(is_close_game(game) for game in live_games):
+            return CLOSE_GAME_INTERVAL
+        return LIVE_GAME_INTERVAL
+
+    tipoffs = [parse_tipoff(game.GameTime, now) for game, status in zip(games, statuses) if status == SCHEDULED]
+    tipoffs = [tipoff for tipoff in tipoffs if tipoff is not None]
+    if not tipoffs:
+        return UNKNOWN_TIPOFF_INTERVAL
+    eastern = _eastern_time()
+    now = (now or datetime.now(eastern)).astimezone(eastern)
+    until_tipoff = (min(tipoffs) - now) / timedelta(seconds=1)
+    return min(MAX_PREGAME_INTERVAL, max(MIN_PREGAME_INTERVAL, until_tipoff))
@@ -0,0 +1,155 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+from nba_api.stats.endpoints import PlayerGameLogs
+from nba_api_functions.api_client import call_endpoint
+from nba_api_functions.game_log_store import get_game_log_store
+from nba_api_functions.get_team_roster import get_team_roster_rows_by_id
+from nba_api_functions.head_to_head import DEFAULT_MAX_WORKERS, previous_seasons
+from nba_api_functions.league_game_logs import sync_league_seasons
+from nba_api_functions.player_profile import get_current_season
+from nba_api_functions.resilience import FETCH_ERRORS
+from nba_api_functions.roster_form import ratio
+from nba_api_functions.rows import MatchupRow
+
+# Seasons searched for games against the opponent, newest first
+MATCHUP_SEASONS = 2
+
+# Recent games against the opponent the averages cover
+MATCHUP_GAMES = 5
+
+# PlayerGameLogs columns the matchup averages are computed from
+MATCHUP_LOG_COLUMNS = ['PLAYER_ID', 'PLAYER_NAME', 'GAME_DATE', 'MIN', 'PTS', 'REB', 'AST',
+                       'FGM', 'FGA', 'FG3M', 'PLUS_MINUS']
+
+AVERAGED_COLUMNS = ('MIN', 'PTS', 'REB', 'AST', 'FG3M', 'PLUS_MINUS')
+
+
+def compute_matchup_stats(game_logs, n_games=MATCHUP_GAMES):
+    """
+    Computes every player's recent averages against an opponent in one batched pass.
+
+    The logs hold only games against the opponent each player faces, so each row
+    averages the games get_head_to_head_rows returns for that player (and that
+    player_vsteam.get_player_stats_vs_team lists). Rather than one lookup per player,
+    rows are sorted by player and date once and every statistic is a grouped sum
+    (np.bincount) over each player's last n_games rows.
+
+    Args:
+        game_logs (dict): PlayerGameLogs rows with "headers" and "data", including the MATCHUP_LOG_COLUMNS.
+        n_games (int): Number of recent games per player.
+
+    Returns:
+        dict: MatchupRow by PLAYER_ID. Averages are per game, FG_PCT covers the same games
+            and LAST_GAME is the date of the latest one ('YYYY-MM-DD').
+    """
+    data = game_logs['data']
+    if not data:
+        return {}
+    columns = dict(zip(game_logs['headers'], zip(*data)))
+    player_ids = np.array(columns['PLAYER_ID'], dtype=np.int64)
+    game_dates = np.array([str(game_date)[:10] for game_date in columns['GAME_DATE']], dtype='datetime64[D]')
+
+    # Group each player's games together, newest first
+    order = np.lexsort((-game_dates.astype(np.int64), player_ids))
+    player_ids = player_ids[order]
+    unique_ids, starts, games_played = np.unique(player_ids, return_index=True, return_counts=True)
+    player_index = np.repeat(np.arange(len(unique_ids)), games_played)
+    recent = np.arange(len(player_ids)) - starts[player_index] < n_games
+
+    def recent_sum(name):
+        # Missing values (None) become NaN and count as zero
+        values = np.array(columns[name], dtype=float)[order]
+        return np.bincount(player_index, weights=np.where(recent & ~np.isnan(values), values, 0.0),
+                           minlength=len(unique_ids))
+
+    recent_games = np.minimum(games_played, n_games)
+    averages = {name: recent_sum(name) / recent_games for name in AVERAGED_COLUMNS}
+    field_goal_pct = ratio(recent_sum('FGM'), recent_sum('FGA'), 100.0)
+    last_games = game_dates[order][starts].astype(str).tolist()
+    names = np.array(columns['PLAYER_NAME'], dtype=object)[order][starts].tolist()
+
+    # Python's round works on the exact value, like rounding each player's own averages would;
+    # np.round scales first and turns e.g. 24.05 into 24.0
+    rounded = [
+        [round(value, 1) for value in values.tolist()] for values in (
+            averages['MIN'], averages['PTS'], averages['REB'], averages['AST'],
+            field_goal_pct, averages['FG3M'], averages['PLUS_MINUS']
+        )
+    ]
+    stats = {}
+    for index, player_id in enumerate(unique_ids.tolist()):
+        values = [None if np.isnan(column[index]) else column[index] for column in rounded]
+        stats[player_id] = MatchupRow(player_id, names[index], int(recent_games[index]), *values, last_games[index])
+    return stats
+
+
+def _store_team_games_against(team_id, opponent_team_id, season):
+    """Stores a team's player games against one opponent, for seasons whose league-wide sync failed."""
+    try:
+        game_logs = call_endpoint(
+            PlayerGameLogs,
+            team_id_nullable=team_id,
+            opp_team_id_nullable=opponent_team_id,
+            season_nullable=season,
+            timeout=30
+        ).get_normalized_dict()['PlayerGameLogs']
+    except FETCH_ERRORS as e:
+        logging.error(f"Could not fetch {season} games of team {team_id} against team {opponent_team_id}: {e}")
+        return
+    get_game_log_store().add_game_logs(season, game_logs)
+
+
+def _matchup_rows(roster_rows, stats):
+    """Returns a MatchupRow per rostered player, most points first and players without games last."""
+    rows = {}
+    for roster_row in roster_rows:
+        row = stats.get(roster_row.PLAYER_ID)
+        if row is None:
+            row = MatchupRow(roster_row.PLAYER_ID, roster_row.PLAYER, 0, *[None] * (len(MatchupRow._fields) - 3))
+        rows.setdefault(roster_row.PLAYER_ID, row._replace(PLAYER=roster_row.PLAYER))
+    return sorted(rows.values(), key=lambda row: (row.GP == 0, -(row.PTS or 0)))
+
+
+def get_matchup(home_team_id, visitor_team_id, seasons=None, n_games=MATCHUP_GAMES, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Returns both rosters of a game with each player's recent games against the other team.
+
+    Both rosters are fetched while the seasons' league-wide game logs are synced, all
+    concurrently through the shared cache and rate limiter. For seasons whose sync
+    fails, each team's games against the other are fetched instead. Both sides' games
+    then come from one store query and one compute_matchup_stats pass, rather than one
+    head-to-head lookup per player.
+
+    Args:
+        home_team_id (int): The home team's NBA team ID.
+        visitor_team_id (int): The visiting team's NBA team ID.
+        seasons (list[str], optional): Seasons to search. Defaults to the current and previous season.
+        n_games (int): Number of recent games against the opponent per player.
+        max_workers (int): Maximum number of requests at the same time.
+
+    Returns:
+        dict: list[MatchupRow] by team ID. Empty for a team whose roster could not be fetched.
+    """
+    seasons = seasons or previous_seasons(get_current_season(), MATCHUP_SEASONS)
+    opponents = {home_team_id: visitor_team_id, visitor_team_id: home_team_id}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        roster_futures = {team_id: executor.submit(get_team_roster_rows_by_id, team_id) for team_id in opponents}
+        failed_seasons = sync_league_seasons(seasons)
+        fallbacks = [
+            executor.submit(_store_team_games_against, team_id, opponent_team_id, season)
+            for season in failed_seasons for team_id, opponent_team_id in opponents.items()
+        ]
+        rosters = {team_id: future.result() for team_id, future in roster_futures.items()}
+        for future in fallbacks:
+            future.result()
+
+    games = get_game_log_store().matchup_games(
+        {opponents[team_id]: [row.PLAYER_ID for row in roster] for team_id, roster in rosters.items()},
+        seasons
+    )
+    stats = compute_matchup_stats(
+        {'headers': MATCHUP_LOG_COLUMNS, 'data': [[game.get(column) for column in MATCHUP_LOG_COLUMNS] for game in games]},
+        n_games
+    )
+    return {team_id: _matchup_rows(roster, stats) for team_id, roster in rosters.items()}
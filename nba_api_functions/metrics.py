@@ -0,0 +1,254 @@
+import json
+import os
+import tempfile
+import threading
+import time
+from bisect import bisect_left
+
+# Upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+# Where a call_endpoint response came from
+CACHE = "cache"
+NETWORK = "network"
+SHARED = "shared"  # Waited on a concurrent identical request
+STALE = "stale"  # Expired cache entry served while stats.nba.com is failing
+SNAPSHOT = "snapshot"  # Read from the offline snapshot bundle the app was started with
+SOURCES = (CACHE, NETWORK, SHARED, STALE, SNAPSHOT)
+
+METRIC_PREFIX = "nba_tui"
+
+
+class Histogram:
+    """Cumulative-bucket latency histogram in the Prometheus style."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # The last slot counts values above every bucket
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value):
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q):
+        """
+        Estimates a quantile by interpolating within its bucket, like Prometheus' histogram_quantile.
+
+        Args:
+            q (float): The quantile, between 0 and 1.
+
+        Returns:
+            float or None: The estimate in seconds, or None if nothing was observed.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            if seen + bucket_count >= rank and bucket_count:
+                lower = self.buckets[index - 1] if index > 0 else 0.0
+                if index == len(self.buckets):
+                    # Above the largest bucket there is no upper bound to interpolate to
+                    return lower
+                return lower + (self.buckets[index] - lower) * (rank - seen) / bucket_count
+            seen += bucket_count
+        return self.buckets[-1]
+
+    @classmethod
+    def merge(cls, histograms):
+        """Returns one histogram holding the observations of all of them."""
+        merged = cls()
+        for histogram in histograms:
+            merged.counts = [a + b for a, b in zip(merged.counts, histogram.counts)]
+            merged.count += histogram.count
+            merged.sum += histogram.sum
+        return merged
+
+    def to_dict(self):
+        cumulative = 0
+        buckets = {}
+        for bound, bucket_count in zip(self.buckets + (float("inf"),), self.counts):
+            cumulative += bucket_count
+            buckets["+Inf" if bound == float("inf") else str(bound)] = cumulative
+        return {"count": self.count, "sum": self.sum, "buckets": buckets}
+
+
+class EndpointMetrics:
+    """Counters for one nba_api endpoint."""
+
+    def __init__(self):
+        self.requests = dict.fromkeys(SOURCES, 0)
+        self.latency = {source: Histogram() for source in SOURCES}
+        self.errors = 0
+        self.retries = 0
+        self.response_bytes = 0
+
+    def to_dict(self):
+        calls = sum(self.requests.values())
+        latency = Histogram.merge(self.latency.values())
+        return {
+            "requests": dict(self.requests),
+            "errors": self.errors,
+            "retries": self.retries,
+            "response_bytes": self.response_bytes,
+            "cache_hit_ratio": self.requests[CACHE] / calls if calls else 0.0,
+            "latency_p50_seconds": latency.quantile(0.5),
+            "latency_p95_seconds": latency.quantile(0.95),
+            "latency": {source: histogram.to_dict() for source, histogram in self.latency.items()},
+        }
+
+
+class MetricsRegistry:
+    """
+    Thread-safe per-endpoint latency, error, retry, payload and cache metrics.
+
+    call_endpoint records every call here. Snapshots can be exported as JSON or in the
+    Prometheus text format for the node exporter's textfile collector.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.endpoints = {}
+        self.started_at = time.time()
+
+    def _endpoint(self, endpoint):
+        if endpoint not in self.endpoints:
+            self.endpoints[endpoint] = EndpointMetrics()
+        return self.endpoints[endpoint]
+
+    def record_call(self, endpoint, seconds, source, response_bytes=0):
+        """
+        Records a completed endpoint call.
+
+        Args:
+            endpoint (str): The nba_api endpoint name (e.g., "commonteamroster").
+            seconds (float): Time from the call to the loaded response.
+            source (str): CACHE, NETWORK, SHARED, STALE or SNAPSHOT.
+            response_bytes (int): Size of the body downloaded, for network calls.
+        """
+        with self._lock:
+            metrics = self._endpoint(endpoint)
+            metrics.requests[source] += 1
+            metrics.latency[source].observe(seconds)
+            metrics.response_bytes += response_bytes
+
+    def record_error(self, endpoint):
+        """Records an endpoint call that raised."""
+        with self._lock:
+            self._endpoint(endpoint).errors += 1
+
+    def record_retry(self, endpoint):
+        """Records a retry of a failed endpoint call."""
+        with self._lock:
+            self._endpoint(endpoint).retries += 1
+
+    def snapshot(self, cache_stats=None):
+        """
+        Returns every metric as plain data.
+
+        Args:
+            cache_stats (dict, optional): ApiCache.stats() to include under "cache".
+
+        Returns:
+            dict: Uptime, per-endpoint metrics and the cache stats.
+        """
+        with self._lock:
+            endpoints = {name: metrics.to_dict() for name, metrics in sorted(self.endpoints.items())}
+        snapshot = {"uptime_seconds": time.time() - self.started_at, "endpoints": endpoints}
+        if cache_stats is not None:
+            snapshot["cache"] = cache_stats
+        return snapshot
+
+    def to_json(self, cache_stats=None):
+        """Returns the snapshot as a JSON document."""
+        return json.dumps(self.snapshot(cache_stats), indent=2)
+
+    def to_prometheus(self, cache_stats=None):
+        """
+        Returns the metrics in the Prometheus text exposition format.
+
+        Args:
+            cache_stats (dict, optional): ApiCache.stats() to export as cache gauges.
+
+        Returns:
+            str: The exposition, ending with a newline.
+        """
+        snapshot = self.snapshot(cache_stats)
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {METRIC_PREFIX}_{name} {help_text}")
+            lines.append(f"# TYPE {METRIC_PREFIX}_{name} {kind}")
+            for suffix, labels, value in samples:
+                label_text = ",".join(f'{key}="{label}"' for key, label in labels.items())
+                label_text = f"{{{label_text}}}" if label_text else ""
+                lines.append(f"{METRIC_PREFIX}_{name}{suffix}{label_text} {value}")
+
+        endpoints = snapshot["endpoints"]
+        metric("endpoint_requests_total", "counter", "Endpoint calls by response source.", [
+            ("", {"endpoint": endpoint, "source": source}, count)
+            for endpoint, data in endpoints.items() for source, count in data["requests"].items()
+        ])
+        metric("endpoint_errors_total", "counter", "Endpoint calls that raised.", [
+            ("", {"endpoint": endpoint}, data["errors"]) for endpoint, data in endpoints.items()
+        ])
+        metric("endpoint_retries_total", "counter", "Retries after a failed endpoint call.", [
+            ("", {"endpoint": endpoint}, data["retries"]) for endpoint, data in endpoints.items()
+        ])
+        metric("endpoint_response_bytes_total", "counter", "Response bytes downloaded.", [
+            ("", {"endpoint": endpoint}, data["response_bytes"]) for endpoint, data in endpoints.items()
+        ])
+        metric("endpoint_cache_hit_ratio", "gauge", "Share of endpoint calls answered by the cache.", [
+            ("", {"endpoint": endpoint}, data["cache_hit_ratio"]) for endpoint, data in endpoints.items()
+        ])
+        latency_samples = []
+        for endpoint, data in endpoints.items():
+            for source, histogram in data["latency"].items():
+                labels = {"endpoint": endpoint, "source": source}
+                for bound, count in histogram["buckets"].items():
+                    latency_samples.append(("_bucket", {**labels, "le": bound}, count))
+                latency_samples.append(("_sum", labels, histogram["sum"]))
+                latency_samples.append(("_count", labels, histogram["count"]))
+        metric("endpoint_latency_seconds", "histogram", "Endpoint call latency.", latency_samples)
+
+        if cache_stats is not None:
+            metric("cache_entries", "gauge", "Responses stored in the cache.", [("", {}, cache_stats["entries"])])
+            metric("cache_bytes", "gauge", "Bytes stored in the cache.", [("", {}, cache_stats["bytes"])])
+            metric("cache_evictions_total", "counter", "Responses evicted from the cache.",
+                   [("", {}, cache_stats["evictions"])])
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus_textfile(self, path, cache_stats=None):
+        """
+        Writes the Prometheus exposition to path atomically, so the textfile collector never reads a partial file.
+
+        Args:
+            path (str): Target file, normally ending in .prom.
+            cache_stats (dict, optional): ApiCache.stats() to export as cache gauges.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".nba_tui_metrics_", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as temp_file:
+                temp_file.write(self.to_prometheus(cache_stats))
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+    def reset(self):
+        """Clears every metric."""
+        with self._lock:
+            self.endpoints = {}
+            self.started_at = time.time()
+
+
+_metrics = MetricsRegistry()
+
+
+def get_metrics():
+    """Returns the process-wide MetricsRegistry."""
+    return _metrics
@@ -1,8 +1,10 @@
-from nba_api.stats.endpoints import playergamelog
+from nba_api.stats.endpoints import commonplayerinfo, playergamelog
 from nba_api.stats.static import players
-import pandas as pd
-import time
+import logging
 from datetime import datetime
+from nba_api_functions.api_client import call_endpoint
+from nba_api_functions.resilience import FETCH_ERRORS, RetryPolicy
+from nba_api_functions.rows import GameLogRow, parse_game_log_date, rows_from_data_set, to_data_frame
 
 def get_current_season():
     """
@@ -25,6 +27,91 @@ def get_current_season():
 
     return f"{season_start}-{str(season_end)[-2:]}"
 
+def get_career_seasons(player_id, timeout=30):
+    """
+    Returns every season of a player's career, from CommonPlayerInfo.
+
+    Parameters:
+        player_id (int): The unique NBA player ID.
+        timeout (int): Time to wait for the API response in seconds. Default is 30.
+
+    Returns:
+        list[str]: Seasons in 'YYYY-YY' format, newest first. Just the current season
+                   if the player's career span could not be fetched.
+    """
+    try:
+        info = call_endpoint(
+            commonplayerinfo.CommonPlayerInfo,
+            player_id=player_id,
+            timeout=timeout
+        ).common_player_info.get_dict()
+    except FETCH_ERRORS as e:
+        logging.error(f"Could not fetch the career span for player ID {player_id}: {e}")
+        return [get_current_season()]
+    if not info['data']:
+        return [get_current_season()]
+    player_info = dict(zip(info['headers'], info['data'][0]))
+    # FROM_YEAR and TO_YEAR are the years the first and last seasons started in
+    first_year, last_year = int(player_info['FROM_YEAR']), int(player_info['TO_YEAR'])
+    return [f"{year}-{str(year + 1)[-2:]}" for year in range(last_year, first_year - 1, -1)]
+
+def get_last_n_game_log_rows(player_id, n_games=10, timeout=30, retries=3):
+    """
+    Fetches the last N games' statistics for a given NBA player as lightweight rows.
+
+    Answered from the league-wide game logs in the local store, which are synced
+    incrementally first. A PlayerGameLog request for the one player is the fallback
+    when the league-wide sync fails.
+
+    Parameters:
+        player_id (int): The unique NBA player ID.
+        n_games (int): Number of recent games to retrieve. Default is 10.
+        timeout (int): Time to wait for the API response in seconds. Default is 30.
+        retries (int): Number of attempts, with backoff, for retryable failures. Default is 3.
+
+    Returns:
+        list[GameLogRow] or None: The player's last N games, newest first.
+    """
+    season = get_current_season()
+
+    # Imported here because league_game_logs imports get_current_season from this module
+    from nba_api_functions.league_game_logs import stored_game_log_rows, sync_league_game_logs
+    if sync_league_game_logs(season):
+        game_log_rows = stored_game_log_rows(player_id, season, n_games)
+        if not game_log_rows:
+            logging.info(f"No game log data found for player ID {player_id} in season {season}.")
+            return None
+        return game_log_rows
+
+    try:
+        # Retries with backoff happen inside call_endpoint, under the shared circuit breaker
+        gamelog = call_endpoint(
+            playergamelog.PlayerGameLog,
+            retry_policy=RetryPolicy(max_attempts=retries),
+            player_id=player_id,
+            season=season,
+            season_type_all_star='Regular Season',
+            timeout=timeout
+        )
+    except FETCH_ERRORS as e:
+        logging.error(f"Could not fetch the game log for player ID {player_id}: {e}")
+        return None
+
+    # Build rows straight from the game log result set
+    game_log_rows = rows_from_data_set(gamelog.player_game_log, GameLogRow)
+
+    if not game_log_rows:
+        logging.info(f"No game log data found for player ID {player_id} in season {season}.")
+        return None
+
+    # Parse GAME_DATE so games sort by date rather than by name of the month
+    game_log_rows = [row._replace(GAME_DATE=parse_game_log_date(row.GAME_DATE)) for row in game_log_rows]
+
+    # Sort by GAME_DATE descending and select the top n_games
+    game_log_rows.sort(key=lambda row: row.GAME_DATE, reverse=True)
+    return game_log_rows[:n_games]
+
+
 def get_last_n_games_playergamelog(player_id, n_games=10, timeout=30, retries=3):
     """
     Fetches the last N games' statistics for a given NBA player using PlayerGameLog.
@@ -33,70 +120,17 @@ def get_last_n_games_playergamelog(player_id, n_games=10, timeout=30, retries=3)
         player_id (int): The unique NBA player ID.
         n_games (int): Number of recent games to retrieve. Default is 10.
         timeout (int): Time to wait for the API response in seconds. Default is 30.
-        retries (int): Number of retry attempts in case of failure. Default is 3.
+        retries (int): Number of attempts, with backoff, for retryable failures. Default is 3.
 
     Returns:
         pandas.DataFrame or None: DataFrame containing the player's last N games statistics.
     """
-    season = get_current_season()
-    print(f"Using season: {season}")
-
-    for attempt in range(retries):
-        try:
-            # Initialize the PlayerGameLog endpoint
-            gamelog = playergamelog.PlayerGameLog(
-                player_id=player_id,
-                season=season,
-                season_type_all_star='Regular Season',
-                timeout=timeout
-            )
-
-            # Retrieve the game log DataFrame
-            gamelog_df = gamelog.get_data_frames()[0]
-
-            if not gamelog_df.empty:
-                # Print the column names for verification
-                print("\nColumns in the Game Log DataFrame:")
-                print(gamelog_df.columns.tolist())
-
-                # Optionally, print the first few rows to inspect the data
-                print("\nSample Data:")
-                print(gamelog_df.head())
-
-                # Define the desired columns
-                desired_columns = [
-                    'Player_ID', 'GAME_DATE', 'MATCHUP', 'WL', 'MIN', 'FGM', 'FGA',
-                    'FG_PCT', 'FG3M', 'FG3A', 'FG3_PCT', 'FTM', 'FTA', 'FT_PCT',
-                    'OREB', 'DREB', 'REB', 'AST', 'STL', 'BLK', 'TOV', 'PF', 'PTS'
-                ]
-
-                # Check if all desired columns are present
-                missing_columns = [col for col in desired_columns if col not in gamelog_df.columns]
-                if missing_columns:
-                    print(f"\nWarning: The following desired columns are missing from the DataFrame: {missing_columns}")
-                else:
-                    # Select only the desired columns
-                    gamelog_df = gamelog_df[desired_columns]
-
-                    # Convert GAME_DATE to datetime with specified format to eliminate warning
-                    gamelog_df['GAME_DATE'] = pd.to_datetime(gamelog_df['GAME_DATE'], format='%b %d, %Y')
-
-                    # Sort the DataFrame by GAME_DATE descending and select the top n_games
-                    gamelog_df = gamelog_df.sort_values(by='GAME_DATE', ascending=False).head(n_games)
-
-                    return gamelog_df
-            else:
-                print(f"No game log data found for player ID {player_id} in season {season}.")
-                return None
-
-        except Exception as e:
-            print(f"Attempt {attempt + 1} failed with error: {e}")
-            if attempt < retries - 1:
-                print("Retrying...")
-                time.sleep(1)  # Wait before retrying
-            else:
-                print("All attempts failed.")
-                return None
+    game_log_rows = get_last_n_game_log_rows(player_id, n_games, timeout, retries)
+    if game_log_rows is None:
+        return None
+    gamelog_df = to_data_frame(game_log_rows, GameLogRow)
+    gamelog_df['GAME_DATE'] = gamelog_df['GAME_DATE'].astype('datetime64[ns]')
+    return gamelog_df
 
 def main():
     """
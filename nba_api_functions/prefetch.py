@@ -0,0 +1,142 @@
+import itertools
+import logging
+import threading
+import time
+from nba_api_functions.rate_limiter import get_rate_limiter
+
+# Pending jobs kept; the oldest of the lowest priority is dropped when another is queued
+DEFAULT_MAX_PENDING = 8
+
+# Rate limiter tokens left untouched for requests the user is waiting on
+FOREGROUND_RESERVE = 2
+
+# Priorities, lower runs first
+PLAYER_PRIORITY = 0
+ROSTER_PRIORITY = 1
+
+
+class Prefetcher:
+    """
+    Runs speculative fetches in the background, so data is local before it is asked for.
+
+    Jobs run one at a time on a single daemon thread, most important first and newest
+    first within a priority. The queue is bounded, queueing a key again replaces its
+    pending job, and pending jobs can be cancelled. A job only starts while the shared
+    rate limiter has more than FOREGROUND_RESERVE tokens, so prefetching never delays
+    a request the user is waiting on.
+    """
+
+    def __init__(self, max_pending=DEFAULT_MAX_PENDING, reserve=FOREGROUND_RESERVE, rate_limiter=None):
+        self.max_pending = max_pending
+        self.reserve = reserve
+        self.rate_limiter = rate_limiter or get_rate_limiter()
+        self.completed = 0
+        self.dropped = 0
+        self._pending = {}  # (priority, sequence, fn) by key
+        self._sequence = itertools.count()
+        self._condition = threading.Condition()
+        self._thread = None
+
+    def submit(self, key, fn, priority=0):
+        """
+        Queues a job.
+
+        Args:
+            key (hashable): Identifies the job, e.g. ("roster", team_id).
+            fn (callable): Called with no arguments on the prefetch thread.
+            priority (int): Lower runs first.
+        """
+        with self._condition:
+            self._pending[key] = (priority, next(self._sequence), fn)
+            if len(self._pending) > self.max_pending:
+                stalest = max(self._pending, key=lambda pending_key: self._sort_key(pending_key))
+                del self._pending[stalest]
+                self.dropped += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="prefetch", daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def cancel(self, key):
+        """Drops a pending job. A job that already started runs to the end."""
+        with self._condition:
+            self._pending.pop(key, None)
+
+    def clear(self):
+        """Drops every pending job."""
+        with self._condition:
+            self._pending.clear()
+
+    def pending(self):
+        """Returns the pending keys in the order they would run."""
+        with self._condition:
+            return sorted(self._pending, key=self._sort_key)
+
+    def _sort_key(self, key):
+        priority, sequence, _ = self._pending[key]
+        return priority, -sequence
+
+    def _wait_for_headroom(self):
+        while self.rate_limiter.available() < self.reserve + 1:
+            time.sleep(1 / self.rate_limiter.rate)
+
+    def _next_job(self):
+        with self._condition:
+            while not self._pending:
+                self._condition.wait()
+        # Wait before picking, so the job is the most wanted one when a token is likely free.
+        # Only a hint: the reserve itself is enforced when the job's requests take their tokens.
+        self._wait_for_headroom()
+        with self._condition:
+            if not self._pending:
+                return None
+            key = min(self._pending, key=self._sort_key)
+            return key, self._pending.pop(key)[2]
+
+    def _run(self):
+        while True:
+            job = self._next_job()
+            if job is None:
+                continue
+            key, fn = job
+            try:
+                with self.rate_limiter.leaving(self.reserve):
+                    fn()
+                self.completed += 1
+            except Exception as e:
+                logging.info(f"Prefetch of {key} failed: {e}")
+
+
+def prefetch_roster(team_id):
+    """Warms the response cache with a team's roster for the latest season."""
+    from nba_api_functions.get_team_roster import get_team_roster_rows_by_id
+    get_team_roster_rows_by_id(team_id)
+
+
+def prefetch_player_game_log(player_id):
+    """
+    Stores a player's current-season games with one small PlayerGameLogs request.
+
+    Skipped while the season's league-wide logs are being synced, which will store the
+    player's games anyway. Nothing is fetched once the player's or the league's season is stored.
+    """
+    from nba_api_functions.head_to_head import sync_player_seasons
+    from nba_api_functions.league_game_logs import is_league_sync_running
+    from nba_api_functions.player_profile import get_current_season
+    season = get_current_season()
+    if is_league_sync_running(season):
+        return
+    sync_player_seasons(player_id, [season])
+
+
+_prefetcher = None
+_prefetcher_lock = threading.Lock()
+
+
+def get_prefetcher():
+    """Returns the process-wide Prefetcher, creating it on first use."""
+    global _prefetcher
+    with _prefetcher_lock:
+        if _prefetcher is None:
+            _prefetcher = Prefetcher()
+        return _prefetcher
@@ -0,0 +1,86 @@
+import threading
+import time
+from contextlib import contextmanager
+
+
+# stats.nba.com starts rejecting clients that send more than a couple of requests per second
+DEFAULT_RATE = 2.0
+DEFAULT_CAPACITY = 4
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket rate limiter.
+
+    Tokens refill continuously at `rate` per second up to `capacity`. Each request
+    takes one token and waits when the bucket is empty. A thread inside leaving(n)
+    only takes a token while more than n are left, so background requests never use
+    the tokens kept for everyone else.
+    """
+
+    def __init__(self, rate=DEFAULT_RATE, capacity=DEFAULT_CAPACITY):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated_at) * self.rate)
+        self._updated_at = now
+
+    def available(self):
+        """Returns the number of tokens in the bucket right now, without taking any."""
+        with self._lock:
+            self._refill()
+            return self._tokens
+
+    @contextmanager
+    def leaving(self, tokens):
+        """Makes acquire calls on this thread leave `tokens` tokens in the bucket for other threads."""
+        previous = getattr(self._local, "keep", 0)
+        self._local.keep = tokens
+        try:
+            yield self
+        finally:
+            self._local.keep = previous
+
+    def acquire(self, timeout=None):
+        """
+        Blocks until a token is available.
+
+        Inside leaving(n), a token is only taken while more than n are left. The check
+        and the take happen under the same lock, so no other thread can spend the
+        kept tokens in between.
+
+        Args:
+            timeout (float, optional): Maximum number of seconds to wait. Waits forever if not provided.
+
+        Returns:
+            bool: True if a token was taken, False if the timeout ran out first.
+        """
+        needed = 1 + getattr(self._local, "keep", 0)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= needed:
+                    self._tokens -= 1
+                    return True
+                wait = (needed - self._tokens) / self.rate
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            time.sleep(wait)
+
+
+_rate_limiter = TokenBucket()
+
+
+def get_rate_limiter():
+    """Returns the rate limiter shared by every request to stats.nba.com."""
+    return _rate_limiter
@@ -0,0 +1,180 @@
+import logging
+import random
+import threading
+import time
+from urllib.parse import urlparse
+import requests
+
+# Concurrent requests allowed to stats.nba.com across the whole app
+MAX_CONCURRENT_REQUESTS = 4
+
+# Consecutive failures that open a host's circuit, and seconds before it lets a trial request through
+FAILURE_THRESHOLD = 5
+RESET_TIMEOUT = 30.0
+
+# HTTP statuses stats.nba.com returns while throttling or failing
+RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class UpstreamError(Exception):
+    """stats.nba.com answered with a throttling or server error status."""
+
+    def __init__(self, url, status_code):
+        super().__init__(f"{url} returned HTTP {status_code}")
+        self.status_code = status_code
+
+
+class CircuitOpenError(Exception):
+    """Requests to a host are failing fast because its circuit is open."""
+
+    def __init__(self, host, retry_in):
+        super().__init__(f"Circuit for {host} is open, retrying in {retry_in:.0f} s")
+        self.host = host
+        self.retry_in = retry_in
+
+
+class OfflineError(Exception):
+    """The app runs offline from a snapshot that holds no response for a request."""
+
+    def __init__(self, endpoint):
+        super().__init__(f"Offline, and the snapshot has no {endpoint} response for this request")
+        self.endpoint = endpoint
+
+
+# Failures of an endpoint call that say nothing about our own code: network errors, throttling,
+# the unparseable bodies stats.nba.com sends while overloaded and requests an offline snapshot can't answer
+FETCH_ERRORS = (requests.RequestException, UpstreamError, CircuitOpenError, OfflineError, ValueError, KeyError)
+
+
+def is_retryable(error):
+    """Returns True for failures worth retrying: timeouts, dropped connections and throttling."""
+    return isinstance(error, (requests.Timeout, requests.ConnectionError, UpstreamError))
+
+
+class RetryPolicy:
+    """
+    Exponential backoff with full jitter.
+
+    The wait before retry n is drawn uniformly from [0, min(max_delay, base_delay * 2**n)],
+    which spreads out clients that failed at the same moment.
+    """
+
+    def __init__(self, max_attempts=3, base_delay=0.5, max_delay=8.0):
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def delay(self, attempt):
+        """Returns the seconds to wait after failed attempt number `attempt` (0-based)."""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+
+class CircuitBreaker:
+    """
+    Per-host circuit breaker.
+
+    Closed: requests flow. After FAILURE_THRESHOLD consecutive failures it opens and
+    every request fails fast with CircuitOpenError. Once RESET_TIMEOUT has passed one
+    trial request is let through: success closes the circuit, failure opens it again.
+    """
+
+    def __init__(self, host, failure_threshold=FAILURE_THRESHOLD, reset_timeout=RESET_TIMEOUT):
+        self.host = host
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self.failures = 0
+        self.opened_at = None
+        self._trial_in_flight = False
+
+    def before_request(self):
+        """Raises CircuitOpenError unless a request may be sent now."""
+        with self._lock:
+            if self.opened_at is None:
+                return
+            retry_in = self.opened_at + self.reset_timeout - time.monotonic()
+            if retry_in > 0 or self._trial_in_flight:
+                raise CircuitOpenError(self.host, max(retry_in, 0))
+            # Half-open, let this one request test the host
+            self._trial_in_flight = True
+
+    def record_success(self):
+        with self._lock:
+            if self.opened_at is not None:
+                logging.info(f"Circuit for {self.host} closed")
+            self.failures = 0
+            self.opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self._trial_in_flight or (self.opened_at is None and self.failures >= self.failure_threshold):
+                logging.warning(f"Circuit for {self.host} opened after {self.failures} failures")
+                self.opened_at = time.monotonic()
+            self._trial_in_flight = False
+
+
+_breakers = {}
+_breakers_lock = threading.Lock()
+_request_slots = threading.BoundedSemaphore(MAX_CONCURRENT_REQUESTS)
+
+
+def get_circuit_breaker(url):
+    """Returns the process-wide CircuitBreaker for the host of a URL."""
+    host = urlparse(url).netloc or url
+    with _breakers_lock:
+        if host not in _breakers:
+            _breakers[host] = CircuitBreaker(host)
+        return _breakers[host]
+
+
+def call_with_retry(url, fn, policy=DEFAULT_RETRY_POLICY, on_retry=None, acquire=None):
+    """
+    Runs a request under the shared retry policy, concurrency cap and host circuit breaker.
+
+    Backoff waits happen on the calling thread, which for the app is a worker thread,
+    never the event loop. Only retryable failures count against the host's circuit.
+
+    Args:
+        url (str): A URL on the host being called, used to pick the circuit breaker.
+        fn (callable): Sends the request. Raises on failure.
+        policy (RetryPolicy): Attempts and backoff.
+        on_retry (callable, optional): Called with (attempt, error) before each retry.
+        acquire (callable, optional): Called before each attempt takes a concurrency slot,
+            e.g. to wait for a rate limiter token without holding a slot meanwhile.
+
+    Returns:
+        The result of fn.
+
+    Raises:
+        CircuitOpenError: The host's circuit is open.
+        Exception: The last error from fn once attempts run out, or the first non-retryable one.
+    """
+    breaker = get_circuit_breaker(url)
+    for attempt in range(policy.max_attempts):
+        breaker.before_request()
+        if acquire is not None:
+            acquire()
+        try:
+            with _request_slots:
+                result = fn()
+        except Exception as e:
+            if not is_retryable(e):
+                # The host answered, the problem is with this request
+                breaker.record_success()
+                raise
+            breaker.record_failure()
+            if attempt == policy.max_attempts - 1:
+                raise
+            delay = policy.delay(attempt)
+            logging.warning(f"Attempt {attempt + 1} failed ({e}), retrying in {delay:.1f} s")
+            if on_retry is not None:
+                on_retry(attempt, e)
+            time.sleep(delay)
+        else:
+            breaker.record_success()
+            return result
@@ -0,0 +1,161 @@
+import logging
+import numpy as np
+from nba_api.stats.endpoints import PlayerGameLogs
+from nba_api_functions.api_client import call_endpoint
+from nba_api_functions.game_log_store import get_game_log_store
+from nba_api_functions.league_game_logs import sync_league_game_logs
+from nba_api_functions.player_profile import get_current_season
+from nba_api_functions.resilience import FETCH_ERRORS
+from nba_api_functions.rows import FormRow
+from nba_api_functions.snapshot import get_snapshot
+
+# Recent games the form columns cover
+FORM_GAMES = 10
+
+# Free throw attempts per shooting possession, as used by true shooting % and usage rate
+FTA_WEIGHT = 0.44
+
+
+def ratio(numerator, denominator, scale=1.0):
+    """Divides element-wise, giving NaN where the denominator is zero."""
+    result = np.full(numerator.shape, np.nan)
+    np.divide(numerator * scale, denominator, out=result, where=denominator != 0)
+    return result
+
+
+def compute_roster_form(game_logs, n_games=FORM_GAMES):
+    """
+    Computes every player's recent form from a team's game logs in one batched pass.
+
+    Rows are sorted by player and date once, then every statistic is a grouped sum
+    (np.bincount) over each player's last n_games rows, so the cost does not grow
+    with one Python loop per player.
+
+    Args:
+        game_logs (dict): The PlayerGameLogs result set, with "headers" and "data".
+        n_games (int): Number of recent games per player.
+
+    Returns:
+        dict: FormRow by PLAYER_ID. Averages are per game over the last n_games, PTS_36 and
+            TS_PCT and USG_PCT cover the same games, PTS_TREND is the recent minus the season
+            scoring average, and STREAK counts the latest games in a row scored above (+)
+            or below (-) the season average.
+    """
+    data = game_logs['data']
+    if not data:
+        return {}
+    headers = game_logs['headers']
+    columns = dict(zip(headers, zip(*data)))
+
+    def numeric(name):
+        # Missing values (None, e.g. on a DNP row) become NaN, and count as zero so they don't spoil the sums
+        values = np.array(columns[name], dtype=float)
+        return np.where(np.isnan(values), 0.0, values)
+
+    player_ids = np.array(columns['PLAYER_ID'], dtype=np.int64)
+    game_dates = np.array([str(game_date)[:10] for game_date in columns['GAME_DATE']], dtype='datetime64[D]')
+
+    # Group each player's games together, newest first
+    order = np.lexsort((-game_dates.astype(np.int64), player_ids))
+    player_ids = player_ids[order]
+    unique_ids, starts, games_played = np.unique(player_ids, return_index=True, return_counts=True)
+    player_index = np.repeat(np.arange(len(unique_ids)), games_played)
+    position = np.arange(len(player_ids)) - starts[player_index]
+    recent = position < n_games
+
+    stats = {name: numeric(name)[order] for name in ('MIN', 'PTS', 'REB', 'AST', 'FGA', 'FTA', 'TOV')}
+    plays = stats['FGA'] + FTA_WEIGHT * stats['FTA'] + stats['TOV']
+
+    # Team totals of every game, for the usage rate
+    game_keys = np.column_stack((
+        np.array(columns['GAME_ID'], dtype=np.int64)[order],
+        np.array(columns['TEAM_ID'], dtype=np.int64)[order],
+    ))
+    _, game_index = np.unique(game_keys, axis=0, return_inverse=True)
+    game_index = game_index.ravel()
+    team_minutes = np.bincount(game_index, weights=stats['MIN'])[game_index]
+    team_plays = np.bincount(game_index, weights=plays)[game_index]
+
+    def recent_sum(values):
+        return np.bincount(player_index, weights=np.where(recent, values, 0.0), minlength=len(unique_ids))
+
+    recent_games = np.minimum(games_played, n_games)
+    recent_minutes = recent_sum(stats['MIN'])
+    recent_points = recent_sum(stats['PTS'])
+    averages = {name: recent_sum(stats[name]) / recent_games for name in ('MIN', 'PTS', 'REB', 'AST')}
+    season_points = np.bincount(player_index, weights=stats['PTS']) / games_played
+
+    points_per_36 = ratio(recent_points, recent_minutes, 36.0)
+    true_shooting = ratio(recent_points, 2 * (recent_sum(stats['FGA']) + FTA_WEIGHT * recent_sum(stats['FTA'])), 100.0)
+    usage = ratio(
+        recent_sum(plays) * recent_sum(team_minutes) / 5,
+        recent_minutes * recent_sum(team_plays),
+        100.0
+    )
+
+    # A streak ends at the first game on the other side of the season average from the latest one
+    above = stats['PTS'] > season_points[player_index]
+    latest_above = above[starts]
+    breaks = above != latest_above[player_index]
+    streak_length = games_played.copy()
+    np.minimum.at(streak_length, player_index[breaks], position[breaks])
+    streak = np.where(latest_above, streak_length, -streak_length)
+
+    rounded = [
+        np.round(values, 1).tolist() for values in (
+            averages['MIN'], averages['PTS'], averages['REB'], averages['AST'],
+            points_per_36, true_shooting, usage, averages['PTS'] - season_points
+        )
+    ]
+    form = {}
+    for index, player_id in enumerate(unique_ids.tolist()):
+        values = [None if np.isnan(column[index]) else column[index] for column in rounded]
+        form[player_id] = FormRow(player_id, int(recent_games[index]), *values, int(streak[index]))
+    return form
+
+
+def _stored_roster_form(store, team_id, season, n_games):
+    games = store.team_games(team_id, season)
+    if not games:
+        return {}
+    headers = list(games[0])
+    return compute_roster_form({'headers': headers, 'data': [[game[header] for header in headers] for game in games]}, n_games)
+
+
+def get_roster_form(team_id, season=None, n_games=FORM_GAMES):
+    """
+    Computes every player's form from the team's game logs.
+
+    The logs come from the local store once the season's league-wide game logs are
+    synced, otherwise from one PlayerGameLogs request for the team. When started from
+    a snapshot bundle, the league-wide logs are stored from it first.
+
+    Args:
+        team_id (int): The NBA team ID.
+        season (str, optional): Season in 'YYYY-YY' format. Defaults to the current season.
+        n_games (int): Number of recent games per player.
+
+    Returns:
+        dict: FormRow by PLAYER_ID. Empty if the fetch fails or no games were played yet.
+    """
+    season = season or get_current_season()
+    store = get_game_log_store()
+    if not store.is_league_synced(season) and get_snapshot() is not None:
+        # The bundle holds the league-wide logs, so storing them needs no request
+        sync_league_game_logs(season)
+    if store.is_league_synced(season):
+        return _stored_roster_form(store, team_id, season, n_games)
+    try:
+        game_logs = call_endpoint(
+            PlayerGameLogs,
+            team_id_nullable=team_id,
+            season_nullable=season,
+            timeout=30
+        ).player_game_logs.get_dict()
+    except FETCH_ERRORS as e:
+        logging.error(f"Could not fetch game logs for team {team_id} in {season}: {e}")
+        if store.league_sync_state(season) is not None:
+            # Stored games that are behind beat no form at all
+            return _stored_roster_form(store, team_id, season, n_games)
+        return {}
+    return compute_roster_form(game_logs, n_games)
@@ -0,0 +1,195 @@
+import logging
+from datetime import date, datetime
+from typing import NamedTuple
+
+
+class GameRow(NamedTuple):
+    """One game on the scoreboard. Field names match the get_todays_nba_games columns."""
+    GameID: str
+    GameDate: date
+    Arena: str
+    HomeTeam: str
+    VisitorTeam: str
+    GameTime: str
+    GameStatusID: int
+    Period: int
+    HomeScore: int | None
+    VisitorScore: int | None
+
+
+class RosterRow(NamedTuple):
+    """One player on a CommonTeamRoster. The TEAM_* fields are filled in for league-wide rosters."""
+    PLAYER: str
+    NUM: str
+    POSITION: str
+    HEIGHT: str
+    WEIGHT: str
+    BIRTH_DATE: str
+    AGE: float
+    EXP: str
+    SCHOOL: str
+    PLAYER_ID: int
+    TEAM_ID: int | None = None
+    TEAM_ABBREVIATION: str | None = None
+    TEAM_NAME: str | None = None
+
+
+class GameLogRow(NamedTuple):
+    """One game of a PlayerGameLog. GAME_DATE is parsed from the API's 'JAN 15, 2025' format."""
+    Player_ID: int
+    GAME_DATE: date
+    MATCHUP: str
+    WL: str
+    MIN: int
+    FGM: int
+    FGA: int
+    FG_PCT: float
+    FG3M: int
+    FG3A: int
+    FG3_PCT: float
+    FTM: int
+    FTA: int
+    FT_PCT: float
+    OREB: int
+    DREB: int
+    REB: int
+    AST: int
+    STL: int
+    BLK: int
+    TOV: int
+    PF: int
+    PTS: int
+
+
+class HeadToHeadRow(NamedTuple):
+    """One stored PlayerGameLogs game against a given opponent. GAME_DATE is 'YYYY-MM-DD'."""
+    GAME_DATE: str
+    MATCHUP: str
+    WL: str
+    MIN: float
+    PTS: int
+    REB: int
+    AST: int
+    STL: int
+    BLK: int
+    TOV: int
+    FGM: int
+    FGA: int
+    FG3M: int
+    FG3A: int
+    FTM: int
+    FTA: int
+    PLUS_MINUS: int
+    GAME_ID: str
+
+
+class FormRow(NamedTuple):
+    """A player's recent form over their last N games, computed by roster_form for a whole roster."""
+    PLAYER_ID: int
+    GP: int
+    MIN: float
+    PTS: float
+    REB: float
+    AST: float
+    PTS_36: float
+    TS_PCT: float
+    USG_PCT: float
+    PTS_TREND: float
+    STREAK: int
+
+
+class MatchupRow(NamedTuple):
+    """A rostered player's recent games against tonight's opponent, computed by matchup for both rosters."""
+    PLAYER_ID: int
+    PLAYER: str
+    GP: int
+    MIN: float | None
+    PTS: float | None
+    REB: float | None
+    AST: float | None
+    FG_PCT: float | None
+    FG3M: float | None
+    PLUS_MINUS: float | None
+    LAST_GAME: str | None
+
+
+class BoxScoreRow(NamedTuple):
+    """One player, or a team's totals (PLAYER_ID None), of a game's traditional and advanced box scores."""
+    PLAYER_ID: int | None
+    TEAM_ID: int
+    PLAYER: str
+    POS: str
+    MIN: str
+    PTS: int | None
+    REB: int | None
+    AST: int | None
+    STL: int | None
+    BLK: int | None
+    TOV: int | None
+    FGM: int | None
+    FGA: int | None
+    FG3M: int | None
+    FG3A: int | None
+    FTM: int | None
+    FTA: int | None
+    PLUS_MINUS: float | None
+    OFF_RTG: float | None
+    DEF_RTG: float | None
+    TS_PCT: float | None
+    USG_PCT: float | None
+    PIE: float | None
+
+
+def rows_from_data_set(data_set, row_type):
+    """
+    Builds typed rows straight from an nba_api result set, without a DataFrame.
+
+    Fields of row_type that the result set lacks are left at their default, or None.
+
+    Args:
+        data_set: An endpoint data set, e.g. `CommonTeamRoster(...).common_team_roster`.
+        row_type (type): A NamedTuple class whose field names are result set headers.
+
+    Returns:
+        list: One row_type per row of the result set.
+    """
+    result_set = data_set.get_dict()
+    positions = {header: index for index, header in enumerate(result_set['headers'])}
+    missing = [field for field in row_type._fields if field not in positions]
+    if missing and result_set['data']:
+        logging.warning(f"Missing columns in {row_type.__name__} data: {missing}")
+    indexes = [positions.get(field) for field in row_type._fields]
+    if not missing:
+        return [row_type._make([values[index] for index in indexes]) for values in result_set['data']]
+    defaults = [row_type._field_defaults.get(field) for field in row_type._fields]
+    return [
+        row_type._make([values[index] if index is not None else default for index, default in zip(indexes, defaults)])
+        for values in result_set['data']
+    ]
+
+
+def parse_game_log_date(game_date):
+    """Parses a game log date such as 'JAN 15, 2025' or '2025-01-15T00:00:00'."""
+    if isinstance(game_date, date):
+        return game_date
+    try:
+        return datetime.strptime(game_date, '%b %d, %Y').date()
+    except (TypeError, ValueError):
+        return datetime.fromisoformat(str(game_date)[:10]).date()
+
+
+def to_data_frame(rows, row_type):
+    """
+    Converts typed rows to a pandas DataFrame for analytics.
+
+    pandas is imported here so the rest of the row model does not depend on it.
+
+    Args:
+        rows (list): Rows of row_type.
+        row_type (type): The NamedTuple class of the rows, which gives the columns.
+
+    Returns:
+        pd.DataFrame: One column per field of row_type.
+    """
+    import pandas as pd
+    return pd.DataFrame.from_records(rows, columns=row_type._fields)
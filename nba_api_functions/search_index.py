@@ -0,0 +1,215 @@
+import bisect
+import functools
+import re
+import threading
+import unicodedata
+from collections import Counter
+from typing import NamedTuple
+
+
+PLAYER = "player"
+TEAM = "team"
+
+# Trigram candidates kept for scoring when there is no prefix match
+MAX_FUZZY_CANDIDATES = 200
+
+# Fuzzy fallbacks in find_team and find_player must score at least this to count as a match
+FUZZY_MATCH_MIN_SCORE = 30
+
+
+def normalize(text):
+    """
+    Normalizes a name for matching: accents removed, lowercase, punctuation dropped.
+
+    Args:
+        text (str): A player or team name (e.g., "Nikola Jokić" or "De'Aaron Fox").
+
+    Returns:
+        str: The normalized name (e.g., "nikola jokic" or "deaaron fox").
+    """
+    decomposed = unicodedata.normalize("NFKD", str(text))
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    stripped = re.sub(r"[^\w\s]", "", stripped.lower())
+    return " ".join(stripped.split())
+
+
+def trigrams(text):
+    """Returns the set of character trigrams of a normalized string, padded at the ends."""
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class SearchResult(NamedTuple):
+    kind: str
+    entry: dict
+    score: float
+
+    @property
+    def id(self):
+        return self.entry["id"]
+
+    @property
+    def name(self):
+        return self.entry["full_name"]
+
+
+class SearchIndex:
+    """
+    In-memory index over the static nba_api player and team lists.
+
+    Supports O(1) lookup by ID, team abbreviation and full name, prefix matching on
+    name words through a sorted token list, and accent-insensitive fuzzy ranking
+    through a trigram index.
+    """
+
+    def __init__(self, player_list, team_list):
+        self.players_by_id = {player["id"]: player for player in player_list}
+        self.teams_by_id = {team["id"]: team for team in team_list}
+        self.teams_by_abbreviation = {team["abbreviation"].lower(): team for team in team_list}
+        self.teams_by_full_name = {normalize(team["full_name"]): team for team in team_list}
+        self.players_by_full_name = {}
+
+        self._entries = []
+        self._tokens = []
+        self._trigrams = {}
+
+        for team in team_list:
+            words = [team["full_name"], team["abbreviation"], team["nickname"], team["city"]]
+            self._add_entry(TEAM, team, words)
+        for player in player_list:
+            self.players_by_full_name.setdefault(normalize(player["full_name"]), []).append(player)
+            self._add_entry(PLAYER, player, [player["full_name"]])
+
+        self._tokens.sort()
+
+    def _add_entry(self, kind, entry, words):
+        index = len(self._entries)
+        name = normalize(entry["full_name"])
+        self._entries.append((kind, entry, name))
+        tokens = {token for word in words for token in normalize(word).split()}
+        for token in tokens:
+            self._tokens.append((token, index))
+        for gram in trigrams(name):
+            self._trigrams.setdefault(gram, []).append(index)
+
+    def _prefix_matches(self, prefix):
+        start = bisect.bisect_left(self._tokens, (prefix,))
+        matches = set()
+        for token, index in self._tokens[start:]:
+            if not token.startswith(prefix):
+                break
+            matches.add(index)
+        return matches
+
+    def _score(self, index, query, query_grams):
+        kind, entry, name = self._entries[index]
+        if name == query or (kind == TEAM and entry["abbreviation"].lower() == query):
+            score = 100
+        elif name.startswith(query):
+            score = 90
+        elif all(any(token.startswith(part) for token in name.split()) for part in query.split()):
+            score = 80
+        elif query in name:
+            score = 70
+        else:
+            name_grams = trigrams(name)
+            score = 60 * len(query_grams & name_grams) / len(query_grams | name_grams)
+        if kind == PLAYER and entry.get("is_active"):
+            # Prefer current players over historical ones with similar names
+            score += 5
+        return score
+
+    def search(self, query, kind=None, limit=10, min_score=0):
+        """
+        Ranks players and teams against a free-text query.
+
+        Args:
+            query (str): Any part of a name, a team abbreviation, or a misspelled name.
+            kind (str, optional): Restrict results to PLAYER or TEAM.
+            limit (int): Maximum number of results. Default is 10.
+            min_score (float): Drop results scoring below this (0-105). Default is 0.
+
+        Returns:
+            list[SearchResult]: Results ordered from best to worst match.
+        """
+        query = normalize(query)
+        if not query:
+            return []
+
+        parts = query.split()
+        candidates = self._prefix_matches(parts[0])
+        for part in parts[1:]:
+            candidates &= self._prefix_matches(part)
+
+        query_grams = trigrams(query)
+        if len(candidates) < limit and len(query) >= 3:
+            overlap = Counter(
+                index for gram in query_grams for index in self._trigrams.get(gram, ())
+            )
+            candidates |= {index for index, _ in overlap.most_common(MAX_FUZZY_CANDIDATES)}
+
+        results = []
+        for index in candidates:
+            entry_kind, entry, name = self._entries[index]
+            if kind is not None and entry_kind != kind:
+                continue
+            score = self._score(index, query, query_grams)
+            if score >= min_score:
+                results.append(SearchResult(entry_kind, entry, score))
+
+        results.sort(key=lambda result: (-result.score, len(result.entry["full_name"])))
+        return results[:limit]
+
+    def find_team(self, team):
+        """
+        Finds a team by ID, abbreviation or full name, falling back to the best fuzzy match.
+
+        Args:
+            team (str or int): The team ID, abbreviation or name (e.g., "LAL" or "Los Angeles Lakers").
+
+        Returns:
+            dict or None: The nba_api team dictionary, or None if nothing matches.
+        """
+        if isinstance(team, int) or str(team).isdigit():
+            return self.teams_by_id.get(int(team))
+        key = normalize(team)
+        match = self.teams_by_abbreviation.get(key) or self.teams_by_full_name.get(key)
+        if match is not None:
+            return match
+        results = self.search(team, kind=TEAM, limit=1, min_score=FUZZY_MATCH_MIN_SCORE)
+        return results[0].entry if results else None
+
+    def find_player(self, player):
+        """
+        Finds a player by ID or full name, falling back to the best fuzzy match.
+
+        Args:
+            player (str or int): The player ID or name (e.g., 2544 or "LeBron James").
+
+        Returns:
+            dict or None: The nba_api player dictionary, or None if nothing matches.
+        """
+        if isinstance(player, int) or str(player).isdigit():
+            return self.players_by_id.get(int(player))
+        exact = self.players_by_full_name.get(normalize(player))
+        if exact:
+            # Several players can share a name, prefer the active one
+            return next((match for match in exact if match.get("is_active")), exact[0])
+        results = self.search(player, kind=PLAYER, limit=1, min_score=FUZZY_MATCH_MIN_SCORE)
+        return results[0].entry if results else None
+
+
+_index_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_search_index():
+    # The static player table is large, load it only when the index is first needed
+    from nba_api.stats.static import players, teams
+    return SearchIndex(players.get_players(), teams.get_teams())
+
+
+def get_search_index():
+    """Returns the process-wide SearchIndex, building it on first use."""
+    with _index_lock:
+        return _build_search_index()
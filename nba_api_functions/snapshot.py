@@ -0,0 +1,252 @@
+import hashlib
+import json
+import logging
+import threading
+import time
+import zipfile
+from datetime import date, datetime, timedelta
+from nba_api_functions.api_cache import CachedResponse
+from nba_api_functions.search_index import get_search_index
+
+# The endpoints are imported where they are first used, so main.py can add the
+# snapshot arguments without slowing down the app's startup
+
+SNAPSHOT_FORMAT = 1
+MANIFEST_MEMBER = "manifest.json"
+INDEX_MEMBER = "index.json"
+
+# Requests are spaced by the shared rate limiter, so a few workers are enough to keep it busy
+DEFAULT_MAX_WORKERS = 4
+
+SCOREBOARD_ENDPOINT = "scoreboardv2"
+
+
+class SnapshotWriter:
+    """
+    Writes endpoint responses into a snapshot bundle as they are loaded.
+
+    A bundle is a zip file with one compressed member per response, an index of
+    members by cache key and a manifest describing what was captured.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.responses_written = 0
+        self._zip = zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED)
+        self._index = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint, cache_key, response, url):
+        """Adds a response to the bundle, once per cache key. Called from any thread."""
+        with self._lock:
+            if cache_key in self._index:
+                return
+            member = f"responses/{endpoint}/{hashlib.sha1(cache_key.encode('utf-8')).hexdigest()}.json"
+            self._zip.writestr(member, response)
+            self._index[cache_key] = {"member": member, "endpoint": endpoint, "url": url}
+            self.responses_written += 1
+
+    def close(self, manifest):
+        """Writes the index and manifest and closes the bundle."""
+        with self._lock:
+            self._zip.writestr(INDEX_MEMBER, json.dumps(self._index))
+            self._zip.writestr(MANIFEST_MEMBER, json.dumps({"format": SNAPSHOT_FORMAT, **manifest}, indent=2))
+            self._zip.close()
+
+
+class Snapshot:
+    """
+    A read-only snapshot bundle.
+
+    Opening it reads only the zip directory, the manifest and the index. Each response
+    is decompressed when it is first asked for and not kept, so a bundle holding
+    whole seasons of game logs costs nothing until a view needs them.
+
+    An offline snapshot stands in for the network entirely: call_endpoint never
+    sends a request while one is open.
+    """
+
+    def __init__(self, path, offline=False):
+        self.path = path
+        self.offline = offline
+        try:
+            self._zip = zipfile.ZipFile(path)
+        except zipfile.BadZipFile as e:
+            raise ValueError(f"{path} is not a snapshot bundle: {e}") from e
+        try:
+            self.manifest = json.loads(self._zip.read(MANIFEST_MEMBER))
+            if self.manifest.get("format") != SNAPSHOT_FORMAT:
+                raise ValueError(f"{path} is not a snapshot this version can read.")
+            self._index = json.loads(self._zip.read(INDEX_MEMBER))
+        except KeyError as e:
+            self._zip.close()
+            raise ValueError(f"{path} is not a snapshot bundle: {e}") from e
+        except ValueError:
+            self._zip.close()
+            raise
+
+    def __len__(self):
+        return len(self._index)
+
+    def get(self, cache_key):
+        """
+        Looks up a response.
+
+        Args:
+            cache_key (str): Key built with make_cache_key.
+
+        Returns:
+            CachedResponse or None: The stored response, or None if the snapshot doesn't have it.
+        """
+        entry = self._index.get(cache_key)
+        if entry is None:
+            return None
+        response = self._zip.read(entry["member"]).decode("utf-8")
+        return CachedResponse(response, entry["url"], self.manifest["created_at"], None)
+
+    def latest_scoreboard_date(self, before=None):
+        """
+        Returns the latest date the snapshot holds a scoreboard for.
+
+        Args:
+            before (date, optional): Only consider earlier dates, if any are held.
+
+        Returns:
+            date or None: The date, or None if the snapshot holds no scoreboard.
+        """
+        # Cache keys are "<endpoint>?<JSON parameters>", see make_cache_key
+        dates = [
+            datetime.strptime(json.loads(cache_key.split("?", 1)[1])["GameDate"], "%m/%d/%Y").date()
+            for cache_key, entry in self._index.items() if entry["endpoint"] == SCOREBOARD_ENDPOINT
+        ]
+        if before is not None and any(game_date < before for game_date in dates):
+            dates = [game_date for game_date in dates if game_date < before]
+        return max(dates, default=None)
+
+
+_snapshot = None
+
+
+def open_snapshot(path, offline=False):
+    """
+    Serves endpoint responses from a snapshot bundle for the rest of the process.
+
+    call_endpoint answers cache misses from the snapshot before going to the network.
+    With offline set it never goes to the network: a request neither the cache nor
+    the snapshot can answer fails with OfflineError.
+
+    Returns:
+        Snapshot: The opened bundle.
+
+    Raises:
+        OSError: The file can't be read.
+        ValueError: The file is not a snapshot bundle.
+    """
+    global _snapshot
+    _snapshot = Snapshot(path, offline)
+    logging.info(f"Opened snapshot {path} from {time.ctime(_snapshot.manifest['created_at'])} "
+                 f"with {len(_snapshot)} responses{', offline' if offline else ''}.")
+    return _snapshot
+
+
+def get_snapshot():
+    """Returns the snapshot opened with open_snapshot, or None."""
+    return _snapshot
+
+
+def is_offline():
+    """Returns True if the app runs from an offline snapshot and must not use the network."""
+    return _snapshot is not None and _snapshot.offline
+
+
+def create_snapshot(path, seasons=None, start=None, end=None, max_workers=DEFAULT_MAX_WORKERS):
+    """
+    Captures what the app shows into a snapshot bundle.
+
+    Every team's roster and the league-wide game logs of each season are fetched,
+    along with the scoreboard of each date, through call_endpoint, so the bundle
+    holds exactly the responses the app asks for. Teams and players themselves
+    ship with nba_api and need no capture.
+
+    Args:
+        path (str): The bundle file to write.
+        seasons (list[str], optional): Seasons for rosters and game logs. Defaults to the current season.
+        start (date, optional): First scoreboard date. Defaults to yesterday.
+        end (date, optional): Last scoreboard date, included. Defaults to today.
+        max_workers (int): Maximum number of requests at the same time.
+
+    Returns:
+        int: Number of responses written.
+    """
+    from nba_api_functions.api_client import add_response_listener, remove_response_listener
+    from nba_api_functions.export import stream_results
+    from nba_api_functions.get_games import date_range, get_game_rows_for_date
+    from nba_api_functions.get_team_roster import get_team_roster_rows_by_id, resolve_season
+    from nba_api_functions.league_game_logs import fetch_league_game_logs
+
+    seasons = seasons or [resolve_season()]
+    start = start or date.today() - timedelta(days=1)
+    end = end or max(start, date.today())
+    teams = get_search_index().teams_by_id
+
+    def fetch(item):
+        kind, key, season = item
+        if kind == "roster":
+            return get_team_roster_rows_by_id(key, season, teams[key]['full_name'])
+        if kind == "scoreboard":
+            return get_game_rows_for_date(key)
+        return fetch_league_game_logs(season)
+
+    items = [
+        *(("game_logs", None, season) for season in seasons),
+        *(("roster", team_id, season) for season in seasons for team_id in teams),
+        *(("scoreboard", game_date, None) for game_date in date_range(start, end)),
+    ]
+    writer = SnapshotWriter(path)
+    add_response_listener(writer.record)
+    try:
+        for item, _ in stream_results(fetch, items, max_workers):
+            logging.info(f"Captured {item[0]} {item[1] or item[2]}.")
+    finally:
+        remove_response_listener(writer.record)
+        writer.close({
+            "created_at": time.time(),
+            "seasons": seasons,
+            "start": start.isoformat(),
+            "end": end.isoformat(),
+        })
+    return writer.responses_written
+
+
+def add_snapshot_arguments(parser):
+    """Adds the `snapshot` command's arguments to an argparse parser."""
+    parser.add_argument("output", help="Bundle file to write (e.g. nba_snapshot.zip)")
+    parser.add_argument("--season", action="append", dest="seasons", metavar="SEASON",
+                        help="Season such as 2024-25, or a range such as 2021-22:2024-25. Repeatable")
+    parser.add_argument("--start", type=date.fromisoformat, metavar="YYYY-MM-DD",
+                        help="First scoreboard date (default: yesterday)")
+    parser.add_argument("--end", type=date.fromisoformat, metavar="YYYY-MM-DD",
+                        help="Last scoreboard date (default: today)")
+    parser.add_argument("--workers", type=int, default=DEFAULT_MAX_WORKERS,
+                        help=f"Concurrent requests (default: {DEFAULT_MAX_WORKERS})")
+
+
+def run_snapshot(args):
+    """
+    Runs the `snapshot` command.
+
+    Returns:
+        int: The process exit code.
+    """
+    from nba_api_functions.export import expand_seasons
+    try:
+        seasons = expand_seasons(args.seasons or [])
+    except ValueError as e:
+        logging.error(e)
+        return 2
+    if args.start and args.end and args.end < args.start:
+        logging.error("The end date is before the start date.")
+        return 2
+    written = create_snapshot(args.output, seasons, args.start, args.end, args.workers)
+    logging.info(f"Wrote {written} responses to {args.output}.")
+    return 0
@@ -1,4 +1,5 @@
 import sqlite3
+from generate_urls import DB_NAME, get_repository
 
 def read_database():
     """
@@ -12,7 +13,9 @@ def read_database():
         "urls": []
     }
     try:
-        conn = sqlite3.connect("url_generator.db")
+        # Opening the repository creates the working copy from the seed on first use
+        get_repository()
+        conn = sqlite3.connect(DB_NAME)
         cursor = conn.cursor()
 
         # Read from the 'state' table